@@ -0,0 +1,159 @@
+"""Decode throughput of large `query_transactions` pages.
+
+Compares the pydantic path used by `Client` (`json.loads` + `model_validate`)
+with lazy views that validate only the fields read (`lazy_results=True`) and
+the msgspec path used by `StructClient` (one-pass typed decode from bytes).
+
+    python -m benchmarks.decode_throughput --items 1000 --logs 8 --internal 2
+"""
+
+import argparse
+import json
+import time
+from collections.abc import Callable
+from typing import Any
+
+
+def _hex(seed: int, width: int) -> str:
+    return "0x" + format(seed * 2654435761 % (1 << (width * 4)), f"0{width}x")
+
+
+def make_page(items: int, logs: int, internal: int) -> dict[str, Any]:
+    rows = []
+    for i in range(items):
+        block = 1_000_000 + i // 20
+        tx_hash = _hex(i, 64)
+        rows.append(
+            {
+                "blockNumber": str(block),
+                "txIndex": str(i % 20),
+                "hash": tx_hash,
+                "fromAddress": _hex(i % 50, 40),
+                "toAddress": _hex(i % 70 + 1, 40),
+                "valueWei": str(10**18 + i),
+                "gas": "21000",
+                "gasPrice": "1000000000",
+                "gasUsed": "21000",
+                "nonce": str(i),
+                "txType": "2",
+                "maxFeePerGas": "2000000000",
+                "maxPriorityFeePerGas": "1000000000",
+                "input": _hex(i, 136),
+                "success": True,
+                "logsCount": str(logs),
+                "createdAt": "2024-01-01T00:00:00Z",
+                "logs": [
+                    {
+                        "blockNumber": str(block),
+                        "txIndex": str(i % 20),
+                        "logIndex": str(j),
+                        "txHash": tx_hash,
+                        "blockHash": _hex(block, 64),
+                        "address": _hex(j % 5, 40),
+                        "topics": [_hex(j, 64), _hex(i % 50, 64), _hex(i % 70, 64)],
+                        "data": _hex(i + j, 64),
+                        "removed": False,
+                        "createdAt": "2024-01-01T00:00:00Z",
+                    }
+                    for j in range(logs)
+                ],
+                "internalTransactions": [
+                    {
+                        "blockNumber": str(block),
+                        "txHash": tx_hash,
+                        "traceIndex": str(k),
+                        "traceAddress": f"[{k}]",
+                        "fromAddress": _hex(i % 70 + 1, 40),
+                        "toAddress": _hex(k + 3, 40),
+                        "valueWei": "0",
+                        "callType": "call",
+                        "gas": "50000",
+                        "gasUsed": "21000",
+                        "input": _hex(k, 72),
+                        "output": "0x",
+                        "error": None,
+                        "success": True,
+                        "createdAt": "2024-01-01T00:00:00Z",
+                    }
+                    for k in range(internal)
+                ],
+            }
+        )
+    return {
+        "data": {
+            "transactions": {
+                "items": rows,
+                "pageInfo": {
+                    "hasNextPage": True,
+                    "hasPreviousPage": False,
+                    "totalCount": items * 10,
+                    "currentPage": 1,
+                    "totalPages": 10,
+                },
+            }
+        }
+    }
+
+
+def bench(fn: Callable[[], Any], repeat: int) -> float:
+    fn()
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def decoders(body: bytes) -> dict[str, Callable[[], Any]]:
+    from gql_client.lazy import lazy_view
+    from gql_client.query_transactions import QueryTransactions
+
+    def lazy_sparse() -> Any:
+        page = lazy_view(QueryTransactions, json.loads(body)["data"])
+        return [
+            (item.hash, item.block_number, item.success)
+            for item in page.transactions.items
+        ]
+
+    cases: dict[str, Callable[[], Any]] = {
+        "pydantic json.loads + model_validate": lambda: (
+            QueryTransactions.model_validate(json.loads(body)["data"])
+        ),
+        "lazy_view, 3 fields read per item": lazy_sparse,
+    }
+    try:
+        from gql_client.struct_base_client import GraphQLResponse
+        from gql_client.structs import QueryTransactions as QueryTransactionsStruct
+    except ImportError:
+        print("msgspec is not installed; skipping the StructClient path")
+        return cases
+
+    import msgspec
+
+    decoder = msgspec.json.Decoder(GraphQLResponse[QueryTransactionsStruct])
+    cases["msgspec Decoder(GraphQLResponse[...])"] = lambda: decoder.decode(body)
+    return cases
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--items", type=int, default=1000)
+    ap.add_argument("--logs", type=int, default=8)
+    ap.add_argument("--internal", type=int, default=2)
+    ap.add_argument("--repeat", type=int, default=10)
+    args = ap.parse_args()
+
+    body = json.dumps(make_page(args.items, args.logs, args.internal)).encode()
+    mb = len(body) / 1_000_000
+    print(f"page: {args.items} items, {args.logs} logs/item, {mb:.1f} MB")
+    for name, fn in decoders(body).items():
+        seconds = bench(fn, args.repeat)
+        print(
+            f"{seconds * 1000:9.1f} ms  {args.items / seconds:12,.0f} items/s  "
+            f"{mb / seconds:8.1f} MB/s  {name}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Import-time benchmark for `gql_client`.
+
+Runs each statement in a fresh interpreter with `-X importtime` and reports the
+cumulative import time it adds on top of bare interpreter startup. Pass
+`--max-ms` to exit non-zero when any statement exceeds the budget.
+
+    python -m benchmarks.import_time --repeat 5
+"""
+
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+DEFAULT_STATEMENTS = [
+    "import gql_client",
+    "from gql_client import Client",
+    "from gql_client import SyncClient",
+    "from gql_client import Client, QueryTransactions",
+]
+
+
+def _importtime(statement: str) -> list[tuple[int, str]]:
+    proc = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rows: list[tuple[int, str]] = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        rows.append((int(cumulative), name[1:]))
+    return rows
+
+
+def measure(statement: str, baseline: set[str]) -> float:
+    # Only top-level rows (no extra indentation) that bare startup does not
+    # import; nested rows are already included in their parent's cumulative.
+    rows = _importtime(statement)
+    total_us = sum(
+        cumulative
+        for cumulative, name in rows
+        if not name.startswith(" ") and name not in baseline
+    )
+    return total_us / 1000
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("statements", nargs="*", default=DEFAULT_STATEMENTS)
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--max-ms", type=float, default=None)
+    args = ap.parse_args()
+
+    baseline = {name.strip() for _, name in _importtime("pass")}
+    failed = False
+    for statement in args.statements:
+        best = min(measure(statement, baseline) for _ in range(args.repeat))
+        over = args.max_ms is not None and best > args.max_ms
+        failed = failed or over
+        flag = "  OVER BUDGET" if over else ""
+        print(f"{best:9.1f} ms  {statement}{flag}")
+    if failed:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Event-loop latency while large `query_transactions` pages are decoded.
+
+A ticker sleeps 1 ms in a loop and records how late it wakes up, standing in
+for small requests served next to the big ones. Pages are decoded with
+`Client.get_model` inline, in a thread pool and in a process pool.
+
+    python -m benchmarks.loop_latency --items 1000 --pages 20
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import TYPE_CHECKING, Optional
+
+import httpx
+from benchmarks.decode_throughput import make_page
+
+if TYPE_CHECKING:
+    from gql_client import OffloadDecoder
+
+TICK = 0.001
+
+
+async def ticker(stop: asyncio.Event, lags: list[float]) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(TICK)
+        lags.append(time.perf_counter() - start - TICK)
+
+
+async def run(
+    body: bytes, pages: int, offload: Optional["OffloadDecoder"]
+) -> list[float]:
+    from gql_client import Client
+    from gql_client.query_transactions import QueryTransactions
+
+    client = Client(url="http://bench/graphql", offload=offload)
+    request = httpx.Request("POST", client.url)
+    # Builds the model schema and starts the pool outside the measurement.
+    first = httpx.Response(200, content=body, request=request)
+    await client.get_model(first, QueryTransactions)
+
+    stop = asyncio.Event()
+    lags: list[float] = []
+    task = asyncio.create_task(ticker(stop, lags))
+    for _ in range(pages):
+        # Stands in for the wait on the network between pages.
+        await asyncio.sleep(TICK)
+        response = httpx.Response(200, content=body, request=request)
+        await client.get_model(response, QueryTransactions)
+    stop.set()
+    await task
+    await client.http_client.aclose()
+    return lags
+
+
+def main() -> None:
+    from gql_client import OffloadDecoder
+
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--items", type=int, default=1000)
+    ap.add_argument("--logs", type=int, default=8)
+    ap.add_argument("--internal", type=int, default=2)
+    ap.add_argument("--pages", type=int, default=20)
+    ap.add_argument("--workers", type=int, default=2)
+    args = ap.parse_args()
+
+    body = json.dumps(make_page(args.items, args.logs, args.internal)).encode()
+    mb = len(body) / 1_000_000
+    print(f"page: {args.items} items, {mb:.1f} MB, {args.pages} pages")
+    cases = {
+        "inline": None,
+        "thread pool": OffloadDecoder(threshold=0, workers=args.workers),
+        "process pool": OffloadDecoder(
+            threshold=0, workers=args.workers, processes=True
+        ),
+    }
+    for name, offload in cases.items():
+        lags = asyncio.run(run(body, args.pages, offload))
+        lags.sort()
+        p99 = lags[int(len(lags) * 0.99)] if lags else 0.0
+        print(
+            f"{name:>13}: {len(lags):6d} ticks"
+            f"  median {statistics.median(lags) * 1000:6.2f} ms"
+            f"  p99 {p99 * 1000:6.2f} ms  max {lags[-1] * 1000:7.2f} ms"
+        )
+        if offload is not None:
+            stats = offload.stats
+            print(
+                f"{'':>15}worker {stats.worker_seconds:.2f} s,"
+                f" waited {stats.wait_seconds:.2f} s"
+            )
+            offload.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Memory held per `query_transactions` item, by representation.
+
+Each representation is decoded from the same response body and kept alive
+while `tracemalloc` measures what it retains; intermediate objects freed on
+the way are not counted. Pages with many logs repeat addresses, hashes and
+topics the most, which is where interning pays off.
+
+    python -m benchmarks.memory_footprint --items 1000 --logs 8 --internal 2
+"""
+
+import argparse
+import gc
+import json
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from benchmarks.decode_throughput import make_page
+
+
+def retained(build: Callable[[], Any]) -> tuple[int, Any]:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        value = build()
+        gc.collect()
+        return tracemalloc.get_traced_memory()[0] - before, value
+    finally:
+        tracemalloc.stop()
+
+
+def representations(body: bytes) -> dict[str, Callable[[], Any]]:
+    from gql_client.compact import compact_transactions
+    from gql_client.query_transactions import QueryTransactions
+
+    def rows() -> list[dict[str, Any]]:
+        return json.loads(body)["data"]["transactions"]["items"]
+
+    cases: dict[str, Callable[[], Any]] = {
+        "decoded JSON (dicts)": rows,
+        "pydantic models": lambda: (
+            QueryTransactions.model_validate(json.loads(body)["data"]).transactions
+        ),
+        "compact records": lambda: compact_transactions(rows()),
+    }
+    try:
+        import msgspec
+        from gql_client.struct_base_client import GraphQLResponse
+        from gql_client.structs import QueryTransactions as QueryTransactionsStruct
+    except ImportError:
+        print("msgspec is not installed; skipping the StructClient path")
+        return cases
+
+    decoder = msgspec.json.Decoder(GraphQLResponse[QueryTransactionsStruct])
+    cases["msgspec structs"] = lambda: decoder.decode(body).data
+    return cases
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--items", type=int, default=1000)
+    ap.add_argument("--logs", type=int, default=8)
+    ap.add_argument("--internal", type=int, default=2)
+    args = ap.parse_args()
+
+    body = json.dumps(make_page(args.items, args.logs, args.internal)).encode()
+    print(
+        f"page: {args.items} items, {args.logs} logs/item,"
+        f" {args.internal} internal/item, {len(body) / 1_000_000:.1f} MB JSON"
+    )
+    for name, build in representations(body).items():
+        size, value = retained(build)
+        print(f"{size / args.items:10,.0f} B/item  {size / 1_000_000:7.1f} MB  {name}")
+        del value
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Per-request cost of building a `query_transactions` request body.
+
+Compares the generic path of `AsyncBaseClient.execute` (`_process_variables`,
+then `json.dumps` of the whole document) with the `PreparedOperation` path
+used by generated methods (pre-encoded prefix plus one-pass variables).
+
+    python -m benchmarks.request_encoding --number 20000
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from pydantic_core import to_jsonable_python
+
+
+def bench(fn: Callable[[], Any], number: int, repeat: int) -> float:
+    fn()
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def allocated(fn: Callable[[], Any], number: int) -> int:
+    """Highest peak of traced memory during a single call, in bytes."""
+    fn()
+    worst = 0
+    tracemalloc.start()
+    try:
+        for _ in range(number):
+            tracemalloc.reset_peak()
+            base, _ = tracemalloc.get_traced_memory()
+            fn()
+            worst = max(worst, tracemalloc.get_traced_memory()[1] - base)
+    finally:
+        tracemalloc.stop()
+    return worst
+
+
+def encoders() -> dict[str, Callable[[], Any]]:
+    from gql_client import Client, client
+    from gql_client.input_types import (
+        IntFilter,
+        PaginationInput,
+        StringFilter,
+        TransactionFilterInput,
+        TransactionQueryInput,
+    )
+
+    prepared = client._QUERY_TRANSACTIONS
+    base = Client(url="http://localhost")
+    variables = {
+        "input": TransactionQueryInput(
+            filters=TransactionFilterInput(
+                block_number=IntFilter(gte=19_000_000),
+                from_address=StringFilter(in_=["0x" + "a" * 40, "0x" + "b" * 40]),
+            ),
+            pagination=PaginationInput(limit=100, offset=0),
+        )
+    }
+
+    def generic() -> bytes:
+        processed, _, _ = base._process_variables(variables)
+        return json.dumps(
+            {
+                "query": prepared.query,
+                "operationName": prepared.operation_name,
+                "variables": processed,
+            },
+            default=to_jsonable_python,
+        ).encode()
+
+    cases: dict[str, Callable[[], Any]] = {
+        "generic _process_variables + json.dumps": generic,
+        "PreparedOperation.body": lambda: prepared.body(variables),
+    }
+    if json.loads(generic()) != json.loads(prepared.body(variables) or b"null"):
+        raise SystemExit("request bodies differ")
+    return cases
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--number", type=int, default=20000)
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    for name, fn in encoders().items():
+        seconds = bench(fn, args.number, args.repeat)
+        peak = allocated(fn, min(args.number, 1000))
+        print(f"{seconds * 1e6:8.2f} us  {peak / 1024:8.1f} KiB peak  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,618 @@
+"""ariadne-codegen plugins used to build `gql_client`.
+
+Enabled from `[tool.ariadne-codegen]` in `pyproject.toml`; run codegen with
+`python -m ariadne_codegen` so this module is importable.
+"""
+
+import ast
+from dataclasses import dataclass
+
+from ariadne_codegen.plugins.base import Plugin
+from ariadne_codegen.utils import str_to_pascal_case, str_to_snake_case
+from graphql import (
+    ExecutableDefinitionNode,
+    FieldNode,
+    GraphQLInputObjectType,
+    GraphQLObjectType,
+    OperationDefinitionNode,
+    OperationType,
+    VariableNode,
+    get_named_type,
+    is_input_object_type,
+    is_list_type,
+    is_non_null_type,
+    is_object_type,
+)
+from graphql.utilities import strip_ignored_characters
+
+GENERATED_COMMENT = "# Generated by ariadne-codegen"
+
+# Public names living in modules that are maintained in-tree (not produced by
+# codegen) but exported from the package root.
+EXTRA_EXPORTS: dict[str, str] = {
+    "CompactTransaction": "compact",
+    "DecodeStats": "offload",
+    "GraphQLClientDeadlineError": "exceptions",
+    "GraphQLClientError": "exceptions",
+    "GraphQLClientGraphQLError": "exceptions",
+    "GraphQLClientGraphQLMultiError": "exceptions",
+    "GraphQLClientHttpError": "exceptions",
+    "GraphQLClientInvalidResponseError": "exceptions",
+    "LazyView": "lazy",
+    "OffloadDecoder": "offload",
+    "SharedResponseCache": "response_cache",
+    "StructClient": "struct_client",
+    "SyncClient": "sync_client",
+    "TransactionCursor": "keyset",
+    "TransactionIndex": "filters",
+    "TransactionStore": "store",
+    "UnsatisfiableFilter": "normalize",
+    "compact_transactions": "compact",
+    "compile_filter": "filters",
+    "deadline": "async_base_client",
+    "filter_key": "normalize",
+    "lazy_view": "lazy",
+    "normalize_filter": "normalize",
+    "normalized_query_transactions": "normalize",
+    "scan_transactions": "keyset",
+}
+
+LAZY_INIT_TEMPLATE = """
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+{type_checking_imports}
+
+_EXPORTS: dict[str, str] = {{
+{exports}
+}}
+
+__all__ = [
+{all_names}
+]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+"""
+
+
+class LazyPackagePlugin(Plugin):
+    """Keeps `import gql_client` cheap.
+
+    The package root resolves its exports on first attribute access, and model
+    schemas are built on first validation (`defer_build`) instead of through
+    module-level `model_rebuild()` calls.
+    """
+
+    def generate_init_module(self, module: ast.Module) -> ast.Module:
+        exports: dict[str, str] = {}
+        for node in module.body:
+            if isinstance(node, ast.ImportFrom) and node.level == 1 and node.module:
+                for alias in node.names:
+                    exports[alias.asname or alias.name] = node.module
+        exports.update(EXTRA_EXPORTS)
+
+        by_module: dict[str, list[str]] = {}
+        for name, module_name in exports.items():
+            by_module.setdefault(module_name, []).append(name)
+        imports = "\n".join(
+            f"    from .{module_name} import {', '.join(sorted(names))}"
+            for module_name, names in sorted(by_module.items())
+        )
+        source = LAZY_INIT_TEMPLATE.format(
+            type_checking_imports=imports,
+            exports="\n".join(
+                f'    "{name}": ".{module_name}",'
+                for name, module_name in sorted(exports.items())
+            ),
+            all_names="\n".join(f'    "{name}",' for name in sorted(exports)),
+        )
+        return ast.parse(source)
+
+    def generate_inputs_module(self, module: ast.Module) -> ast.Module:
+        return _strip_model_rebuild(module)
+
+    def generate_result_types_module(
+        self, module: ast.Module, operation_definition: ExecutableDefinitionNode
+    ) -> ast.Module:
+        return _strip_model_rebuild(module)
+
+    def copy_code(self, copied_code: str) -> str:
+        if "class BaseModel(PydanticBaseModel)" in copied_code and (
+            "defer_build" not in copied_code
+        ):
+            copied_code = copied_code.replace(
+                "protected_namespaces=(),",
+                "protected_namespaces=(),\n        defer_build=True,",
+            )
+        return copied_code
+
+    def get_file_comment(
+        self, comment: str, code: str, source: str | None = None
+    ) -> str:
+        # In-tree files copied back into the package already carry the header.
+        if code.startswith(GENERATED_COMMENT):
+            return ""
+        return comment
+
+
+def _strip_model_rebuild(module: ast.Module) -> ast.Module:
+    module.body = [node for node in module.body if not _is_model_rebuild(node)]
+    return module
+
+
+def _is_model_rebuild(node: ast.stmt) -> bool:
+    return (
+        isinstance(node, ast.Expr)
+        and isinstance(node.value, ast.Call)
+        and isinstance(node.value.func, ast.Attribute)
+        and node.value.func.attr == "model_rebuild"
+    )
+
+
+PAGINATED_METHOD_TEMPLATE = """
+@paginates({operation_name!r})
+def iter_{field}(
+    self,
+    {params}
+    *,
+    page_size: Optional[int] = None,
+    limit: Optional[int] = None,
+    prefetch: int = 2,
+    max_concurrency: int = 4,
+    **kwargs: Any,
+) -> AsyncIterator[{item_type}]:
+    return iter_items(
+        lambda page: self.{method}({call_args}, **kwargs),
+        {page_type},
+        connection={connection!r},
+        items={items!r},
+        start=current_page({start_args}),
+        page_size=page_size,
+        limit=limit,
+        prefetch=prefetch,
+        max_concurrency=max_concurrency,
+    )
+
+
+@paginates({operation_name!r})
+async def fetch_all_{field}(
+    self,
+    {params}
+    *,
+    page_size: Optional[int] = None,
+    limit: Optional[int] = None,
+    prefetch: int = 2,
+    max_concurrency: int = 4,
+    **kwargs: Any,
+) -> list[{item_type}]:
+    return [
+        item
+        async for item in self.iter_{field}(
+            {forward_args}
+            page_size=page_size,
+            limit=limit,
+            prefetch=prefetch,
+            max_concurrency=max_concurrency,
+            **kwargs,
+        )
+    ]
+"""
+
+
+@dataclass
+class PaginatedOperation:
+    method: ast.FunctionDef | ast.AsyncFunctionDef
+    operation_name: str
+    field: str
+    connection: str
+    items: str
+    item_type: str
+    item_module: str
+    variable: str
+    input_type: str | None
+    input_field: str | None
+    page_type: str
+
+
+class PaginationPlugin(Plugin):
+    """Adds `iter_<field>` / `fetch_all_<field>` methods to the client.
+
+    A query qualifies when its root field takes an offset pagination input
+    (an input object with `limit` and `offset`, directly or as a field of
+    another input) and its selection includes a list field plus
+    `pageInfo { hasNextPage }`. The generated methods page through the
+    connection with `gql_client.pagination`.
+    """
+
+    def __init__(self, schema, config_dict) -> None:
+        super().__init__(schema, config_dict)
+        self._paginated: list[PaginatedOperation] = []
+
+    def generate_client_method(
+        self,
+        method_def: ast.FunctionDef | ast.AsyncFunctionDef,
+        operation_definition: OperationDefinitionNode,
+    ) -> ast.FunctionDef | ast.AsyncFunctionDef:
+        paginated = self._detect(method_def, operation_definition)
+        if paginated:
+            self._paginated.append(paginated)
+        return method_def
+
+    def generate_client_class(self, class_def: ast.ClassDef) -> ast.ClassDef:
+        for paginated in self._paginated:
+            class_def.body.extend(_paginated_methods(paginated))
+        return class_def
+
+    def generate_client_module(self, module: ast.Module) -> ast.Module:
+        if not self._paginated:
+            return module
+        imports: list[ast.stmt] = [
+            ast.ImportFrom(
+                module="typing",
+                names=[ast.alias(name="Any"), ast.alias(name="Optional")],
+                level=0,
+            ),
+            ast.ImportFrom(
+                module="collections.abc",
+                names=[ast.alias(name="AsyncIterator")],
+                level=0,
+            ),
+            ast.ImportFrom(
+                module="pagination",
+                names=[
+                    ast.alias(name=name)
+                    for name in ("current_page", "iter_items", "paginates", "with_page")
+                ],
+                level=1,
+            ),
+        ]
+        for paginated in self._paginated:
+            imports.append(
+                ast.ImportFrom(
+                    module=paginated.item_module,
+                    names=[ast.alias(name=paginated.item_type)],
+                    level=1,
+                )
+            )
+            imports.append(
+                ast.ImportFrom(
+                    module="input_types",
+                    names=[ast.alias(name=paginated.page_type)]
+                    + (
+                        [ast.alias(name=paginated.input_type)]
+                        if paginated.input_type
+                        else []
+                    ),
+                    level=1,
+                )
+            )
+        module.body = imports + module.body
+        return module
+
+    def _detect(
+        self,
+        method_def: ast.FunctionDef | ast.AsyncFunctionDef,
+        operation: OperationDefinitionNode,
+    ) -> PaginatedOperation | None:
+        query_type = self.schema.query_type
+        if operation.operation != OperationType.QUERY or not query_type:
+            return None
+        if not operation.name or len(operation.selection_set.selections) != 1:
+            return None
+        root = operation.selection_set.selections[0]
+        if not isinstance(root, FieldNode) or root.name.value not in query_type.fields:
+            return None
+        field_def = query_type.fields[root.name.value]
+
+        pagination = _find_pagination_argument(field_def.args, root)
+        connection = _find_connection(field_def.type, root)
+        if not pagination or not connection:
+            return None
+        variable, input_type, input_field, page_type = pagination
+        items, items_alias = connection
+
+        python_variable = _python_variable_names(method_def).get(variable)
+        if not python_variable:
+            return None
+        response_key = (root.alias or root.name).value
+        operation_name = operation.name.value
+        return PaginatedOperation(
+            method=method_def,
+            operation_name=operation_name,
+            field=str_to_snake_case(root.name.value),
+            connection=str_to_snake_case(response_key),
+            items=str_to_snake_case(items_alias),
+            item_type=str_to_pascal_case(operation_name)
+            + str_to_pascal_case(response_key)
+            + str_to_pascal_case(items_alias),
+            item_module=str_to_snake_case(operation_name),
+            variable=python_variable,
+            input_type=input_type,
+            input_field=input_field,
+            page_type=page_type,
+        )
+
+
+def _is_pagination_input(type_) -> bool:
+    named = get_named_type(type_)
+    return is_input_object_type(named) and {"limit", "offset"} <= set(named.fields)
+
+
+def _find_pagination_argument(args, root: FieldNode):
+    """Return (variable, input type, input field, page type) for the root field."""
+    for arg_node in root.arguments:
+        if not isinstance(arg_node.value, VariableNode):
+            continue
+        arg = args.get(arg_node.name.value)
+        if arg is None:
+            continue
+        named = get_named_type(arg.type)
+        variable = arg_node.value.name.value
+        if _is_pagination_input(named):
+            return variable, None, None, named.name
+        if isinstance(named, GraphQLInputObjectType):
+            for name, input_field in named.fields.items():
+                if _is_pagination_input(input_field.type):
+                    page_type = get_named_type(input_field.type).name
+                    return variable, named.name, str_to_snake_case(name), page_type
+    return None
+
+
+def _find_connection(type_, root: FieldNode):
+    """Return (items field name, items response key) of a selected connection."""
+    named = get_named_type(type_)
+    if not isinstance(named, GraphQLObjectType) or not root.selection_set:
+        return None
+    selected = {
+        (sel.alias or sel.name).value: sel
+        for sel in root.selection_set.selections
+        if isinstance(sel, FieldNode)
+    }
+    page_info = selected.get("pageInfo")
+    if not page_info or not page_info.selection_set:
+        return None
+    if not any(
+        isinstance(sel, FieldNode) and sel.name.value == "hasNextPage"
+        for sel in page_info.selection_set.selections
+    ):
+        return None
+    for key, sel in selected.items():
+        field_def = named.fields.get(sel.name.value)
+        if field_def is None:
+            continue
+        field_type = field_def.type
+        if is_non_null_type(field_type):
+            field_type = field_type.of_type
+        if is_list_type(field_type) and is_object_type(get_named_type(field_type)):
+            return sel.name.value, key
+    return None
+
+
+def _python_variable_names(
+    method_def: ast.FunctionDef | ast.AsyncFunctionDef,
+) -> dict[str, str]:
+    # Generated methods build `variables = {"graphqlName": python_name, ...}`.
+    for node in method_def.body:
+        if (
+            isinstance(node, ast.AnnAssign)
+            and isinstance(node.target, ast.Name)
+            and node.target.id == "variables"
+            and isinstance(node.value, ast.Dict)
+        ):
+            return {
+                key.value: value.id
+                for key, value in zip(node.value.keys, node.value.values, strict=True)
+                if isinstance(key, ast.Constant) and isinstance(value, ast.Name)
+            }
+    return {}
+
+
+def _paginated_methods(paginated: PaginatedOperation) -> list[ast.stmt]:
+    args = paginated.method.args
+    params = []
+    defaults = [None] * (len(args.args) - len(args.defaults)) + list(args.defaults)
+    forward = []
+    call = []
+    for arg, default in zip(args.args, defaults, strict=True):
+        if arg.arg == "self":
+            continue
+        param = (
+            f"{arg.arg}: {ast.unparse(arg.annotation)}" if arg.annotation else arg.arg
+        )
+        if default is not None:
+            param += f" = {ast.unparse(default)}"
+        params.append(param + ",")
+        forward.append(f"{arg.arg},")
+        if arg.arg != paginated.variable:
+            call.append(f"{arg.arg}={arg.arg}")
+
+    if paginated.input_type:
+        call.append(
+            f"{paginated.variable}=with_page({paginated.variable}, "
+            f"{paginated.input_type}, {paginated.input_field!r}, page)"
+        )
+        start_args = f"{paginated.variable}, {paginated.input_field!r}"
+    else:
+        call.append(f"{paginated.variable}=page")
+        start_args = paginated.variable
+
+    source = PAGINATED_METHOD_TEMPLATE.format(
+        operation_name=paginated.operation_name,
+        field=paginated.field,
+        params="\n    ".join(params),
+        item_type=paginated.item_type,
+        method=paginated.method.name,
+        call_args=", ".join(call),
+        page_type=paginated.page_type,
+        connection=paginated.connection,
+        items=paginated.items,
+        start_args=start_args,
+        forward_args=" ".join(forward),
+    )
+    return ast.parse(source).body
+
+
+class PreparedOperationPlugin(Plugin):
+    """Pre-encodes the static part of every operation's request body.
+
+    Each method gets a module-level `PreparedOperation` holding its minified
+    document, its operation name and a `VariablesSerializer` built from the
+    annotations of its arguments. The method passes it to `execute`, which
+    only serializes the variables per call, in one pass instead of through
+    `_convert_value`.
+    """
+
+    def __init__(self, schema, config_dict) -> None:
+        super().__init__(schema, config_dict)
+        self._prepared: list[ast.stmt] = []
+
+    def generate_client_method(
+        self,
+        method_def: ast.FunctionDef | ast.AsyncFunctionDef,
+        operation_definition: OperationDefinitionNode,
+    ) -> ast.FunctionDef | ast.AsyncFunctionDef:
+        call = _execute_call(method_def)
+        assignment = _query_assignment(method_def)
+        if call is None or assignment is None or operation_definition.name is None:
+            return method_def
+        args = method_def.args.args + method_def.args.kwonlyargs
+        annotations = {arg.arg: arg.annotation for arg in args if arg.annotation}
+        variables = _python_variable_names(method_def)
+        if not all(name in annotations for name in variables.values()):
+            return method_def
+
+        name = f"_{method_def.name.upper()}"
+        fields = ", ".join(
+            f"{key!r}: {ast.unparse(annotations[python_name])}"
+            for key, python_name in variables.items()
+        )
+        document, source = assignment
+        query = strip_ignored_characters(source)
+        operation_name = operation_definition.name.value
+        self._prepared.extend(
+            ast.parse(
+                f"{name} = PreparedOperation({query!r}, {operation_name!r},"
+                f" VariablesSerializer({{{fields}}}))"
+            ).body
+        )
+        method_def.body.remove(document)
+        for keyword in call.keywords:
+            if keyword.arg == "query":
+                keyword.value = ast.Attribute(
+                    value=ast.Name(id=name), attr="query", ctx=ast.Load()
+                )
+        call.keywords.insert(
+            len(call.keywords) - 1,
+            ast.keyword(arg="prepared", value=ast.Name(id=name)),
+        )
+        return method_def
+
+    def generate_client_module(self, module: ast.Module) -> ast.Module:
+        if not self._prepared:
+            return module
+        position = next(
+            i for i, node in enumerate(module.body) if isinstance(node, ast.ClassDef)
+        )
+        module.body[position:position] = self._prepared
+        module.body.insert(
+            0,
+            ast.ImportFrom(
+                module="async_base_client",
+                names=[
+                    ast.alias(name="PreparedOperation"),
+                    ast.alias(name="VariablesSerializer"),
+                ],
+                level=1,
+            ),
+        )
+        return module
+
+
+def _query_assignment(
+    method_def: ast.FunctionDef | ast.AsyncFunctionDef,
+) -> tuple[ast.Assign, str] | None:
+    # `query = gql(...)`; ariadne-codegen passes the document as a list of
+    # line constants that is unparsed as implicit string concatenation.
+    for node in method_def.body:
+        if not (
+            isinstance(node, ast.Assign)
+            and isinstance(node.value, ast.Call)
+            and isinstance(node.value.func, ast.Name)
+            and node.value.func.id == "gql"
+            and len(node.value.args) == 1
+        ):
+            continue
+        arg = node.value.args[0]
+        parts = arg if isinstance(arg, list) else [arg]
+        if all(isinstance(p, ast.Constant) and isinstance(p.value, str) for p in parts):
+            return node, "".join(p.value for p in parts)
+    return None
+
+
+def _execute_call(
+    method_def: ast.FunctionDef | ast.AsyncFunctionDef,
+) -> ast.Call | None:
+    # Generated methods end with `self.execute(query=..., **kwargs)`.
+    for node in ast.walk(method_def):
+        if (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Attribute)
+            and node.func.attr == "execute"
+            and node.keywords
+            and node.keywords[-1].arg is None
+        ):
+            return node
+    return None
+
+
+class ModelDecodePlugin(Plugin):
+    """Routes result decoding of every method through `get_model`.
+
+    Generated methods end with `data = self.get_data(response)` and
+    `return Result.model_validate(data)`; both become
+    `return await self.get_model(response, Result)`, so a client built with
+    an `OffloadDecoder` validates large bodies off the event loop.
+    """
+
+    def generate_client_method(
+        self,
+        method_def: ast.FunctionDef | ast.AsyncFunctionDef,
+        operation_definition: OperationDefinitionNode,
+    ) -> ast.FunctionDef | ast.AsyncFunctionDef:
+        body = method_def.body
+        if not isinstance(method_def, ast.AsyncFunctionDef) or len(body) < 2:
+            return method_def
+        model = _validated_model(body[-2], body[-1])
+        if model is None:
+            return method_def
+        body[-2:] = ast.parse(f"return await self.get_model(response, {model})").body
+        return method_def
+
+
+def _validated_model(assign: ast.stmt, returned: ast.stmt) -> str | None:
+    # Name of `Result` in `data = self.get_data(response)`
+    # followed by `return Result.model_validate(data)`.
+    if not (
+        isinstance(assign, ast.Assign)
+        and ast.unparse(assign) == "data = self.get_data(response)"
+        and isinstance(returned, ast.Return)
+        and isinstance(returned.value, ast.Call)
+        and isinstance(returned.value.func, ast.Attribute)
+        and returned.value.func.attr == "model_validate"
+        and isinstance(returned.value.func.value, ast.Name)
+        and [ast.unparse(arg) for arg in returned.value.args] == ["data"]
+    ):
+        return None
+    return returned.value.func.value.id
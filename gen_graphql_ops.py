@@ -1,4 +1,11 @@
 import argparse
+import hashlib
+import json
+import subprocess
+import sys
+import tomllib
+from dataclasses import dataclass, field
+from fnmatch import fnmatch
 from pathlib import Path
 
 import httpx
@@ -10,69 +17,392 @@ from graphql import (
     is_non_null_type,
     is_object_type,
     is_scalar_type,
+    lexicographic_sort_schema,
+    print_schema,
 )
 
+DEFAULT_CACHE_DIR = ".cache/graphql"
+
+
+# Rough JSON size of one value of each scalar, used for payload estimates.
+SCALAR_BYTES = {"Int": 8, "Float": 12, "Boolean": 5, "ID": 24, "String": 24}
+DEFAULT_SCALAR_BYTES = 24
+
+
+@dataclass
+class CostModel:
+    """Budget for generated selections.
+
+    Every scalar value in a response costs 1, multiplied by the estimated
+    length of each enclosing list. Paths are dotted field names starting at
+    the root field (`transactions.items.logs`) and patterns use fnmatch.
+    """
+
+    budget: float
+    list_weight: float
+    list_weights: list[tuple[str, float]] = field(default_factory=list)
+    include: list[str] = field(default_factory=list)
+    exclude: list[str] = field(default_factory=list)
+
+    def weight(self, path):
+        weight = self.list_weight
+        for pattern, value in self.list_weights:
+            if fnmatch(path, pattern):
+                weight = value
+        return weight
+
+    def included(self, path):
+        return any(fnmatch(path, pattern) for pattern in self.include)
+
+    def excluded(self, path):
+        return any(fnmatch(path, pattern) for pattern in self.exclude)
+
+
+@dataclass
+class Leaf:
+    path: str
+    cost: float
+    size: int
+
+
+@dataclass
+class Group:
+    path: str
+    level: int
+    multiplier: float
+    leaves: list[Leaf]
+
+
+@dataclass
+class Plan:
+    selection: str | None
+    values: float
+    size: float
+    dropped: list[str]
+
 
 def unwrap(t):
     while is_non_null_type(t) or is_list_type(t):
         t = t.of_type
     return t
 
-def selection(t, depth, seen):
+def is_list_output(t):
+    if is_non_null_type(t):
+        t = t.of_type
+    return is_list_type(t)
+
+def collect_groups(t, path, depth, seen, multiplier, model, groups, level=0):
+    named = unwrap(t)
+    if not is_object_type(named) or named.name in seen:
+        return
+    seen = seen | {named.name}
+    leaves = []
+    for name, f in named.fields.items():
+        sub_path = f"{path}.{name}"
+        if model.excluded(sub_path):
+            continue
+        ft = unwrap(f.type)
+        sub_multiplier = multiplier * (
+            model.weight(sub_path) if is_list_output(f.type) else 1
+        )
+        if is_scalar_type(ft) or is_enum_type(ft):
+            size = len(name) + 3 + SCALAR_BYTES.get(ft.name, DEFAULT_SCALAR_BYTES)
+            leaves.append(Leaf(sub_path, sub_multiplier, size))
+        elif depth > 0:
+            collect_groups(
+                f.type, sub_path, depth - 1, seen, sub_multiplier, model, groups, level + 1
+            )
+    groups.append(Group(path, level, multiplier, leaves))
+
+def render_selection(t, path, seen, selected):
     named = unwrap(t)
-    if not is_object_type(named):
+    if not is_object_type(named) or named.name in seen:
         return None
-    if named.name in seen:
-        return "__typename"
     seen = seen | {named.name}
     fields = []
     for name, f in named.fields.items():
+        sub_path = f"{path}.{name}"
         ft = unwrap(f.type)
         if is_scalar_type(ft) or is_enum_type(ft):
-            fields.append(name)
-        elif depth > 0:
-            sub = selection(f.type, depth - 1, seen)
+            if sub_path in selected:
+                fields.append(name)
+        else:
+            sub = render_selection(f.type, sub_path, seen, selected)
             if sub:
                 fields.append(f"{name} {{ {sub} }}")
-    return " ".join(fields) if fields else "__typename"
+    return " ".join(fields) if fields else None
+
+def selection(field_name, t, depth, model):
+    """Plan the selection set of a root field within the model's budget.
+
+    Objects are taken whole, cheapest (fewest expected values) and shallowest
+    first, until the budget is spent; fields matching `include` are always
+    selected and fields matching `exclude` never are.
+    """
+    if not is_object_type(unwrap(t)):
+        return Plan(None, 1, DEFAULT_SCALAR_BYTES, [])
+    multiplier = model.weight(field_name) if is_list_output(t) else 1
+    groups = []
+    collect_groups(t, field_name, depth, set(), multiplier, model, groups)
 
-def load_schema(url):
+    leaves = [leaf for group in groups for leaf in group.leaves]
+    selected = {leaf.path for leaf in leaves if model.included(leaf.path)}
+    spent = sum(leaf.cost for leaf in leaves if leaf.path in selected)
+    dropped = []
+    for group in sorted(groups, key=lambda g: (g.multiplier, g.level)):
+        rest = [leaf for leaf in group.leaves if leaf.path not in selected]
+        cost = sum(leaf.cost for leaf in rest)
+        if not rest:
+            continue
+        if spent + cost <= model.budget:
+            selected.update(leaf.path for leaf in rest)
+            spent += cost
+        else:
+            dropped.append(group.path)
+
+    sel = render_selection(t, field_name, set(), selected) or "__typename"
+    size = sum(leaf.cost * leaf.size for leaf in leaves if leaf.path in selected)
+    return Plan(sel, spent, size, sorted(dropped))
+
+def sha256(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+def schema_fingerprint(schema):
+    # Hash the sorted SDL so field/type order in the response does not matter.
+    return sha256(print_schema(lexicographic_sort_schema(schema)))
+
+def fetch_introspection(url):
     resp = httpx.post(url, json={"query": get_introspection_query()})
     resp.raise_for_status()
     data = resp.json()
     if "errors" in data:
         raise RuntimeError(data["errors"])
-    return build_client_schema(data["data"])
+    return data["data"]
 
-def main():
-    ap = argparse.ArgumentParser()
-    ap.add_argument("--url", required=True)
-    ap.add_argument("--out", default="graphql/auto.graphql")
-    ap.add_argument("--depth", type=int, default=1)
-    args = ap.parse_args()
+def write_if_changed(path, text):
+    if path.exists() and path.read_text(encoding="utf-8") == text:
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    return True
 
-    schema = load_schema(args.url)
-    ops = []
+def load_schema(url, cache_dir, offline=False):
+    """Return (schema, fingerprint), going through the introspection cache.
 
+    Introspection results are stored content-addressed under
+    `schemas/<fingerprint>.json`; `urls/<hash(url)>.json` points at the latest
+    fingerprint seen for an endpoint so `--offline` can reuse it.
+    """
+    pointer = cache_dir / "urls" / f"{sha256(url)[:16]}.json"
+    if offline:
+        if not pointer.exists():
+            raise RuntimeError(f"No cached schema for {url}; run once online.")
+        fingerprint = json.loads(pointer.read_text(encoding="utf-8"))["fingerprint"]
+        introspection = json.loads(
+            (cache_dir / "schemas" / f"{fingerprint}.json").read_text(encoding="utf-8")
+        )
+        return build_client_schema(introspection), fingerprint
+
+    introspection = fetch_introspection(url)
+    schema = build_client_schema(introspection)
+    fingerprint = schema_fingerprint(schema)
+    write_if_changed(
+        cache_dir / "schemas" / f"{fingerprint}.json",
+        json.dumps(introspection, sort_keys=True),
+    )
+    write_if_changed(
+        cache_dir / "schemas" / f"{fingerprint}.graphql", print_schema(schema)
+    )
+    write_if_changed(
+        pointer, json.dumps({"url": url, "fingerprint": fingerprint}, indent=2)
+    )
+    return schema, fingerprint
+
+def build_ops(schema, depth, model):
+    ops = []
+    plans = []
     for kind, root in (("query", schema.query_type), ("mutation", schema.mutation_type)):
         if not root:
             continue
-        for fname, field in root.fields.items():
+        for fname, field_ in root.fields.items():
             var_defs = []
             var_args = []
-            for aname, arg in field.args.items():
+            for aname, arg in field_.args.items():
                 var_defs.append(f"${aname}: {arg.type}")
                 var_args.append(f"{aname}: ${aname}")
             vars_str = f"({', '.join(var_defs)})" if var_defs else ""
             args_str = f"({', '.join(var_args)})" if var_args else ""
-            sel = selection(field.type, args.depth, set())
+            plan = selection(fname, field_.type, depth, model)
+            sel = plan.selection
             body = f"{fname}{args_str}" + (f" {{ {sel} }}" if sel else "")
             ops.append(f"{kind} {kind}_{fname}{vars_str} {{ {body} }}")
+            plans.append((f"{kind}_{fname}", plan))
+    return ops, plans
 
+def print_report(plans):
+    print(f"{'operation':<40} {'values':>10} {'est. size':>12}  dropped")
+    for name, plan in plans:
+        dropped = ", ".join(plan.dropped) or "-"
+        print(f"{name:<40} {plan.values:>10,.0f} {plan.size / 1024:>9,.1f} KB  {dropped}")
+
+def parse_list_weight(value):
+    pattern, _, weight = value.rpartition("=")
+    if not pattern:
+        raise argparse.ArgumentTypeError("expected PATTERN=WEIGHT")
+    return pattern, float(weight)
+
+def generation_key(fingerprint, args):
+    # Generator source is part of the key: editing this script invalidates it.
+    options = {
+        "depth": args.depth,
+        "budget": args.budget,
+        "list_weight": args.list_weight,
+        "list_weights": args.list_weights,
+        "include": args.include,
+        "exclude": args.exclude,
+    }
+    generator = sha256(Path(__file__).read_text(encoding="utf-8"))
+    return sha256(json.dumps([fingerprint, options, generator], sort_keys=True))
+
+def toml_value(value):
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return str(value)
+    if isinstance(value, list):
+        return "[" + ", ".join(toml_value(v) for v in value) + "]"
+    return json.dumps(str(value))
+
+def run_codegen(cache_dir, fingerprint, out):
+    # Point ariadne-codegen at the cached SDL instead of letting it introspect.
+    section = dict(
+        tomllib.loads(Path("pyproject.toml").read_text(encoding="utf-8"))["tool"][
+            "ariadne-codegen"
+        ]
+    )
+    section.pop("remote_schema_url", None)
+    section["schema_path"] = (cache_dir / "schemas" / f"{fingerprint}.graphql").as_posix()
+    section["queries_path"] = out.as_posix()
+    config = cache_dir / "codegen.toml"
+    config.write_text(
+        "[tool.ariadne-codegen]\n"
+        + "".join(f"{key} = {toml_value(value)}\n" for key, value in section.items()),
+        encoding="utf-8",
+    )
+    subprocess.run(  # noqa: S603
+        [sys.executable, "-m", "ariadne_codegen", "--config", str(config.resolve())],
+        check=True,
+    )
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--url", required=True)
+    ap.add_argument("--out", default="graphql/auto.graphql")
+    ap.add_argument("--depth", type=int, default=1)
+    ap.add_argument(
+        "--budget",
+        type=float,
+        default=500,
+        help="max estimated scalar values per operation response",
+    )
+    ap.add_argument(
+        "--list-weight",
+        type=float,
+        default=10,
+        help="estimated length of list fields",
+    )
+    ap.add_argument(
+        "--list-weight-for",
+        dest="list_weights",
+        type=parse_list_weight,
+        action="append",
+        default=[],
+        metavar="PATTERN=WEIGHT",
+        help="per-path list length, e.g. transactions.items=50 (repeatable)",
+    )
+    ap.add_argument(
+        "--include",
+        action="append",
+        default=[],
+        metavar="PATTERN",
+        help="always select matching fields, e.g. transactions.items.logs.* (repeatable)",
+    )
+    ap.add_argument(
+        "--exclude",
+        action="append",
+        default=[],
+        metavar="PATTERN",
+        help="never select matching fields (repeatable)",
+    )
+    ap.add_argument(
+        "--report",
+        action="store_true",
+        help="print estimated payload size per generated operation",
+    )
+    ap.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR)
+    ap.add_argument(
+        "--offline", action="store_true", help="reuse the cached schema for --url"
+    )
+    ap.add_argument(
+        "--force", action="store_true", help="regenerate even if nothing changed"
+    )
+    ap.add_argument(
+        "--codegen",
+        action="store_true",
+        help="run ariadne-codegen against the cached schema when it or the ops changed",
+    )
+    args = ap.parse_args()
+
+    cache_dir = Path(args.cache_dir)
     out = Path(args.out)
-    out.parent.mkdir(parents=True, exist_ok=True)
-    out.write_text("\n\n".join(ops) + "\n", encoding="utf-8")
-    print(f"Wrote {len(ops)} ops to {out}")
+    schema, fingerprint = load_schema(args.url, cache_dir, offline=args.offline)
+    key = generation_key(fingerprint, args)
+    stamp = cache_dir / "outputs" / f"{sha256(out.resolve().as_posix())[:16]}.json"
+    previous = json.loads(stamp.read_text(encoding="utf-8")) if stamp.exists() else {}
+
+    up_to_date = (
+        not args.force
+        and previous.get("key") == key
+        and out.exists()
+        and previous.get("output") == sha256(out.read_text(encoding="utf-8"))
+    )
+    # Codegen has its own stamp: a plain run leaves the package behind the ops.
+    codegen_due = args.codegen and (args.force or previous.get("codegen") != key)
+    if up_to_date and not args.report and not codegen_due:
+        print(f"{out} is up to date (schema {fingerprint[:12]})")
+        return
+
+    model = CostModel(
+        budget=args.budget,
+        list_weight=args.list_weight,
+        list_weights=args.list_weights,
+        include=args.include,
+        exclude=args.exclude,
+    )
+    ops, plans = build_ops(schema, args.depth, model)
+    if args.report:
+        print_report(plans)
+    text = "\n\n".join(ops) + "\n"
+    changed = write_if_changed(out, text)
+    if changed:
+        print(f"Wrote {len(ops)} ops to {out} (schema {fingerprint[:12]})")
+    else:
+        print(f"{out} unchanged (schema {fingerprint[:12]})")
+    # Generated models follow the schema too, so a new fingerprint with the
+    # same ops text still needs codegen.
+    codegen_key = previous.get("codegen")
+    if codegen_due or (args.codegen and changed):
+        run_codegen(cache_dir, fingerprint, out)
+        codegen_key = key
+    elif args.codegen:
+        print("Skipped codegen: schema and ops unchanged")
+    # Stamped last, so a failed codegen run is retried next time.
+    write_if_changed(
+        stamp,
+        json.dumps(
+            {"key": key, "output": sha256(text), "codegen": codegen_key}, indent=2
+        ),
+    )
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,216 @@
+"""Generate the msgspec target of `gql_client`.
+
+Reads the pydantic models and `Client` produced by ariadne-codegen and emits
+`structs.py` (msgspec.Struct mirrors with the same field names and aliases)
+and `struct_client.py` (`StructClient`, same methods as `Client`). Run it after
+every `python -m ariadne_codegen`.
+"""
+
+import argparse
+import ast
+import enum
+import importlib
+import inspect
+import re
+import types
+from pathlib import Path
+from typing import Any, Union, get_args, get_origin
+
+from pydantic import BaseModel
+from pydantic_core import PydanticUndefined
+
+HEADER = "# Generated by gen_struct_client.py\n# Source: {source}\n"
+
+# Relative imports of client.py that are shared as-is rather than swapped for
+# their msgspec mirrors.
+KEPT_IMPORTS = ("base_model", "pagination")
+
+# Names imported from `async_base_client` that have a msgspec counterpart in
+# `struct_base_client`; the rest are shared as-is.
+STRUCT_BASE_NAMES = {
+    "AsyncBaseClient": "AsyncStructBaseClient",
+    "VariablesSerializer": "StructVariablesSerializer",
+}
+
+STRUCT_BASES = {
+    "Struct": "msgspec.Struct, kw_only=True, gc=False",
+    "InputStruct": "msgspec.Struct, kw_only=True, omit_defaults=True",
+}
+
+
+def render_type(tp: Any, names: dict[type, str], enums: set[str]) -> str:
+    origin = get_origin(tp)
+    if origin in (Union, types.UnionType):
+        args = get_args(tp)
+        inner = [render_type(a, names, enums) for a in args if a is not type(None)]
+        rendered = inner[0] if len(inner) == 1 else f"Union[{', '.join(inner)}]"
+        return f"Optional[{rendered}]" if type(None) in args else rendered
+    if origin is list:
+        return f"list[{render_type(get_args(tp)[0], names, enums)}]"
+    if tp is Any:
+        return "Any"
+    if inspect.isclass(tp) and issubclass(tp, BaseModel):
+        return f'"{names[tp]}"'
+    if inspect.isclass(tp) and issubclass(tp, enum.Enum):
+        enums.add(tp.__name__)
+        return tp.__name__
+    if tp in (str, int, float, bool):
+        return tp.__name__
+    raise TypeError(f"Unsupported annotation: {tp!r}")
+
+
+def collect_models(roots: list[type[BaseModel]]) -> list[type[BaseModel]]:
+    ordered: list[type[BaseModel]] = []
+    stack = list(roots)
+    while stack:
+        model = stack.pop(0)
+        if model in ordered:
+            continue
+        model.model_rebuild()
+        ordered.append(model)
+        for field in model.model_fields.values():
+            stack.extend(_nested_models(field.annotation))
+    return ordered
+
+
+def _nested_models(tp: Any) -> list[type[BaseModel]]:
+    if inspect.isclass(tp) and issubclass(tp, BaseModel):
+        return [tp]
+    return [m for arg in get_args(tp) for m in _nested_models(arg)]
+
+
+def render_struct(
+    model: type[BaseModel], base: str, names: dict[type, str], enums: set[str]
+) -> str:
+    lines = [f"class {names[model]}({base}):"]
+    is_input = base == "InputStruct"
+    for name, field in model.model_fields.items():
+        annotation = render_type(field.annotation, names, enums)
+        options = []
+        if field.alias and field.alias != name:
+            options.append(f'name="{field.alias}"')
+        if is_input and not field.is_required():
+            annotation = f"Union[{annotation}, UnsetType]"
+            options.append("default=UNSET")
+        elif field.default is not PydanticUndefined:
+            options.append(f"default={field.default!r}")
+        if options:
+            lines.append(
+                f"    {name}: {annotation} = msgspec.field({', '.join(options)})"
+            )
+        else:
+            lines.append(f"    {name}: {annotation}")
+    return "\n".join(lines)
+
+
+def client_roots(
+    client_cls: type,
+) -> tuple[list[type[BaseModel]], list[type[BaseModel]]]:
+    results: list[type[BaseModel]] = []
+    inputs: list[type[BaseModel]] = []
+    for name, func in client_cls.__dict__.items():
+        if name.startswith("_") or not inspect.iscoroutinefunction(func):
+            continue
+        if getattr(func, "__paginates__", None):
+            continue
+        hints = inspect.get_annotations(func, eval_str=True)
+        for arg, tp in hints.items():
+            target = results if arg == "return" else inputs
+            target.extend(m for m in _nested_models(tp) if m not in target)
+    return results, inputs
+
+
+def build_structs_module(package: str, source: str) -> tuple[str, list[str]]:
+    client_module = importlib.import_module(f"{package}.client")
+    results, inputs = client_roots(client_module.Client)
+    input_models = collect_models(inputs)
+    result_models = [m for m in collect_models(results) if m not in input_models]
+    names = {m: m.__name__ for m in input_models + result_models}
+
+    enums: set[str] = set()
+    classes = [render_struct(m, "Struct", names, enums) for m in result_models]
+    classes += [render_struct(m, "InputStruct", names, enums) for m in input_models]
+
+    parts = [
+        HEADER.format(source=source),
+        "from typing import Any, Optional, Union\n",
+        "import msgspec",
+        "from msgspec import UNSET, UnsetType\n",
+    ]
+    if enums:
+        parts.append(f"from .enums import {', '.join(sorted(enums))}\n")
+    for base, options in STRUCT_BASES.items():
+        parts.append(f"\nclass {base}({options}):\n    pass\n")
+    parts.extend(f"\n{cls}\n" for cls in classes)
+    return "\n".join(parts), sorted(names.values())
+
+
+def build_client_module(client_path: Path, source: str) -> str:
+    code = client_path.read_text(encoding="utf-8")
+    tree = ast.parse(code)
+    imports = [
+        node
+        for node in tree.body
+        if isinstance(node, ast.ImportFrom) and node.level == 1
+    ]
+    struct_names = sorted(
+        alias.name
+        for node in imports
+        if node.module not in ("async_base_client",) + KEPT_IMPORTS
+        for alias in node.names
+    )
+    kept = [
+        ast.get_source_segment(code, node) + "\n"
+        for node in imports
+        if node.module in KEPT_IMPORTS
+    ]
+    lines = code.splitlines(keepends=True)
+    first, last = imports[0].lineno - 1, imports[-1].end_lineno
+    header_end = next(i for i, line in enumerate(lines) if not line.startswith("#"))
+
+    base_names = sorted(
+        alias.name
+        for node in imports
+        if node.module == "async_base_client"
+        for alias in node.names
+    )
+    shared = [name for name in base_names if name not in STRUCT_BASE_NAMES]
+    if shared:
+        kept.insert(0, f"from .async_base_client import {', '.join(shared)}\n")
+    struct_bases = sorted(STRUCT_BASE_NAMES[n] for n in base_names if n not in shared)
+    new_imports = "".join(kept) + (
+        f"from .struct_base_client import {', '.join(struct_bases)}\n"
+        "from .structs import (\n"
+        + "".join(f"    {name},\n" for name in struct_names)
+        + ")\n"
+    )
+    rest = "".join(lines[last:])
+    for name, struct_name in STRUCT_BASE_NAMES.items():
+        rest = re.sub(rf"\b{name}\b", struct_name, rest)
+    rest = rest.replace("class Client(", "class StructClient(")
+    body = "".join(lines[header_end:first]) + new_imports + rest
+    body = re.sub(
+        r"return await self\.get_model\(response, (\w+)\)",
+        r"return self.get_struct(response, \1)",
+        body,
+    )
+    return HEADER.format(source=source) + body
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--package", default="gql_client")
+    args = ap.parse_args()
+
+    package_dir = Path(importlib.import_module(args.package).__file__).parent
+    client_path = package_dir / "client.py"
+    source = f"{package_dir.name}/client.py"
+    structs_code, struct_names = build_structs_module(args.package, source)
+    client_code = build_client_module(client_path, source)
+    (package_dir / "structs.py").write_text(structs_code, encoding="utf-8")
+    (package_dir / "struct_client.py").write_text(client_code, encoding="utf-8")
+    print(f"Wrote {len(struct_names)} structs and StructClient to {package_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,55 +1,135 @@
 # Generated by ariadne-codegen
 
-from .async_base_client import AsyncBaseClient
-from .base_model import BaseModel, Upload
-from .client import Client
-from .enums import SortDirection, TransactionOrderField
-from .exceptions import (
-    GraphQLClientError,
-    GraphQLClientGraphQLError,
-    GraphQLClientGraphQLMultiError,
-    GraphQLClientHttpError,
-    GraphQLClientInvalidResponseError,
-)
-from .input_types import (
-    BigIntFilter,
-    BoolFilter,
-    DateTimeFilter,
-    IntFilter,
-    PaginationInput,
-    StringFilter,
-    TransactionFilterInput,
-    TransactionOrderByInput,
-    TransactionQueryInput,
-)
-from .mutation_send_raw_transaction import MutationSendRawTransaction
-from .query_eth_syncing import QueryEthSyncing
-from .query_metadata import QueryMetadata, QueryMetadataMetadata
-from .query_transactions import (
-    QueryTransactions,
-    QueryTransactionsTransactions,
-    QueryTransactionsTransactionsItems,
-    QueryTransactionsTransactionsItemsInternalTransactions,
-    QueryTransactionsTransactionsItemsLogs,
-    QueryTransactionsTransactionsPageInfo,
-)
-from .query_usage_stat import QueryUsageStat, QueryUsageStatUsageStat
-from .query_web_3_sha_3 import QueryWeb3Sha3
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
+if TYPE_CHECKING:
+    from .async_base_client import AsyncBaseClient, deadline
+    from .base_model import BaseModel, Upload
+    from .client import Client
+    from .compact import CompactTransaction, compact_transactions
+    from .enums import SortDirection, TransactionOrderField
+    from .exceptions import (
+        GraphQLClientDeadlineError,
+        GraphQLClientError,
+        GraphQLClientGraphQLError,
+        GraphQLClientGraphQLMultiError,
+        GraphQLClientHttpError,
+        GraphQLClientInvalidResponseError,
+    )
+    from .filters import TransactionIndex, compile_filter
+    from .input_types import (
+        BigIntFilter,
+        BoolFilter,
+        DateTimeFilter,
+        IntFilter,
+        PaginationInput,
+        StringFilter,
+        TransactionFilterInput,
+        TransactionOrderByInput,
+        TransactionQueryInput,
+    )
+    from .keyset import TransactionCursor, scan_transactions
+    from .lazy import LazyView, lazy_view
+    from .mutation_send_raw_transaction import MutationSendRawTransaction
+    from .normalize import (
+        UnsatisfiableFilter,
+        filter_key,
+        normalize_filter,
+        normalized_query_transactions,
+    )
+    from .offload import DecodeStats, OffloadDecoder
+    from .query_eth_syncing import QueryEthSyncing
+    from .query_metadata import QueryMetadata, QueryMetadataMetadata
+    from .query_transactions import (
+        QueryTransactions,
+        QueryTransactionsTransactions,
+        QueryTransactionsTransactionsItems,
+        QueryTransactionsTransactionsItemsInternalTransactions,
+        QueryTransactionsTransactionsItemsLogs,
+        QueryTransactionsTransactionsPageInfo,
+    )
+    from .query_usage_stat import QueryUsageStat, QueryUsageStatUsageStat
+    from .query_web_3_sha_3 import QueryWeb3Sha3
+    from .response_cache import SharedResponseCache
+    from .store import TransactionStore
+    from .struct_client import StructClient
+    from .sync_client import SyncClient
+
+_EXPORTS: dict[str, str] = {
+    "AsyncBaseClient": ".async_base_client",
+    "BaseModel": ".base_model",
+    "BigIntFilter": ".input_types",
+    "BoolFilter": ".input_types",
+    "Client": ".client",
+    "CompactTransaction": ".compact",
+    "DateTimeFilter": ".input_types",
+    "DecodeStats": ".offload",
+    "GraphQLClientDeadlineError": ".exceptions",
+    "GraphQLClientError": ".exceptions",
+    "GraphQLClientGraphQLError": ".exceptions",
+    "GraphQLClientGraphQLMultiError": ".exceptions",
+    "GraphQLClientHttpError": ".exceptions",
+    "GraphQLClientInvalidResponseError": ".exceptions",
+    "IntFilter": ".input_types",
+    "LazyView": ".lazy",
+    "MutationSendRawTransaction": ".mutation_send_raw_transaction",
+    "OffloadDecoder": ".offload",
+    "PaginationInput": ".input_types",
+    "QueryEthSyncing": ".query_eth_syncing",
+    "QueryMetadata": ".query_metadata",
+    "QueryMetadataMetadata": ".query_metadata",
+    "QueryTransactions": ".query_transactions",
+    "QueryTransactionsTransactions": ".query_transactions",
+    "QueryTransactionsTransactionsItems": ".query_transactions",
+    "QueryTransactionsTransactionsItemsInternalTransactions": ".query_transactions",
+    "QueryTransactionsTransactionsItemsLogs": ".query_transactions",
+    "QueryTransactionsTransactionsPageInfo": ".query_transactions",
+    "QueryUsageStat": ".query_usage_stat",
+    "QueryUsageStatUsageStat": ".query_usage_stat",
+    "QueryWeb3Sha3": ".query_web_3_sha_3",
+    "SharedResponseCache": ".response_cache",
+    "SortDirection": ".enums",
+    "StringFilter": ".input_types",
+    "StructClient": ".struct_client",
+    "SyncClient": ".sync_client",
+    "TransactionCursor": ".keyset",
+    "TransactionFilterInput": ".input_types",
+    "TransactionIndex": ".filters",
+    "TransactionOrderByInput": ".input_types",
+    "TransactionOrderField": ".enums",
+    "TransactionQueryInput": ".input_types",
+    "TransactionStore": ".store",
+    "UnsatisfiableFilter": ".normalize",
+    "Upload": ".base_model",
+    "compact_transactions": ".compact",
+    "compile_filter": ".filters",
+    "deadline": ".async_base_client",
+    "filter_key": ".normalize",
+    "lazy_view": ".lazy",
+    "normalize_filter": ".normalize",
+    "normalized_query_transactions": ".normalize",
+    "scan_transactions": ".keyset",
+}
 __all__ = [
     "AsyncBaseClient",
     "BaseModel",
     "BigIntFilter",
     "BoolFilter",
     "Client",
+    "CompactTransaction",
     "DateTimeFilter",
+    "DecodeStats",
+    "GraphQLClientDeadlineError",
     "GraphQLClientError",
     "GraphQLClientGraphQLError",
     "GraphQLClientGraphQLMultiError",
     "GraphQLClientHttpError",
     "GraphQLClientInvalidResponseError",
     "IntFilter",
+    "LazyView",
     "MutationSendRawTransaction",
+    "OffloadDecoder",
     "PaginationInput",
     "QueryEthSyncing",
     "QueryMetadata",
@@ -63,11 +143,39 @@ __all__ = [
     "QueryUsageStat",
     "QueryUsageStatUsageStat",
     "QueryWeb3Sha3",
+    "SharedResponseCache",
     "SortDirection",
     "StringFilter",
+    "StructClient",
+    "SyncClient",
+    "TransactionCursor",
     "TransactionFilterInput",
+    "TransactionIndex",
     "TransactionOrderByInput",
     "TransactionOrderField",
     "TransactionQueryInput",
+    "TransactionStore",
+    "UnsatisfiableFilter",
     "Upload",
+    "compact_transactions",
+    "compile_filter",
+    "deadline",
+    "filter_key",
+    "lazy_view",
+    "normalize_filter",
+    "normalized_query_transactions",
+    "scan_transactions",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
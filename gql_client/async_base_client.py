@@ -1,52 +1,288 @@
 # Generated by ariadne-codegen
 
+import asyncio
 import enum
+import hashlib
+import io
 import json
-from collections.abc import AsyncIterator
-from typing import IO, Any, Optional, TypeVar, cast
+import mmap
+import os
+import stat
+import time
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Optional,
+    TypeVar,
+    Union,
+    cast,
+    get_args,
+    get_origin,
+)
 from uuid import uuid4
 
 import httpx
-from pydantic import BaseModel
-from pydantic_core import to_jsonable_python
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import PydanticSerializationError, to_jsonable_python
 
-from .base_model import UNSET, Upload
+from .base_model import UNSET, UnsetType, Upload
 from .exceptions import (
+    GraphQLClientDeadlineError,
     GraphQLClientGraphQLMultiError,
     GraphQLClientHttpError,
     GraphQLClientInvalidMessageFormat,
     GraphQLClientInvalidResponseError,
 )
 
-try:
+if TYPE_CHECKING:
     from websockets import (  # type: ignore[import-not-found,unused-ignore]
         ClientConnection,
     )
-    from websockets import (  # type: ignore[import-not-found,unused-ignore]
-        connect as ws_connect,
-    )
     from websockets.typing import (  # type: ignore[import-not-found,unused-ignore]
         Data,
-        Origin,
-        Subprotocol,
     )
-except ImportError:
-    from contextlib import asynccontextmanager
 
-    @asynccontextmanager  # type: ignore
-    async def ws_connect(*args, **kwargs):
-        raise NotImplementedError("Subscriptions require 'websockets' package.")
-        yield
+    from .offload import OffloadDecoder
+    from .response_cache import SharedResponseCache
+
+
+def _import_websockets() -> tuple[Any, Any]:
+    # Deferred so that importing the client does not pay for websockets.
+    try:
+        from websockets import (  # type: ignore[import-not-found,unused-ignore]
+            connect,
+        )
+        from websockets.typing import (  # type: ignore[import-not-found,unused-ignore]
+            Subprotocol,
+        )
+    except ImportError as exc:
+        raise NotImplementedError(
+            "Subscriptions require 'websockets' package."
+        ) from exc
+    return connect, Subprotocol
+
+
+MULTIPART_CHUNK_SIZE = 64 * 1024
+
+# Monotonic time by which requests of the current task must be done.
+_DEADLINE: ContextVar[Optional[float]] = ContextVar("_DEADLINE", default=None)
+
+
+@asynccontextmanager
+async def deadline(seconds: float) -> AsyncIterator[None]:
+    """Give the requests made inside the block `seconds` in total.
+
+    Each request gets what is left as its httpx timeout, and the block is
+    cancelled when the time is up. Either way `GraphQLClientDeadlineError`
+    is raised, from the block as a whole when it was cancelled. A nested
+    deadline never extends an outer one.
+    """
+    end = time.monotonic() + seconds
+    outer = _DEADLINE.get()
+    if outer is not None:
+        end = min(end, outer)
+    token = _DEADLINE.set(end)
+    scope = asyncio.timeout(max(end - time.monotonic(), 0))
+    try:
+        async with scope:
+            yield
+    except TimeoutError as exc:
+        if isinstance(exc, GraphQLClientDeadlineError) or not scope.expired():
+            raise
+        raise GraphQLClientDeadlineError(seconds) from exc
+    finally:
+        _DEADLINE.reset(token)
+
+
+def _regular_file_size(file_: IO[bytes]) -> Optional[int]:
+    try:
+        status = os.fstat(file_.fileno())
+    except (AttributeError, OSError, ValueError):
+        return None
+    return status.st_size if stat.S_ISREG(status.st_mode) else None
+
+
+def _upload_size(file_: IO[bytes]) -> Optional[int]:
+    """Bytes left in `file_` from its current position, or None if unknown."""
+    try:
+        position = file_.tell()
+    except (AttributeError, OSError, ValueError):
+        return None
+    size = _regular_file_size(file_)
+    if size is not None:
+        return max(size - position, 0)
+    if isinstance(file_, io.BytesIO):
+        return max(file_.getbuffer().nbytes - position, 0)
+    try:
+        size = file_.seek(0, os.SEEK_END)
+        file_.seek(position)
+    except (AttributeError, OSError, ValueError):
+        return None
+    return max(size - position, 0)
+
+
+def _read_upload(file_: IO[bytes]) -> Iterator[bytes]:
+    """Chunks of `file_` from its current position, never holding the whole file.
+
+    Regular files are memory-mapped so chunks are sliced from the page cache;
+    other streams are read `MULTIPART_CHUNK_SIZE` bytes at a time.
+    """
+    if _regular_file_size(file_):
+        with mmap.mmap(file_.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            for start in range(file_.tell(), len(mapped), MULTIPART_CHUNK_SIZE):
+                yield mapped[start : start + MULTIPART_CHUNK_SIZE]
+        return
+    while chunk := file_.read(MULTIPART_CHUNK_SIZE):
+        yield chunk
+
+
+def _form_param(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', "%22").replace("\r\n", " ")
+
+
+def _multipart_parts(
+    boundary: str,
+    data: dict[str, str],
+    files: dict[str, tuple[str, IO[bytes], str]],
+) -> list[tuple[bytes, Optional[IO[bytes]]]]:
+    """Encoded part headers, each with the field value or file that follows."""
+    parts: list[tuple[bytes, Optional[IO[bytes]]]] = []
+    for name, value in data.items():
+        head = (
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="{_form_param(name)}"\r\n\r\n'
+        ).encode()
+        parts.append((head + value.encode() + b"\r\n", None))
+    for name, (filename, file_, content_type) in files.items():
+        head = (
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="{_form_param(name)}";'
+            f' filename="{_form_param(filename)}"\r\n'
+            f"Content-Type: {content_type}\r\n\r\n"
+        ).encode()
+        parts.append((head, file_))
+    return parts
+
+
+async def _multipart_stream(
+    boundary: str, parts: list[tuple[bytes, Optional[IO[bytes]]]]
+) -> AsyncIterator[bytes]:
+    for head, file_ in parts:
+        yield head
+        if file_ is not None:
+            for chunk in _read_upload(file_):
+                yield chunk
+            yield b"\r\n"
+    yield f"--{boundary}--\r\n".encode()
+
+
+def _without_unset(annotation: Any) -> Any:
+    if get_origin(annotation) is Union:
+        return Union[tuple(a for a in get_args(annotation) if a is not UnsetType)]
+    return annotation
+
+
+def _has_upload(annotation: Any) -> bool:
+    # pydantic cannot build an adapter for `Upload` itself; inputs holding
+    # one in a field are caught when their values fail to serialize.
+    if annotation is Upload:
+        return True
+    return any(_has_upload(arg) for arg in get_args(annotation))
+
+
+class VariablesSerializer:
+    """Encodes the variables of one generated operation to JSON bytes.
+
+    Every variable gets a pydantic `TypeAdapter` for its annotation, built on
+    first use, so typed inputs are dumped by alias straight to JSON without the
+    intermediate dicts of `_convert_value`. `UNSET` variables are left out and
+    unset model fields excluded, exactly as on the generic path. Variables
+    annotated with `Upload` get no adapter; calls passing one take the generic
+    path.
+    """
+
+    def __init__(self, annotations: dict[str, Any]) -> None:
+        self.annotations = annotations
+        self._adapters: Optional[dict[str, tuple[bytes, TypeAdapter[Any]]]] = None
+
+    def _build(self) -> dict[str, tuple[bytes, TypeAdapter[Any]]]:
+        self._adapters = {
+            name: (json.dumps(name).encode() + b":", TypeAdapter(_without_unset(tp)))
+            for name, tp in self.annotations.items()
+            if not _has_upload(tp)
+        }
+        return self._adapters
+
+    def dumps(self, variables: dict[str, Any]) -> Optional[bytes]:
+        """JSON object of `variables`.
+
+        Returns None when only the generic path can encode them, for example
+        when they hold an `Upload`.
+        """
+        adapters = self._adapters if self._adapters is not None else self._build()
+        parts: list[bytes] = []
+        for name, value in variables.items():
+            if value is UNSET:
+                continue
+            entry = adapters.get(name)
+            if entry is None:
+                return None
+            key, adapter = entry
+            try:
+                encoded = adapter.dump_json(
+                    value,
+                    by_alias=True,
+                    exclude_unset=True,
+                    serialize_as_any=True,
+                    warnings=False,
+                )
+            except PydanticSerializationError:
+                return None
+            parts.append(key + encoded)
+        return b"{" + b",".join(parts) + b"}"
+
 
-    ClientConnection = Any  # type: ignore[misc,assignment,unused-ignore]
-    Data = Any  # type: ignore[misc,assignment,unused-ignore]
-    Origin = Any  # type: ignore[misc,assignment,unused-ignore]
+def _is_query(query: str) -> bool:
+    # Only documents that start with their (query) operation are cached;
+    # anything else, fragments first included, conservatively is not.
+    return query.lstrip().startswith(("query", "{"))
 
-    def Subprotocol(*args, **kwargs):  # type: ignore # noqa: N802, N803
-        raise NotImplementedError("Subscriptions require 'websockets' package.")
+
+class PreparedOperation:
+    """Request body of one generated operation with its static part pre-encoded.
+
+    The (minified) document and operation name are encoded to JSON once; per
+    call only the variables are serialized and spliced in.
+    """
+
+    def __init__(
+        self,
+        query: str,
+        operation_name: Optional[str],
+        variables: VariablesSerializer,
+    ) -> None:
+        self.query = query
+        self.operation_name = operation_name
+        self.variables = variables
+        head = json.dumps(
+            {"query": query, "operationName": operation_name}, separators=(",", ":")
+        )
+        self._prefix = head[:-1].encode() + b',"variables":'
+
+    def body(self, variables: dict[str, Any]) -> Optional[bytes]:
+        """JSON request body, or None when the variables need the generic path."""
+        encoded = self.variables.dumps(variables)
+        if encoded is None:
+            return None
+        return b"".join((self._prefix, encoded, b"}"))
 
 
 Self = TypeVar("Self", bound="AsyncBaseClient")
+Model = TypeVar("Model", bound=BaseModel)
 
 GRAPHQL_TRANSPORT_WS = "graphql-transport-ws"
 
@@ -72,16 +308,22 @@ class AsyncBaseClient:
         ws_headers: Optional[dict[str, Any]] = None,
         ws_origin: Optional[str] = None,
         ws_connection_init_payload: Optional[dict[str, Any]] = None,
+        response_cache: Optional["SharedResponseCache"] = None,
+        offload: Optional["OffloadDecoder"] = None,
+        lazy_results: bool = False,
     ) -> None:
         self.url = url
         self.headers = headers
         self.http_client = (
             http_client if http_client else httpx.AsyncClient(headers=headers)
         )
+        self.response_cache = response_cache
+        self.offload = offload
+        self.lazy_results = lazy_results
 
         self.ws_url = ws_url
         self.ws_headers = ws_headers or {}
-        self.ws_origin = Origin(ws_origin) if ws_origin else None
+        self.ws_origin = ws_origin or None
         self.ws_connection_init_payload = ws_connection_init_payload
 
     async def __aenter__(self: Self) -> Self:
@@ -100,8 +342,15 @@ class AsyncBaseClient:
         query: str,
         operation_name: Optional[str] = None,
         variables: Optional[dict[str, Any]] = None,
+        prepared: Optional[PreparedOperation] = None,
         **kwargs: Any,
     ) -> httpx.Response:
+        cacheable = self.response_cache is not None and _is_query(query)
+        if prepared is not None:
+            body = prepared.body(variables or {})
+            if body is not None:
+                return await self._post_json(body, cacheable=cacheable, **kwargs)
+
         processed_variables, files, files_map = self._process_variables(variables)
 
         if files and files_map:
@@ -118,6 +367,7 @@ class AsyncBaseClient:
             query=query,
             operation_name=operation_name,
             variables=processed_variables,
+            cacheable=cacheable,
             **kwargs,
         )
 
@@ -147,6 +397,22 @@ class AsyncBaseClient:
 
         return cast(dict[str, Any], data)
 
+    async def get_model(self, response: httpx.Response, model: type[Model]) -> Model:
+        """`model` of the response data; large bodies go to `offload` if set.
+
+        With `lazy_results` the data is returned as a `LazyView` standing in
+        for `model`, which validates fields as they are read.
+        """
+        if self.lazy_results:
+            from .lazy import lazy_view  # Not paid for by eager clients.
+
+            return lazy_view(model, self.get_data(response))
+        if self.offload is not None and response.is_success:
+            result = await self.offload.decode(response.content, model)
+            if result is not None:
+                return result
+        return model.model_validate(self.get_data(response))
+
     async def execute_ws(
         self,
         query: str,
@@ -161,10 +427,11 @@ class AsyncBaseClient:
         merged_kwargs.update(kwargs)
         merged_kwargs["extra_headers"] = headers
 
+        ws_connect, subprotocol = _import_websockets()
         operation_id = str(uuid4())
         async with ws_connect(
             self.ws_url,
-            subprotocols=[Subprotocol(GRAPHQL_TRANSPORT_WS)],
+            subprotocols=[subprotocol(GRAPHQL_TRANSPORT_WS)],
             **merged_kwargs,
         ) as websocket:
             await self._send_connection_init(websocket)
@@ -221,35 +488,43 @@ class AsyncBaseClient:
     ]:
         files_map: dict[str, list[str]] = {}
         files_list: list[Upload] = []
+        # Uploads are deduplicated by identity, so repeated ones cost O(1).
+        file_indexes: dict[int, str] = {}
+        keys: list[str] = ["variables"]
 
-        def separate_files(path: str, obj: Any) -> Any:
-            if isinstance(obj, list):
-                nulled_list = []
-                for index, value in enumerate(obj):
-                    value = separate_files(f"{path}.{index}", value)
-                    nulled_list.append(value)
-                return nulled_list
-
-            if isinstance(obj, dict):
-                nulled_dict = {}
-                for key, value in obj.items():
-                    value = separate_files(f"{path}.{key}", value)
-                    nulled_dict[key] = value
-                return nulled_dict
-
+        def separate_files(obj: Any) -> Any:
+            # Containers are copied only on the way to an Upload; everything
+            # else, including the whole tree when there is none, is returned as is.
             if isinstance(obj, Upload):
-                if obj in files_list:
-                    file_index = files_list.index(obj)
-                    files_map[str(file_index)].append(path)
-                else:
-                    file_index = len(files_list)
+                path = ".".join(keys)
+                file_index = file_indexes.get(id(obj))
+                if file_index is None:
+                    file_index = file_indexes[id(obj)] = str(len(files_list))
                     files_list.append(obj)
-                    files_map[str(file_index)] = [path]
+                    files_map[file_index] = [path]
+                else:
+                    files_map[file_index].append(path)
                 return None
 
-            return obj
-
-        nulled_variables = separate_files("variables", variables)
+            if isinstance(obj, dict):
+                items: Any = obj.items()
+            elif isinstance(obj, list):
+                items = enumerate(obj)
+            else:
+                return obj
+
+            copied: Any = None
+            for key, value in items:
+                keys.append(str(key))
+                nulled = separate_files(value)
+                keys.pop()
+                if nulled is not value:
+                    if copied is None:
+                        copied = obj.copy()
+                    copied[key] = nulled
+            return obj if copied is None else copied
+
+        nulled_variables = separate_files(variables)
         files: dict[str, tuple[str, IO[bytes], str]] = {
             str(i): (file_.filename, cast(IO[bytes], file_.content), file_.content_type)
             for i, file_ in enumerate(files_list)
@@ -277,8 +552,24 @@ class AsyncBaseClient:
             "map": json.dumps(files_map, default=to_jsonable_python),
         }
 
-        return await self.http_client.post(
-            url=self.url, data=data, files=files, **kwargs
+        boundary = uuid4().hex
+        parts = _multipart_parts(boundary, data, files)
+        headers: dict[str, str] = {
+            "Content-Type": f"multipart/form-data; boundary={boundary}"
+        }
+        sizes = [_upload_size(file_) for _, file_, _ in files.values()]
+        if None not in sizes:
+            # Each file is followed by CRLF; the body ends with the closing boundary.
+            length = sum(len(head) for head, _ in parts) + 2 * len(files)
+            length += len(boundary) + 6 + sum(cast(list[int], sizes))
+            headers["Content-Length"] = str(length)
+        headers.update(kwargs.get("headers", {}))
+
+        merged_kwargs: dict[str, Any] = kwargs.copy()
+        merged_kwargs["headers"] = headers
+
+        return await self._post(
+            content=_multipart_stream(boundary, parts), **merged_kwargs
         )
 
     async def _execute_json(
@@ -286,17 +577,11 @@ class AsyncBaseClient:
         query: str,
         operation_name: Optional[str],
         variables: dict[str, Any],
+        cacheable: bool = False,
         **kwargs: Any,
     ) -> httpx.Response:
-        headers: dict[str, str] = {"Content-type": "application/json"}
-        headers.update(kwargs.get("headers", {}))
-
-        merged_kwargs: dict[str, Any] = kwargs.copy()
-        merged_kwargs["headers"] = headers
-
-        return await self.http_client.post(
-            url=self.url,
-            content=json.dumps(
+        return await self._post_json(
+            json.dumps(
                 {
                     "query": query,
                     "operationName": operation_name,
@@ -304,10 +589,67 @@ class AsyncBaseClient:
                 },
                 default=to_jsonable_python,
             ),
-            **merged_kwargs,
+            cacheable=cacheable,
+            **kwargs,
         )
 
-    async def _send_connection_init(self, websocket: ClientConnection) -> None:
+    async def _post_json(
+        self, content: Union[str, bytes], cacheable: bool = False, **kwargs: Any
+    ) -> httpx.Response:
+        headers: dict[str, str] = {"Content-type": "application/json"}
+        headers.update(kwargs.get("headers", {}))
+
+        merged_kwargs: dict[str, Any] = kwargs.copy()
+        merged_kwargs["headers"] = headers
+
+        cache = self.response_cache if cacheable else None
+        if cache is not None:
+            cache_key = self._cache_key(content, headers)
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return httpx.Response(
+                    200,
+                    headers={"Content-Type": "application/json"},
+                    content=cached.body,
+                    request=httpx.Request("POST", self.url),
+                )
+
+        response = await self._post(content=content, **merged_kwargs)
+        # Error responses are not cached, so every caller sees them from the
+        # server; a body mentioning "errors" anywhere is conservatively skipped.
+        if (
+            cache is not None
+            and response.status_code == 200
+            and b'"errors"' not in response.content
+        ):
+            cache.set(cache_key, response.content)
+        return response
+
+    async def _post(self, **kwargs: Any) -> httpx.Response:
+        end = _DEADLINE.get()
+        if end is None or "timeout" in kwargs:
+            return await self.http_client.post(url=self.url, **kwargs)
+        remaining = end - time.monotonic()
+        if remaining <= 0:
+            raise GraphQLClientDeadlineError()
+        try:
+            return await self.http_client.post(
+                url=self.url, timeout=remaining, **kwargs
+            )
+        except httpx.TimeoutException as exc:
+            raise GraphQLClientDeadlineError() from exc
+
+    def _cache_key(self, content: Union[str, bytes], headers: dict[str, str]) -> str:
+        # Headers take part in the key, so clients with different credentials
+        # can share one cache file.
+        digest = hashlib.sha256(self.url.encode())
+        for name, value in sorted({**(self.headers or {}), **headers}.items()):
+            digest.update(f"\0{name.lower()}:{value}".encode())
+        digest.update(b"\0")
+        digest.update(content.encode() if isinstance(content, str) else content)
+        return digest.hexdigest()
+
+    async def _send_connection_init(self, websocket: "ClientConnection") -> None:
         payload: dict[str, Any] = {
             "type": GraphQLTransportWSMessageType.CONNECTION_INIT.value
         }
@@ -317,7 +659,7 @@ class AsyncBaseClient:
 
     async def _send_subscribe(
         self,
-        websocket: ClientConnection,
+        websocket: "ClientConnection",
         operation_id: str,
         query: str,
         operation_name: Optional[str] = None,
@@ -336,8 +678,8 @@ class AsyncBaseClient:
 
     async def _handle_ws_message(
         self,
-        message: Data,
-        websocket: ClientConnection,
+        message: "Data",
+        websocket: "ClientConnection",
         expected_type: Optional[GraphQLTransportWSMessageType] = None,
     ) -> Optional[dict[str, Any]]:
         try:
@@ -1,15 +1,17 @@
 # Generated by ariadne-codegen
 # Source: graphql/ops.graphql
 
+from collections.abc import AsyncIterator
 from typing import Any, Optional, Union
 
-from .async_base_client import AsyncBaseClient
+from .async_base_client import AsyncBaseClient, PreparedOperation, VariablesSerializer
 from .base_model import UNSET, UnsetType
-from .input_types import TransactionQueryInput
+from .input_types import PaginationInput, TransactionQueryInput
 from .mutation_send_raw_transaction import MutationSendRawTransaction
+from .pagination import current_page, iter_items, paginates, with_page
 from .query_eth_syncing import QueryEthSyncing
 from .query_metadata import QueryMetadata
-from .query_transactions import QueryTransactions
+from .query_transactions import QueryTransactions, QueryTransactionsTransactionsItems
 from .query_usage_stat import QueryUsageStat
 from .query_web_3_sha_3 import QueryWeb3Sha3
 
@@ -18,156 +20,106 @@ def gql(q: str) -> str:
     return q
 
 
+_QUERY_METADATA = PreparedOperation(
+    "query query_metadata{metadata{clientVersion chainId netVersion netListening netPeerCount}}",
+    "query_metadata",
+    VariablesSerializer({}),
+)
+_QUERY_ETH_SYNCING = PreparedOperation(
+    "query query_ethSyncing{ethSyncing}", "query_ethSyncing", VariablesSerializer({})
+)
+_QUERY_WEB_3_SHA_3 = PreparedOperation(
+    "query query_web3Sha3($message:String!){web3Sha3(message:$message)}",
+    "query_web3Sha3",
+    VariablesSerializer({"message": str}),
+)
+_QUERY_TRANSACTIONS = PreparedOperation(
+    "query query_transactions($input:TransactionQueryInput){transactions(input:$input){items{blockNumber txIndex hash fromAddress toAddress valueWei gas gasPrice gasUsed nonce txType maxFeePerGas maxPriorityFeePerGas input success logsCount createdAt logs{blockNumber txIndex logIndex txHash blockHash address topics data removed createdAt}internalTransactions{blockNumber txHash traceIndex traceAddress fromAddress toAddress valueWei callType gas gasUsed input output error success createdAt}}pageInfo{hasNextPage hasPreviousPage totalCount currentPage totalPages}}}",
+    "query_transactions",
+    VariablesSerializer({"input": Union[Optional[TransactionQueryInput], UnsetType]}),
+)
+_QUERY_USAGE_STAT = PreparedOperation(
+    "query query_usageStat{usageStat{effectiveness jsonrpcRatio}}",
+    "query_usageStat",
+    VariablesSerializer({}),
+)
+_MUTATION_SEND_RAW_TRANSACTION = PreparedOperation(
+    "mutation mutation_sendRawTransaction($signedTx:String$from:String$to:String$value:String$gas:String$gasPrice:String$input:String$nonce:Int){sendRawTransaction(signedTx:$signedTx from:$from to:$to value:$value gas:$gas gasPrice:$gasPrice input:$input nonce:$nonce)}",
+    "mutation_sendRawTransaction",
+    VariablesSerializer(
+        {
+            "signedTx": Union[Optional[str], UnsetType],
+            "from": Union[Optional[str], UnsetType],
+            "to": Union[Optional[str], UnsetType],
+            "value": Union[Optional[str], UnsetType],
+            "gas": Union[Optional[str], UnsetType],
+            "gasPrice": Union[Optional[str], UnsetType],
+            "input": Union[Optional[str], UnsetType],
+            "nonce": Union[Optional[int], UnsetType],
+        }
+    ),
+)
+
+
 class Client(AsyncBaseClient):
     async def query_metadata(self, **kwargs: Any) -> QueryMetadata:
-        query = gql(
-            """
-            query query_metadata {
-              metadata {
-                clientVersion
-                chainId
-                netVersion
-                netListening
-                netPeerCount
-              }
-            }
-            """
-        )
         variables: dict[str, object] = {}
         response = await self.execute(
-            query=query, operation_name="query_metadata", variables=variables, **kwargs
+            query=_QUERY_METADATA.query,
+            operation_name="query_metadata",
+            variables=variables,
+            prepared=_QUERY_METADATA,
+            **kwargs
         )
-        data = self.get_data(response)
-        return QueryMetadata.model_validate(data)
+        return await self.get_model(response, QueryMetadata)
 
     async def query_eth_syncing(self, **kwargs: Any) -> QueryEthSyncing:
-        query = gql(
-            """
-            query query_ethSyncing {
-              ethSyncing
-            }
-            """
-        )
         variables: dict[str, object] = {}
         response = await self.execute(
-            query=query,
+            query=_QUERY_ETH_SYNCING.query,
             operation_name="query_ethSyncing",
             variables=variables,
+            prepared=_QUERY_ETH_SYNCING,
             **kwargs
         )
-        data = self.get_data(response)
-        return QueryEthSyncing.model_validate(data)
+        return await self.get_model(response, QueryEthSyncing)
 
     async def query_web_3_sha_3(self, message: str, **kwargs: Any) -> QueryWeb3Sha3:
-        query = gql(
-            """
-            query query_web3Sha3($message: String!) {
-              web3Sha3(message: $message)
-            }
-            """
-        )
         variables: dict[str, object] = {"message": message}
         response = await self.execute(
-            query=query, operation_name="query_web3Sha3", variables=variables, **kwargs
+            query=_QUERY_WEB_3_SHA_3.query,
+            operation_name="query_web3Sha3",
+            variables=variables,
+            prepared=_QUERY_WEB_3_SHA_3,
+            **kwargs
         )
-        data = self.get_data(response)
-        return QueryWeb3Sha3.model_validate(data)
+        return await self.get_model(response, QueryWeb3Sha3)
 
     async def query_transactions(
         self,
         input: Union[Optional[TransactionQueryInput], UnsetType] = UNSET,
         **kwargs: Any
     ) -> QueryTransactions:
-        query = gql(
-            """
-            query query_transactions($input: TransactionQueryInput) {
-              transactions(input: $input) {
-                items {
-                  blockNumber
-                  txIndex
-                  hash
-                  fromAddress
-                  toAddress
-                  valueWei
-                  gas
-                  gasPrice
-                  gasUsed
-                  nonce
-                  txType
-                  maxFeePerGas
-                  maxPriorityFeePerGas
-                  input
-                  success
-                  logsCount
-                  createdAt
-                  logs {
-                    blockNumber
-                    txIndex
-                    logIndex
-                    txHash
-                    blockHash
-                    address
-                    topics
-                    data
-                    removed
-                    createdAt
-                  }
-                  internalTransactions {
-                    blockNumber
-                    txHash
-                    traceIndex
-                    traceAddress
-                    fromAddress
-                    toAddress
-                    valueWei
-                    callType
-                    gas
-                    gasUsed
-                    input
-                    output
-                    error
-                    success
-                    createdAt
-                  }
-                }
-                pageInfo {
-                  hasNextPage
-                  hasPreviousPage
-                  totalCount
-                  currentPage
-                  totalPages
-                }
-              }
-            }
-            """
-        )
         variables: dict[str, object] = {"input": input}
         response = await self.execute(
-            query=query,
+            query=_QUERY_TRANSACTIONS.query,
             operation_name="query_transactions",
             variables=variables,
+            prepared=_QUERY_TRANSACTIONS,
             **kwargs
         )
-        data = self.get_data(response)
-        return QueryTransactions.model_validate(data)
+        return await self.get_model(response, QueryTransactions)
 
     async def query_usage_stat(self, **kwargs: Any) -> QueryUsageStat:
-        query = gql(
-            """
-            query query_usageStat {
-              usageStat {
-                effectiveness
-                jsonrpcRatio
-              }
-            }
-            """
-        )
         variables: dict[str, object] = {}
         response = await self.execute(
-            query=query, operation_name="query_usageStat", variables=variables, **kwargs
+            query=_QUERY_USAGE_STAT.query,
+            operation_name="query_usageStat",
+            variables=variables,
+            prepared=_QUERY_USAGE_STAT,
+            **kwargs
         )
-        data = self.get_data(response)
-        return QueryUsageStat.model_validate(data)
+        return await self.get_model(response, QueryUsageStat)
 
     async def mutation_send_raw_transaction(
         self,
@@ -181,22 +133,6 @@ class Client(AsyncBaseClient):
         nonce: Union[Optional[int], UnsetType] = UNSET,
         **kwargs: Any
     ) -> MutationSendRawTransaction:
-        query = gql(
-            """
-            mutation mutation_sendRawTransaction($signedTx: String, $from: String, $to: String, $value: String, $gas: String, $gasPrice: String, $input: String, $nonce: Int) {
-              sendRawTransaction(
-                signedTx: $signedTx
-                from: $from
-                to: $to
-                value: $value
-                gas: $gas
-                gasPrice: $gasPrice
-                input: $input
-                nonce: $nonce
-              )
-            }
-            """
-        )
         variables: dict[str, object] = {
             "signedTx": signed_tx,
             "from": from_,
@@ -208,10 +144,59 @@ class Client(AsyncBaseClient):
             "nonce": nonce,
         }
         response = await self.execute(
-            query=query,
+            query=_MUTATION_SEND_RAW_TRANSACTION.query,
             operation_name="mutation_sendRawTransaction",
             variables=variables,
+            prepared=_MUTATION_SEND_RAW_TRANSACTION,
             **kwargs
         )
-        data = self.get_data(response)
-        return MutationSendRawTransaction.model_validate(data)
+        return await self.get_model(response, MutationSendRawTransaction)
+
+    @paginates("query_transactions")
+    def iter_transactions(
+        self,
+        input: Union[Optional[TransactionQueryInput], UnsetType] = UNSET,
+        *,
+        page_size: Optional[int] = None,
+        limit: Optional[int] = None,
+        prefetch: int = 2,
+        max_concurrency: int = 4,
+        **kwargs: Any
+    ) -> AsyncIterator[QueryTransactionsTransactionsItems]:
+        return iter_items(
+            lambda page: self.query_transactions(
+                input=with_page(input, TransactionQueryInput, "pagination", page),
+                **kwargs
+            ),
+            PaginationInput,
+            connection="transactions",
+            items="items",
+            start=current_page(input, "pagination"),
+            page_size=page_size,
+            limit=limit,
+            prefetch=prefetch,
+            max_concurrency=max_concurrency,
+        )
+
+    @paginates("query_transactions")
+    async def fetch_all_transactions(
+        self,
+        input: Union[Optional[TransactionQueryInput], UnsetType] = UNSET,
+        *,
+        page_size: Optional[int] = None,
+        limit: Optional[int] = None,
+        prefetch: int = 2,
+        max_concurrency: int = 4,
+        **kwargs: Any
+    ) -> list[QueryTransactionsTransactionsItems]:
+        return [
+            item
+            async for item in self.iter_transactions(
+                input,
+                page_size=page_size,
+                limit=limit,
+                prefetch=prefetch,
+                max_concurrency=max_concurrency,
+                **kwargs
+            )
+        ]
@@ -0,0 +1,271 @@
+import sys
+from collections.abc import Iterable, Mapping
+from typing import Any, ClassVar, Optional, TypeVar, Union
+
+R = TypeVar("R", bound="CompactRecord")
+
+# How a field is kept: numbers as `int`, repeated strings (addresses, hashes,
+# timestamps) interned, hex payloads as `bytes`, anything else as it came.
+INT = "int"
+TEXT = "text"
+HEX = "hex"
+TEXTS = "texts"
+KEEP = "keep"
+
+
+def _to_int(value: Any) -> Optional[int]:
+    if value is None or isinstance(value, int):
+        return value
+    return int(value, 16) if value.startswith("0x") else int(value)
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return None if value is None else sys.intern(value)
+
+
+def _to_bytes(value: Optional[str]) -> Union[bytes, str, None]:
+    # Mixed-case or malformed hex stays a string, so it reads back unchanged.
+    if value is None or not (value.startswith("0x") and value.islower()):
+        return value
+    try:
+        return bytes.fromhex(value[2:])
+    except ValueError:
+        return value
+
+
+def _to_hex(value: Union[bytes, str, None]) -> Optional[str]:
+    return "0x" + value.hex() if isinstance(value, bytes) else value
+
+
+def _hex_property(name: str) -> property:
+    slot = f"_{name}"
+
+    def get(self: Any) -> Optional[str]:
+        return _to_hex(getattr(self, slot))
+
+    return property(get, doc=f"`{name}` as a 0x-prefixed hex string.")
+
+
+class CompactRecord:
+    """Slotted, memory-lean copy of one generated result object.
+
+    `FIELDS` lists `(attribute, GraphQL name, kind)`. Attributes keep the
+    names of the generated models, so `compile_filter` and `TransactionIndex`
+    accept compact records too. Hex fields are held as `bytes` in
+    `_<attribute>` and converted back to strings only when read.
+    """
+
+    __slots__ = ()
+    # GraphQL name of the list holding records of this type in their parent.
+    ALIAS: ClassVar[str] = ""
+    FIELDS: ClassVar[tuple[tuple[str, str, str], ...]] = ()
+    CHILDREN: ClassVar[dict[str, type["CompactRecord"]]] = {}
+
+    @classmethod
+    def _slot(cls, name: str, kind: str) -> str:
+        return f"_{name}" if kind == HEX else name
+
+    @classmethod
+    def _build(cls: type[R], values: Iterable[tuple[str, str, Any]]) -> R:
+        record = object.__new__(cls)
+        for name, kind, value in values:
+            if kind == INT:
+                value = _to_int(value)
+            elif kind == TEXT:
+                value = _intern(value)
+            elif kind == HEX:
+                value = _to_bytes(value)
+            elif kind == TEXTS:
+                value = None if value is None else tuple(map(sys.intern, value))
+            setattr(record, cls._slot(name, kind), value)
+        return record
+
+    @classmethod
+    def from_item(cls: type[R], item: Any) -> R:
+        """Compact copy of a generated model or msgspec struct."""
+        record = cls._build(
+            (name, kind, getattr(item, name)) for name, _, kind in cls.FIELDS
+        )
+        for name, child in cls.CHILDREN.items():
+            setattr(record, name, tuple(map(child.from_item, getattr(item, name))))
+        return record
+
+    @classmethod
+    def from_dict(cls: type[R], data: Mapping[str, Any]) -> R:
+        """Compact copy of a decoded JSON object, skipping the models."""
+        record = cls._build(
+            (name, kind, data.get(alias)) for name, alias, kind in cls.FIELDS
+        )
+        for name, child in cls.CHILDREN.items():
+            alias = child.ALIAS
+            setattr(record, name, tuple(map(child.from_dict, data.get(alias) or ())))
+        return record
+
+    def to_dict(self) -> dict[str, Any]:
+        """The JSON object the server sent, with numbers in decimal."""
+        data: dict[str, Any] = {}
+        for name, alias, kind in self.FIELDS:
+            value = getattr(self, self._slot(name, kind))
+            if kind == INT:
+                value = None if value is None else str(value)
+            elif kind == HEX:
+                value = _to_hex(value)
+            elif kind == TEXTS:
+                value = None if value is None else list(value)
+            data[alias] = value
+        for name, child in self.CHILDREN.items():
+            data[child.ALIAS] = [record.to_dict() for record in getattr(self, name)]
+        return data
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(
+            getattr(self, slot) == getattr(other, slot) for slot in self.__slots__
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        fields = ", ".join(
+            f"{name}={getattr(self, name)!r}" for name, _, _ in self.FIELDS
+        )
+        return f"{type(self).__name__}({fields})"
+
+
+class CompactLog(CompactRecord):
+    __slots__ = (
+        "block_number",
+        "tx_index",
+        "log_index",
+        "tx_hash",
+        "block_hash",
+        "address",
+        "topics",
+        "_data",
+        "removed",
+        "created_at",
+    )
+    ALIAS = "logs"
+    FIELDS = (
+        ("block_number", "blockNumber", INT),
+        ("tx_index", "txIndex", INT),
+        ("log_index", "logIndex", INT),
+        ("tx_hash", "txHash", TEXT),
+        ("block_hash", "blockHash", TEXT),
+        ("address", "address", TEXT),
+        ("topics", "topics", TEXTS),
+        ("data", "data", HEX),
+        ("removed", "removed", KEEP),
+        ("created_at", "createdAt", TEXT),
+    )
+    data = _hex_property("data")
+
+
+class CompactInternalTransaction(CompactRecord):
+    __slots__ = (
+        "block_number",
+        "tx_hash",
+        "trace_index",
+        "trace_address",
+        "from_address",
+        "to_address",
+        "value_wei",
+        "call_type",
+        "gas",
+        "gas_used",
+        "_input",
+        "_output",
+        "error",
+        "success",
+        "created_at",
+    )
+    ALIAS = "internalTransactions"
+    FIELDS = (
+        ("block_number", "blockNumber", INT),
+        ("tx_hash", "txHash", TEXT),
+        ("trace_index", "traceIndex", INT),
+        ("trace_address", "traceAddress", TEXT),
+        ("from_address", "fromAddress", TEXT),
+        ("to_address", "toAddress", TEXT),
+        ("value_wei", "valueWei", INT),
+        ("call_type", "callType", TEXT),
+        ("gas", "gas", INT),
+        ("gas_used", "gasUsed", INT),
+        ("input", "input", HEX),
+        ("output", "output", HEX),
+        ("error", "error", KEEP),
+        ("success", "success", KEEP),
+        ("created_at", "createdAt", TEXT),
+    )
+    input = _hex_property("input")
+    output = _hex_property("output")
+
+
+class CompactTransaction(CompactRecord):
+    """Compact `QueryTransactionsTransactionsItems`.
+
+    Numbers are ints, addresses, hashes and topics are interned, so the copies
+    repeated across logs share one string, and `input`/`data`/`output` are
+    held as bytes. `to_dict()` rebuilds the response object;
+    `QueryTransactionsTransactionsItems.model_validate(record.to_dict())`
+    gives the generated model back.
+    """
+
+    __slots__ = (
+        "block_number",
+        "tx_index",
+        "hash",
+        "from_address",
+        "to_address",
+        "value_wei",
+        "gas",
+        "gas_price",
+        "gas_used",
+        "nonce",
+        "tx_type",
+        "max_fee_per_gas",
+        "max_priority_fee_per_gas",
+        "_input",
+        "success",
+        "logs_count",
+        "created_at",
+        "logs",
+        "internal_transactions",
+    )
+    FIELDS = (
+        ("block_number", "blockNumber", INT),
+        ("tx_index", "txIndex", INT),
+        ("hash", "hash", TEXT),
+        ("from_address", "fromAddress", TEXT),
+        ("to_address", "toAddress", TEXT),
+        ("value_wei", "valueWei", INT),
+        ("gas", "gas", INT),
+        ("gas_price", "gasPrice", INT),
+        ("gas_used", "gasUsed", INT),
+        ("nonce", "nonce", INT),
+        ("tx_type", "txType", INT),
+        ("max_fee_per_gas", "maxFeePerGas", INT),
+        ("max_priority_fee_per_gas", "maxPriorityFeePerGas", INT),
+        ("input", "input", HEX),
+        ("success", "success", KEEP),
+        ("logs_count", "logsCount", INT),
+        ("created_at", "createdAt", TEXT),
+    )
+    CHILDREN = {
+        "logs": CompactLog,
+        "internal_transactions": CompactInternalTransaction,
+    }
+    input = _hex_property("input")
+
+
+def compact_transactions(items: Iterable[Any]) -> list[CompactTransaction]:
+    """Compact copies of transaction items, models or decoded JSON objects."""
+    return [
+        (
+            CompactTransaction.from_dict(item)
+            if isinstance(item, Mapping)
+            else CompactTransaction.from_item(item)
+        )
+        for item in items
+    ]
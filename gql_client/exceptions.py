@@ -26,6 +26,16 @@ class GraphQLClientInvalidResponseError(GraphQLClientError):
         return "Invalid response format."
 
 
+class GraphQLClientDeadlineError(GraphQLClientError, TimeoutError):
+    def __init__(self, seconds: Optional[float] = None) -> None:
+        self.seconds = seconds
+
+    def __str__(self) -> str:
+        if self.seconds is None:
+            return "Deadline exceeded."
+        return f"Deadline of {self.seconds:g}s exceeded."
+
+
 class GraphQLClientGraphQLError(GraphQLClientError):
     def __init__(
         self,
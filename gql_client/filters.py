@@ -0,0 +1,264 @@
+import operator
+import re
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterable
+from datetime import datetime
+from typing import Any, Optional
+
+from .input_types import (
+    BigIntFilter,
+    DateTimeFilter,
+    IntFilter,
+    TransactionFilterInput,
+)
+from .query_transactions import QueryTransactionsTransactionsItems
+
+Predicate = Callable[[QueryTransactionsTransactionsItems], bool]
+ValueTest = Callable[[Any], bool]
+
+COMBINATORS = ("and_", "or_", "not_")
+HASH_INDEXED = ("hash", "from_address", "to_address")
+SORTED_INDEXED = ("block_number",)
+HASH_OPS = {"eq", "in_"}
+RANGE_OPS = {"eq", "gt", "gte", "lt", "lte", "between"}
+
+COMPARISONS: dict[str, Callable[[Any, Any], bool]] = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "gt": operator.gt,
+    "gte": operator.ge,
+    "lt": operator.lt,
+    "lte": operator.le,
+}
+
+
+def parse_datetime(value: Any) -> datetime:
+    """`DateTime` scalar, as sent by the server, as an aware `datetime`."""
+    if isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+
+
+def _converter(filter_: Any) -> Callable[[Any], Any]:
+    """Map a raw response value (always a string) to the filter's domain."""
+    if isinstance(filter_, (IntFilter, BigIntFilter)):
+        return int
+    if isinstance(filter_, DateTimeFilter):
+        return parse_datetime
+    return lambda value: value
+
+
+def operations(filter_: Any) -> Iterable[tuple[str, Any]]:
+    """`(field, argument)` pairs set on a filter input, in declaration order."""
+    for name in type(filter_).model_fields:
+        arg = getattr(filter_, name)
+        if arg is not None:
+            yield name, arg
+
+
+def _operation_test(op: str, arg: Any, convert: Callable[[Any], Any]) -> ValueTest:
+    if op in COMPARISONS:
+        compare, bound = COMPARISONS[op], convert(arg)
+        return lambda value: compare(value, bound)
+    if op == "in_":
+        members = frozenset(convert(a) for a in arg)
+        return members.__contains__
+    if op == "not_in":
+        members = frozenset(convert(a) for a in arg)
+        return lambda value: value not in members
+    if op == "between":
+        low, high = (convert(a) for a in arg)
+        return lambda value: low <= value <= high
+    if op == "contains":
+        return lambda value: arg in value
+    if op == "not_contains":
+        return lambda value: arg not in value
+    if op == "starts_with":
+        return lambda value: value.startswith(arg)
+    if op == "ends_with":
+        return lambda value: value.endswith(arg)
+    if op == "regex":
+        pattern = re.compile(arg)
+        return lambda value: pattern.search(value) is not None
+    if op == "not_regex":
+        pattern = re.compile(arg)
+        return lambda value: pattern.search(value) is None
+    raise ValueError(f"Unsupported filter operation: {op}")
+
+
+def value_test(filter_: Any) -> ValueTest:
+    """Compile a scalar filter into a test over already converted values.
+
+    Operations of one filter are AND-ed. As in SQL, a null value fails every
+    operation except `isNull: true`, so it matches only a filter made of
+    `isNull: true` alone.
+    """
+    is_null: Optional[bool] = None
+    convert = _converter(filter_)
+    tests: list[ValueTest] = []
+    for op, arg in operations(filter_):
+        if op == "is_null":
+            is_null = arg
+        else:
+            tests.append(_operation_test(op, arg, convert))
+
+    def test(value: Any) -> bool:
+        if value is None:
+            return is_null is True and not tests
+        if is_null is True:
+            return False
+        return all(check(value) for check in tests)
+
+    return test
+
+
+def compile_filter(filter_: TransactionFilterInput) -> Predicate:
+    """Compile `filter_` into a predicate over transaction items.
+
+    Use it to check single items; `TransactionIndex` is faster when the same
+    items are filtered repeatedly.
+    """
+    parts: list[Predicate] = []
+    for name, arg in operations(filter_):
+        if name == "and_":
+            preds = [compile_filter(sub) for sub in arg]
+            parts.append(lambda item, preds=preds: all(p(item) for p in preds))
+        elif name == "or_":
+            preds = [compile_filter(sub) for sub in arg]
+            if preds:
+                parts.append(lambda item, preds=preds: any(p(item) for p in preds))
+        elif name == "not_":
+            pred = compile_filter(arg)
+            parts.append(lambda item, pred=pred: not pred(item))
+        else:
+            test, convert = value_test(arg), _converter(arg)
+
+            def field_test(item: Any, name=name, test=test, convert=convert) -> bool:
+                raw = getattr(item, name)
+                return test(None if raw is None else convert(raw))
+
+            parts.append(field_test)
+    return lambda item: all(part(item) for part in parts)
+
+
+class TransactionIndex:
+    """Column store over transaction items for repeated local filtering.
+
+    Field values are parsed once into per-field columns when a filter first
+    touches them. `eq`/`in` on `hash`, `fromAddress` and `toAddress` go through
+    hash indexes, and `blockNumber` ranges are resolved by bisecting a sorted
+    index. Other operations scan only the rows that are still candidates.
+    """
+
+    def __init__(self, items: Iterable[QueryTransactionsTransactionsItems]) -> None:
+        self.items = list(items)
+        self._columns: dict[str, list[Any]] = {}
+        self._hash_indexes: dict[str, dict[Any, list[int]]] = {}
+        self._sorted_indexes: dict[str, tuple[list[Any], list[int]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def column(self, name: str, filter_: Any) -> list[Any]:
+        column = self._columns.get(name)
+        if column is None:
+            convert = _converter(filter_)
+            column = [
+                None if (raw := getattr(item, name)) is None else convert(raw)
+                for item in self.items
+            ]
+            self._columns[name] = column
+        return column
+
+    def _hash_index(self, name: str, filter_: Any) -> dict[Any, list[int]]:
+        index = self._hash_indexes.get(name)
+        if index is None:
+            index = {}
+            for row, value in enumerate(self.column(name, filter_)):
+                index.setdefault(value, []).append(row)
+            self._hash_indexes[name] = index
+        return index
+
+    def _sorted_index(self, name: str, filter_: Any) -> tuple[list[Any], list[int]]:
+        index = self._sorted_indexes.get(name)
+        if index is None:
+            column = self.column(name, filter_)
+            rows = sorted(
+                (row for row, value in enumerate(column) if value is not None),
+                key=column.__getitem__,
+            )
+            index = ([column[row] for row in rows], rows)
+            self._sorted_indexes[name] = index
+        return index
+
+    def _lookup(self, name: str, filter_: Any) -> tuple[Optional[set[int]], bool]:
+        """Rows an index allows for `filter_`, or None if no index applies.
+
+        The flag is true when the index answered every operation of `filter_`,
+        so the rows need no further check.
+        """
+        ops = {op for op, _ in operations(filter_)}
+        if name in HASH_INDEXED and ops & HASH_OPS:
+            keys = [filter_.eq] if filter_.eq is not None else filter_.in_
+            index = self._hash_index(name, filter_)
+            allowed = {row for key in keys for row in index.get(key, ())}
+            return allowed, len(ops) == 1
+        if name in SORTED_INDEXED and ops & RANGE_OPS:
+            values, rows = self._sorted_index(name, filter_)
+            low, high = 0, len(values)
+            for op in ops & RANGE_OPS:
+                arg = getattr(filter_, op)
+                lower, upper = (arg[0], arg[1]) if op == "between" else (arg, arg)
+                if op in ("eq", "gte", "between"):
+                    low = max(low, bisect_left(values, lower))
+                if op == "gt":
+                    low = max(low, bisect_right(values, lower))
+                if op in ("eq", "lte", "between"):
+                    high = min(high, bisect_right(values, upper))
+                if op == "lt":
+                    high = min(high, bisect_left(values, upper))
+            return set(rows[low:high]), ops <= RANGE_OPS
+        return None, False
+
+    def rows(
+        self, filter_: TransactionFilterInput, candidates: Optional[list[int]] = None
+    ) -> list[int]:
+        """Ascending positions of the items matching `filter_`."""
+        current = candidates
+        scans = []
+        for name, arg in operations(filter_):
+            if name in COMBINATORS:
+                continue
+            allowed, exact = self._lookup(name, arg)
+            if not exact:
+                scans.append((name, arg))
+            if allowed is None:
+                continue
+            if current is None:
+                current = sorted(allowed)
+            else:
+                current = [row for row in current if row in allowed]
+        if current is None:
+            current = list(range(len(self.items)))
+        for name, arg in scans:
+            column, test = self.column(name, arg), value_test(arg)
+            current = [row for row in current if test(column[row])]
+
+        for sub in filter_.and_ or ():
+            current = self.rows(sub, current)
+        if filter_.or_:
+            matched = set()
+            for sub in filter_.or_:
+                matched.update(self.rows(sub, current))
+            current = [row for row in current if row in matched]
+        if filter_.not_ is not None:
+            excluded = set(self.rows(filter_.not_, current))
+            current = [row for row in current if row not in excluded]
+        return current
+
+    def filter(
+        self, filter_: Optional[TransactionFilterInput]
+    ) -> list[QueryTransactionsTransactionsItems]:
+        if filter_ is None:
+            return list(self.items)
+        return [self.items[row] for row in self.rows(filter_)]
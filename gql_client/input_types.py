@@ -107,7 +107,3 @@ class PaginationInput(BaseModel):
 class TransactionOrderByInput(BaseModel):
     field: TransactionOrderField
     direction: SortDirection
-
-
-TransactionQueryInput.model_rebuild()
-TransactionFilterInput.model_rebuild()
@@ -0,0 +1,156 @@
+from collections.abc import AsyncIterator
+from typing import Any, NamedTuple, Optional, Union
+
+from .base_model import UNSET, UnsetType
+from .client import Client
+from .enums import SortDirection, TransactionOrderField
+from .input_types import (
+    IntFilter,
+    PaginationInput,
+    TransactionFilterInput,
+    TransactionOrderByInput,
+    TransactionQueryInput,
+)
+from .normalize import UnsatisfiableFilter, normalize_query_input
+from .pagination import DEFAULT_PAGE_SIZE, current_page
+from .query_transactions import QueryTransactionsTransactionsItems
+
+
+class TransactionCursor(NamedTuple):
+    """Position of a transaction in `(blockNumber, txIndex)` order."""
+
+    block_number: int
+    tx_index: int
+
+    @classmethod
+    def of(cls, item: QueryTransactionsTransactionsItems) -> "TransactionCursor":
+        if item.block_number is None or item.tx_index is None:
+            raise ValueError(
+                "Keyset scans need blockNumber and txIndex on every transaction"
+            )
+        return cls(int(item.block_number), int(item.tx_index))
+
+
+def keyset_filter(
+    cursor: TransactionCursor, descending: bool = False
+) -> TransactionFilterInput:
+    """Filter matching transactions strictly after `cursor` in scan order.
+
+    `blockNumber >= b AND (blockNumber > b OR txIndex > i)` for ascending
+    scans (mirrored for descending ones). The bound on `blockNumber` alone lets
+    the server seek on its block index; the second clause resumes inside the
+    cursor's block, so boundary blocks are neither repeated nor skipped.
+    """
+    block, index = cursor
+    if descending:
+        seek, before, after = (
+            IntFilter(lte=block),
+            IntFilter(lt=block),
+            IntFilter(lt=index),
+        )
+    else:
+        seek, before, after = (
+            IntFilter(gte=block),
+            IntFilter(gt=block),
+            IntFilter(gt=index),
+        )
+    return TransactionFilterInput(
+        and_=[
+            TransactionFilterInput(block_number=seek),
+            TransactionFilterInput(
+                or_=[
+                    TransactionFilterInput(block_number=before),
+                    TransactionFilterInput(tx_index=after),
+                ]
+            ),
+        ]
+    )
+
+
+def keyset_input(
+    input: Union[Optional[TransactionQueryInput], UnsetType],
+    cursor: Optional[TransactionCursor],
+    page_size: int,
+    descending: bool = False,
+) -> TransactionQueryInput:
+    """`input` rewritten to fetch the page following `cursor`.
+
+    User filters are kept and AND-ed with the cursor bound; ordering is forced
+    to `BLOCK_NUMBER, TX_INDEX` and the offset is always 0. A non-zero offset
+    on `input` raises `ValueError`: keyset scans resume from a cursor, so use
+    `after=` instead.
+    """
+    page = current_page(input, "pagination")
+    if page is not None and page.offset:
+        raise ValueError(
+            "Keyset scans do not take a pagination offset; resume with after="
+        )
+    direction = SortDirection.DESC if descending else SortDirection.ASC
+    update: dict[str, Any] = {
+        "pagination": PaginationInput(limit=page_size, offset=0),
+        "order_by": [
+            TransactionOrderByInput(
+                field=TransactionOrderField.BLOCK_NUMBER, direction=direction
+            ),
+            TransactionOrderByInput(
+                field=TransactionOrderField.TX_INDEX, direction=direction
+            ),
+        ],
+    }
+    if cursor is not None:
+        bound = keyset_filter(cursor, descending)
+        filters = None if input is UNSET or input is None else input.filters
+        update["filters"] = (
+            TransactionFilterInput(and_=[filters, *bound.and_]) if filters else bound
+        )
+    if input is UNSET or input is None:
+        return TransactionQueryInput(**update)
+    return input.model_copy(update=update)
+
+
+async def scan_transactions(
+    client: Client,
+    input: Union[Optional[TransactionQueryInput], UnsetType] = UNSET,
+    *,
+    page_size: Optional[int] = None,
+    limit: Optional[int] = None,
+    after: Optional[TransactionCursor] = None,
+    descending: bool = False,
+    **kwargs: Any,
+) -> AsyncIterator[QueryTransactionsTransactionsItems]:
+    """Yield transactions matching `input` in `(blockNumber, txIndex)` order.
+
+    Unlike `Client.iter_transactions`, pages are requested with a keyset
+    cursor instead of a growing offset, so every page costs the server the
+    same regardless of depth. Pages are fetched one after another since each
+    depends on the last row of the previous one. Pass `after` (for example
+    `TransactionCursor.of(last_item)`) to resume an interrupted scan; a
+    non-zero `pagination.offset` on `input` raises `ValueError`. Filters are
+    normalized first; unsatisfiable ones yield nothing without a request.
+
+    A short page does not end the scan, since servers may cap the page size
+    below `page_size`; only an empty page or `hasNextPage: false` does.
+    """
+    try:
+        input = normalize_query_input(input)
+    except UnsatisfiableFilter:
+        return
+    page = current_page(input, "pagination")
+    size = page_size or (page.limit if page is not None else DEFAULT_PAGE_SIZE)
+    cursor = after
+    emitted = 0
+    while limit is None or emitted < limit:
+        result = await client.query_transactions(
+            input=keyset_input(input, cursor, size, descending), **kwargs
+        )
+        connection = result.transactions
+        if connection is None or not connection.items:
+            return
+        for item in connection.items:
+            if limit is not None and emitted >= limit:
+                return
+            emitted += 1
+            yield item
+        cursor = TransactionCursor.of(connection.items[-1])
+        if not connection.page_info.has_next_page:
+            return
@@ -0,0 +1,171 @@
+import functools
+import typing
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    Optional,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+from pydantic_core import PydanticUndefined, ValidationError
+
+M = TypeVar("M", bound=BaseModel)
+
+Convert = Callable[[Any], Any]
+
+
+class _Field:
+    __slots__ = ("alias", "required", "default", "convert")
+
+    def __init__(
+        self, alias: str, required: bool, default: Any, convert: Convert
+    ) -> None:
+        self.alias = alias
+        self.required = required
+        self.default = default
+        self.convert = convert
+
+
+def _model_of(annotation: Any) -> tuple[Optional[type[BaseModel]], bool]:
+    """Model class behind `annotation` and whether it is a list of them.
+
+    Optional wrappers are looked through; anything else gives None.
+    """
+    args = get_args(annotation)
+    if get_origin(annotation) is Union:
+        members = [arg for arg in args if arg is not type(None)]
+        if len(members) != 1:
+            return None, False
+        return _model_of(members[0])
+    if get_origin(annotation) is list and args:
+        model, nested = _model_of(args[0])
+        return (model, True) if model is not None and not nested else (None, False)
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation, False
+    return None, False
+
+
+def _converter(annotation: Any, config: ConfigDict) -> Convert:
+    model, many = _model_of(annotation)
+    if model is None:
+        return TypeAdapter(annotation, config=config).validate_python
+    if many:
+        return lambda raw: None if raw is None else [LazyView(model, r) for r in raw]
+    return lambda raw: None if raw is None else LazyView(model, raw)
+
+
+@functools.cache
+def _fields(model: type[BaseModel]) -> dict[str, _Field]:
+    # Generated models refer to each other by name; resolve those here rather
+    # than building the model's whole validator.
+    hints = typing.get_type_hints(model)
+    config = ConfigDict(
+        arbitrary_types_allowed=model.model_config.get("arbitrary_types_allowed", False)
+    )
+    return {
+        name: _Field(
+            alias=info.alias or name,
+            required=info.is_required(),
+            default=info.default,
+            convert=_converter(hints[name], config),
+        )
+        for name, info in model.model_fields.items()
+    }
+
+
+def _located(exc: ValidationError, alias: str) -> list[Any]:
+    return [
+        {
+            "type": error["type"],
+            "loc": (alias, *error["loc"]),
+            "input": error["input"],
+            **({"ctx": error["ctx"]} if "ctx" in error else {}),
+        }
+        for error in exc.errors()
+    ]
+
+
+class LazyView(Generic[M]):
+    """Read-only view of a decoded result that validates fields on access.
+
+    Wraps the `data` dict of a response and the generated `model` it would be
+    validated into. Reading a field validates just that value and caches it
+    on the view; nested result objects and lists of them become views in
+    turn, so a page of transactions costs nothing until its fields are read.
+    Other attributes of the model, such as `model_dump_json`, validate the
+    whole object first.
+    """
+
+    __slots__ = ("_model", "_data", "__dict__")
+
+    def __init__(self, model: type[M], data: dict[str, Any]) -> None:
+        self._model = model
+        self._data = data
+
+    @property
+    def raw(self) -> dict[str, Any]:
+        return self._data
+
+    def to_model(self) -> M:
+        """The fully validated model, built once."""
+        model = self.__dict__.get("_validated")
+        if model is None:
+            model = self.__dict__["_validated"] = self._model.model_validate(self._data)
+        return model
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            # Also looked up by copy and pickle before `_model` is set.
+            raise AttributeError(f"LazyView has no attribute {name!r}")
+        field = _fields(self._model).get(name)
+        if field is None:
+            if not hasattr(self._model, name):
+                raise AttributeError(
+                    f"{self._model.__name__!r} view has no attribute {name!r}"
+                )
+            return getattr(self.to_model(), name)
+        raw = self._data.get(field.alias, PydanticUndefined)
+        if raw is PydanticUndefined:
+            if field.required:
+                raise ValidationError.from_exception_data(
+                    self._model.__name__,
+                    [{"type": "missing", "loc": (field.alias,), "input": self._data}],
+                )
+            value = field.default
+        else:
+            try:
+                value = field.convert(raw)
+            except ValidationError as exc:
+                # Reported as the model would, located at the field.
+                raise ValidationError.from_exception_data(
+                    self._model.__name__, _located(exc, field.alias)
+                ) from None
+        # Cached as a plain attribute, so later reads skip `__getattr__`.
+        self.__dict__[name] = value
+        return value
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in ("_model", "_data"):
+            object.__setattr__(self, name, value)
+            return
+        raise AttributeError(f"{self._model.__name__!r} view is read-only")
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LazyView):
+            return self._model is other._model and self._data == other._data
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"LazyView({self._model.__name__}, {len(self._data)} fields)"
+
+
+def lazy_view(model: type[M], data: dict[str, Any]) -> M:
+    """`data` as a `LazyView` of `model`, typed as the model it stands in for."""
+    return typing.cast(M, LazyView(model, data))
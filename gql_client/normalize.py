@@ -0,0 +1,370 @@
+import hashlib
+import json
+from collections.abc import Callable
+from typing import Any, Optional, Union
+
+from .base_model import UNSET, UnsetType
+from .client import Client
+from .filters import COMBINATORS, operations, parse_datetime, value_test
+from .input_types import (
+    BigIntFilter,
+    DateTimeFilter,
+    IntFilter,
+    TransactionFilterInput,
+    TransactionQueryInput,
+)
+from .query_transactions import QueryTransactions
+
+INTEGER_TYPES = (IntFilter, BigIntFilter)
+
+
+class UnsatisfiableFilter(ValueError):
+    """Raised when a filter provably matches no transaction."""
+
+
+def _canonical_json(filter_: Optional[TransactionFilterInput]) -> str:
+    if filter_ is None:
+        return "{}"
+    dumped = filter_.model_dump(by_alias=True, exclude_none=True, mode="json")
+    return json.dumps(dumped, sort_keys=True, separators=(",", ":"))
+
+
+def _canonical_value(kind: type, value: Any) -> Any:
+    if kind is BigIntFilter:
+        return str(int(value))
+    return value
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+CONVERTERS = {IntFilter: int, BigIntFilter: int, DateTimeFilter: parse_datetime}
+
+
+class _FieldConstraint:
+    """AND of any number of scalar filters on one field."""
+
+    def __init__(self, filter_: Any) -> None:
+        self.kind = type(filter_)
+        self.convert = CONVERTERS.get(self.kind, _identity)
+        self.candidates: list[list[Any]] = []
+        self.excluded: list[Any] = []
+        self.bounds: list[tuple[str, Any]] = []
+        self.single: dict[str, Any] = {}
+        self.is_null: Optional[bool] = None
+        # Whether some filter added has an operation other than `isNull`, or
+        # none at all; either way it rejects nulls.
+        self.needs_value = False
+        self.add(filter_)
+
+    def add(self, filter_: Any) -> dict[str, Any]:
+        """AND `filter_` in.
+
+        Returns the operations that need a separate filter object: a second
+        value for an operation such as `contains`. The smaller value stays
+        here so the result does not depend on the order filters are added in.
+        """
+        leftover: dict[str, Any] = {}
+        ops = list(operations(filter_))
+        if not ops or any(op != "is_null" for op, _ in ops):
+            self.needs_value = True
+        for op, arg in ops:
+            if op in self.single and self.single[op] != arg:
+                keep, move = sorted((self.single[op], arg))
+                self.single[op], leftover[op] = keep, move
+                continue
+            if op == "eq":
+                self.candidates.append([arg])
+            elif op == "in_":
+                self.candidates.append(list(arg))
+            elif op == "ne":
+                self.excluded.append(arg)
+            elif op == "not_in":
+                self.excluded.extend(arg)
+            elif op == "between":
+                self.bounds += [("gte", arg[0]), ("lte", arg[1])]
+            elif op in ("gt", "gte", "lt", "lte"):
+                self.bounds.append((op, arg))
+            elif op == "is_null":
+                if self.is_null is not None and self.is_null != arg:
+                    raise UnsatisfiableFilter("conflicting isNull")
+                self.is_null = arg
+            else:
+                self.single[op] = arg
+        return leftover
+
+    def _tests(self) -> list[Callable[[Any], bool]]:
+        filters = [self.kind.model_validate({op: arg}) for op, arg in self.bounds]
+        if self.single:
+            filters.append(self.kind.model_validate(self.single))
+        if self.excluded:
+            filters.append(self.kind.model_validate({"not_in": self.excluded}))
+        return [value_test(f) for f in filters]
+
+    def simplify(self) -> dict[str, Any]:
+        """Canonical operations, never empty.
+
+        A null fails every operation but `isNull: true`, so a constraint
+        whose operations all turn out redundant (`notIn: []`, an empty
+        filter, exclusions outside the range) still keeps `isNull: false`.
+        """
+        kind, convert = self.kind, self.convert
+        if self.is_null is True:
+            if self.needs_value:
+                raise UnsatisfiableFilter("isNull: true combined with other operations")
+            return {"is_null": True}
+
+        if self.candidates:
+            allowed: Optional[dict[Any, Any]] = None
+            for group in self.candidates:
+                values = {convert(v): _canonical_value(kind, v) for v in group}
+                allowed = (
+                    values
+                    if allowed is None
+                    else {key: value for key, value in allowed.items() if key in values}
+                )
+            tests = self._tests()
+            survivors = [
+                value
+                for key, value in sorted((allowed or {}).items())
+                if all(test(key) for test in tests)
+            ]
+            if not survivors:
+                raise UnsatisfiableFilter(f"no {kind.__name__} candidate survives")
+            return {"eq": survivors[0]} if len(survivors) == 1 else {"in_": survivors}
+
+        result: dict[str, Any] = {}
+        low = high = None
+        for op, arg in self.bounds:
+            value = convert(arg)
+            if kind in INTEGER_TYPES and op in ("gt", "lt"):
+                value, op = (value + 1, "gte") if op == "gt" else (value - 1, "lte")
+            strict = op in ("gt", "lt")
+            out = _canonical_value(kind, value) if kind in INTEGER_TYPES else arg
+            bound = (value, strict, op, out)
+            if op in ("gt", "gte"):
+                if low is None or value > low[0] or (value == low[0] and strict):
+                    low = bound
+            elif high is None or value < high[0] or (value == high[0] and strict):
+                high = bound
+        if low and high:
+            if low[0] > high[0] or (low[0] == high[0] and (low[1] or high[1])):
+                raise UnsatisfiableFilter(f"empty {kind.__name__} range")
+            if low[0] == high[0]:
+                self.candidates.append([low[3]])
+                return self.simplify()
+        for bound in (low, high):
+            if bound:
+                result[bound[2]] = bound[3]
+
+        in_range = [
+            value_test(kind.model_validate({op: arg})) for op, arg in result.items()
+        ]
+        excluded = {
+            convert(v): _canonical_value(kind, v)
+            for v in self.excluded
+            if all(test(convert(v)) for test in in_range)
+        }
+        values = [excluded[key] for key in sorted(excluded)]
+        if len(values) == 1:
+            result["ne"] = values[0]
+        elif values:
+            result["not_in"] = values
+        result.update(self.single)
+        if not result:
+            result["is_null"] = False
+        return result
+
+
+class _Conjunction:
+    def __init__(self) -> None:
+        self.fields: dict[str, _FieldConstraint] = {}
+        self.branches: list[TransactionFilterInput] = []
+        self.ors: list[list[TransactionFilterInput]] = []
+        self.nots: list[TransactionFilterInput] = []
+
+    def add_field(self, name: str, filter_: Any) -> None:
+        constraint = self.fields.get(name)
+        if constraint is None:
+            self.fields[name] = _FieldConstraint(filter_)
+        else:
+            leftover = constraint.add(filter_)
+            if leftover:
+                branch = constraint.kind(**leftover)
+                self.branches.append(TransactionFilterInput(**{name: branch}))
+
+    def absorb(self, filter_: TransactionFilterInput) -> None:
+        """AND an already normalized filter into this conjunction."""
+        for name, arg in operations(filter_):
+            if name == "and_":
+                for sub in arg:
+                    self.absorb(sub)
+            elif name == "or_":
+                self.ors.append(list(arg))
+            elif name == "not_":
+                self.nots.append(arg)
+            else:
+                self.add_field(name, arg)
+
+    def build(self) -> Optional[TransactionFilterInput]:
+        values: dict[str, Any] = {}
+        for name, constraint in self.fields.items():
+            values[name] = constraint.kind(**constraint.simplify())
+        branches = list(self.branches)
+        ors = sorted(
+            self.ors, key=lambda members: [_canonical_json(m) for m in members]
+        )
+        if ors:
+            values["or_"] = ors[0]
+            branches += [TransactionFilterInput(or_=members) for members in ors[1:]]
+        nots = sorted(self.nots, key=_canonical_json)
+        if nots:
+            values["not_"] = nots[0]
+            branches += [TransactionFilterInput(not_=sub) for sub in nots[1:]]
+        if branches:
+            keyed = {_canonical_json(b): b for b in branches}
+            values["and_"] = [keyed[key] for key in sorted(keyed)]
+        return TransactionFilterInput(**values) if values else None
+
+
+def _normalize_or(
+    members: list[TransactionFilterInput],
+) -> Optional[list[TransactionFilterInput]]:
+    """Normalized alternatives, or None when one of them matches everything."""
+    alternatives: dict[str, TransactionFilterInput] = {}
+    pending = list(members)
+    while pending:
+        try:
+            member = _normalize(pending.pop())
+        except UnsatisfiableFilter:
+            continue
+        if member is None:
+            return None
+        only_or = member.or_ is not None and member.model_fields_set <= {"or_"}
+        if only_or:
+            pending.extend(member.or_ or ())
+            continue
+        alternatives[_canonical_json(member)] = member
+    if not alternatives:
+        raise UnsatisfiableFilter("every or branch is unsatisfiable")
+    return [alternatives[key] for key in sorted(alternatives)]
+
+
+def normalize_filter(
+    filter_: Optional[TransactionFilterInput],
+) -> Optional[TransactionFilterInput]:
+    """Canonical form of `filter_`, or None if it matches every transaction.
+
+    Nested `and`/`or` trees are flattened, `not(not(x))` becomes `x`, ranges on
+    one field are merged into a single `gte`/`lte` pair (integers use
+    inclusive bounds), `eq`/`in` candidates are checked against the remaining
+    operations, and set members are deduplicated and sorted. Equivalent
+    filters normalize to the same object. Raises `UnsatisfiableFilter` when
+    the filter can match nothing.
+    """
+    normalized = _normalize(filter_)
+    # Operations split off into branches while merging (a second `startsWith`,
+    # say) can only be folded back in once the rest is normalized, so repeat
+    # until the result is stable.
+    while normalized is not None:
+        again = _normalize(normalized)
+        if _canonical_json(again) == _canonical_json(normalized):
+            break
+        normalized = again
+    return normalized
+
+
+def _normalize(
+    filter_: Optional[TransactionFilterInput],
+) -> Optional[TransactionFilterInput]:
+    """One merging pass of `normalize_filter`."""
+    if filter_ is None:
+        return None
+    conjunction = _Conjunction()
+    for name, arg in operations(filter_):
+        if name not in COMBINATORS:
+            conjunction.add_field(name, arg)
+    for sub in filter_.and_ or ():
+        normalized = _normalize(sub)
+        if normalized is not None:
+            conjunction.absorb(normalized)
+    if filter_.or_:
+        alternatives = _normalize_or(filter_.or_)
+        if alternatives is not None and len(alternatives) == 1:
+            conjunction.absorb(alternatives[0])
+        elif alternatives is not None:
+            conjunction.ors.append(alternatives)
+    if filter_.not_ is not None:
+        try:
+            negated = _normalize(filter_.not_)
+        except UnsatisfiableFilter:
+            negated = TransactionFilterInput()
+        else:
+            if negated is None:
+                raise UnsatisfiableFilter("not of a filter matching everything")
+            if negated.not_ is not None and negated.model_fields_set <= {"not_"}:
+                conjunction.absorb(negated.not_)
+            else:
+                conjunction.nots.append(negated)
+    return conjunction.build()
+
+
+def canonical_filter(filter_: Optional[TransactionFilterInput]) -> str:
+    """Compact JSON of the normalized `filter_` with sorted keys."""
+    try:
+        return _canonical_json(normalize_filter(filter_))
+    except UnsatisfiableFilter:
+        return '"unsatisfiable"'
+
+
+def filter_key(filter_: Optional[TransactionFilterInput]) -> str:
+    """Stable hash of the normalized `filter_`, usable as a cache key."""
+    return hashlib.sha256(canonical_filter(filter_).encode()).hexdigest()
+
+
+def normalize_query_input(
+    input: Union[Optional[TransactionQueryInput], UnsetType],
+) -> Union[Optional[TransactionQueryInput], UnsetType]:
+    """`input` with normalized filters; raises `UnsatisfiableFilter`."""
+    if input is UNSET or input is None or input.filters is None:
+        return input
+    return input.model_copy(update={"filters": normalize_filter(input.filters)})
+
+
+def empty_transactions(
+    input: Union[Optional[TransactionQueryInput], UnsetType] = UNSET,
+) -> QueryTransactions:
+    """The page a server returns for a filter that matches nothing."""
+    page = None if input is UNSET or input is None else input.pagination
+    limit = page.limit if page is not None else 0
+    return QueryTransactions.model_validate(
+        {
+            "transactions": {
+                "items": [],
+                "pageInfo": {
+                    "hasNextPage": False,
+                    "hasPreviousPage": bool(page and page.offset),
+                    "totalCount": 0,
+                    "currentPage": page.offset // limit + 1 if page and limit else 1,
+                    "totalPages": 0,
+                },
+            }
+        }
+    )
+
+
+async def normalized_query_transactions(
+    client: Client,
+    input: Union[Optional[TransactionQueryInput], UnsetType] = UNSET,
+    **kwargs: Any,
+) -> QueryTransactions:
+    """`client.query_transactions` with normalized filters.
+
+    Unsatisfiable filters are answered locally with an empty page.
+    """
+    try:
+        normalized = normalize_query_input(input)
+    except UnsatisfiableFilter:
+        return empty_transactions(input)
+    return await client.query_transactions(input=normalized, **kwargs)
@@ -0,0 +1,128 @@
+import asyncio
+import json
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Any, Optional, TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+T = TypeVar("T", bound=BaseModel)
+
+DEFAULT_THRESHOLD = 256 * 1024
+
+
+@dataclass
+class DecodeStats:
+    """Counters of an `OffloadDecoder`, safe to read at any time."""
+
+    inline: int = 0
+    offloaded: int = 0
+    offloaded_bytes: int = 0
+    # Decode time measured inside the workers.
+    worker_seconds: float = 0.0
+    # Time callers waited for offloaded results, queueing and transfer included.
+    wait_seconds: float = 0.0
+    fallbacks: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def _decode(content: bytes, model: type[T]) -> tuple[Optional[T], float]:
+    # Runs in a worker. Anything `get_data` would reject comes back as None and
+    # is decoded again on the caller's side, which raises the usual errors.
+    start = time.perf_counter()
+    try:
+        body = json.loads(content)
+    except ValueError:
+        return None, time.perf_counter() - start
+    if not isinstance(body, dict) or body.get("errors") or not body.get("data"):
+        return None, time.perf_counter() - start
+    try:
+        result = model.model_validate(body["data"])
+    except ValidationError:
+        result = None
+    return result, time.perf_counter() - start
+
+
+def _process_context() -> Any:
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context()
+
+
+class OffloadDecoder:
+    """Decodes and validates large response bodies off the event loop.
+
+    Bodies of at least `threshold` bytes are handed to a pool as raw bytes,
+    where `json.loads` and `model_validate` run; smaller ones are left to the
+    caller, for which the hop would cost more than it saves.
+
+    Threads are cheap, but `json.loads` and pydantic hold the GIL for a whole
+    call, so the loop still stalls behind very large bodies. `processes=True`
+    avoids that at the price of pickling results back. Worker processes are
+    started from a fork server where there is one, since forking a threaded
+    server is unsafe. The pool is created on first use.
+    """
+
+    def __init__(
+        self,
+        threshold: int = DEFAULT_THRESHOLD,
+        workers: int = 2,
+        processes: bool = False,
+    ) -> None:
+        self.threshold = threshold
+        self.workers = workers
+        self.processes = processes
+        self.stats = DecodeStats()
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+
+    def _pool(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                if self.processes:
+                    self._executor = ProcessPoolExecutor(
+                        self.workers, mp_context=_process_context()
+                    )
+                else:
+                    self._executor = ThreadPoolExecutor(self.workers, "gql-decode")
+            return self._executor
+
+    async def start(self) -> None:
+        """Start the pool now instead of on the first large body."""
+        await asyncio.get_running_loop().run_in_executor(self._pool(), int)
+
+    async def decode(self, content: bytes, model: type[T]) -> Optional[T]:
+        """`model` of the body's data, or None when the caller should decode."""
+        if len(content) < self.threshold:
+            self.stats.inline += 1
+            return None
+        start = time.perf_counter()
+        loop = asyncio.get_running_loop()
+        result, seconds = await loop.run_in_executor(
+            self._pool(), _decode, content, model
+        )
+        stats = self.stats
+        stats.offloaded += 1
+        stats.offloaded_bytes += len(content)
+        stats.worker_seconds += seconds
+        stats.wait_seconds += time.perf_counter() - start
+        if result is None:
+            stats.fallbacks += 1
+        return result
+
+    def close(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+    def __enter__(self) -> "OffloadDecoder":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -0,0 +1,145 @@
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any, Optional, TypeVar
+
+from pydantic import BaseModel
+
+from .base_model import UNSET
+
+DEFAULT_PAGE_SIZE = 100
+
+F = TypeVar("F", bound=Callable[..., Any])
+P = TypeVar("P")
+M = TypeVar("M")
+
+# (offset, items, hasNextPage, totalCount) of one fetched page.
+_Page = tuple[int, list[Any], bool, Optional[int]]
+
+
+def paginates(operation_name: str) -> Callable[[F], F]:
+    """Mark a client method as a pagination helper for `operation_name`."""
+
+    def decorator(func: F) -> F:
+        func.__paginates__ = operation_name  # type: ignore[attr-defined]
+        return func
+
+    return decorator
+
+
+def current_page(value: Any, field: Optional[str] = None) -> Any:
+    """Return the pagination input already present on an argument, if any."""
+    if value is UNSET or value is None:
+        return None
+    if field is None:
+        return value
+    return getattr(value, field, None)
+
+
+def with_page(value: Any, type_: type[M], field: str, page: Any) -> M:
+    """Copy of input object `value` with its pagination `field` set to `page`.
+
+    Works for both the pydantic inputs of `Client` and the `msgspec.Struct`
+    inputs of `StructClient`.
+    """
+    if value is UNSET or value is None:
+        if issubclass(type_, BaseModel):
+            return type_.model_validate({field: page})
+        return type_(**{field: page})
+    if isinstance(value, BaseModel):
+        return value.model_copy(update={field: page})  # type: ignore[return-value]
+
+    import msgspec
+
+    return msgspec.structs.replace(value, **{field: page})
+
+
+async def iter_pages(
+    fetch_page: Callable[[P], Awaitable[Any]],
+    page_type: type[P],
+    *,
+    connection: str,
+    items: str = "items",
+    start: Optional[Any] = None,
+    page_size: Optional[int] = None,
+    limit: Optional[int] = None,
+    prefetch: int = 2,
+    max_concurrency: int = 4,
+) -> AsyncIterator[list[Any]]:
+    """Yield pages of an offset-paginated connection in order.
+
+    The first page is fetched alone; once `pageInfo.totalCount` is known the
+    remaining offsets are fetched up to `prefetch` pages ahead of the consumer,
+    with at most `max_concurrency` requests in flight. Without a total count,
+    pages are still prefetched and iteration stops at the first page whose
+    `hasNextPage` is false.
+
+    A page shorter than requested that still has a next page means the server
+    capped `limit`. Prefetched pages are then dropped, and paging continues
+    right after the short page with the server's page size, so no rows are
+    skipped.
+    """
+    offset = start.offset if start is not None else 0
+    size = page_size or (start.limit if start is not None else DEFAULT_PAGE_SIZE)
+    end = None if limit is None else offset + limit
+    semaphore = asyncio.Semaphore(max(max_concurrency, 1))
+
+    async def load(page_offset: int) -> _Page:
+        async with semaphore:
+            result = await fetch_page(page_type(limit=size, offset=page_offset))
+        conn = getattr(result, connection)
+        if conn is None:
+            return page_offset, [], False, None
+        info = conn.page_info
+        return (
+            page_offset,
+            list(getattr(conn, items)),
+            info.has_next_page,
+            getattr(info, "total_count", None),
+        )
+
+    pending: deque[asyncio.Future[_Page]] = deque()
+    next_offset = offset + size
+
+    def fill() -> None:
+        nonlocal next_offset
+        while len(pending) < max(prefetch, 1) and (end is None or next_offset < end):
+            pending.append(asyncio.ensure_future(load(next_offset)))
+            next_offset += size
+
+    emitted = 0
+    try:
+        page_offset, page, has_next, total = await load(offset)
+        if total is not None:
+            end = total if end is None else min(end, total)
+        while True:
+            if has_next and 0 < len(page) < size:
+                for future in pending:
+                    future.cancel()
+                pending.clear()
+                size = len(page)
+                next_offset = page_offset + size
+            if end is not None:
+                page = page[: max(end - offset - emitted, 0)]
+            if has_next and page:
+                fill()
+            if page:
+                emitted += len(page)
+                yield page
+            if not has_next or not page or not pending:
+                return
+            page_offset, page, has_next, _ = await pending.popleft()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+async def iter_items(
+    fetch_page: Callable[[P], Awaitable[Any]],
+    page_type: type[P],
+    **kwargs: Any,
+) -> AsyncIterator[Any]:
+    """Flatten `iter_pages` into a stream of items."""
+    async for page in iter_pages(fetch_page, page_type, **kwargs):
+        for item in page:
+            yield item
@@ -18,6 +18,3 @@ class QueryMetadataMetadata(BaseModel):
     net_version: Optional[str] = Field(alias="netVersion")
     net_listening: Optional[bool] = Field(alias="netListening")
     net_peer_count: Optional[str] = Field(alias="netPeerCount")
-
-
-QueryMetadata.model_rebuild()
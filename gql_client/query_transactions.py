@@ -78,8 +78,3 @@ class QueryTransactionsTransactionsPageInfo(BaseModel):
     total_count: int = Field(alias="totalCount")
     current_page: int = Field(alias="currentPage")
     total_pages: int = Field(alias="totalPages")
-
-
-QueryTransactions.model_rebuild()
-QueryTransactionsTransactions.model_rebuild()
-QueryTransactionsTransactionsItems.model_rebuild()
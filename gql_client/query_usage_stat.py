@@ -13,6 +13,3 @@ class QueryUsageStat(BaseModel):
 class QueryUsageStatUsageStat(BaseModel):
     effectiveness: float
     jsonrpc_ratio: float = Field(alias="jsonrpcRatio")
-
-
-QueryUsageStat.model_rebuild()
@@ -0,0 +1,147 @@
+import secrets
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import NamedTuple, Optional, Union
+
+DEFAULT_TTL = 5.0
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_expires_at ON responses (expires_at);
+CREATE TABLE IF NOT EXISTS leases (
+    key TEXT PRIMARY KEY,
+    owner TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+"""
+
+
+class CachedResponse(NamedTuple):
+    body: bytes
+    # Wall-clock time, comparable between processes.
+    stored_at: float
+
+
+class SharedResponseCache:
+    """Response bodies shared by every process on one host, in a SQLite file.
+
+    The database runs in WAL mode, so readers in one worker never wait for a
+    writer in another. Entries expire `ttl` seconds after they are stored
+    unless `set` is given another lifetime. When the bodies add up to more
+    than `max_bytes`, expired entries go first, then the oldest ones.
+
+    Leases (`claim`/`release`) let one process load a missing key while the
+    others wait for its result instead of asking the server too. Each claim
+    gets its own owner token, so a holder whose lease expired cannot release
+    the lease another process has taken since.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        ttl: float = DEFAULT_TTL,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        # `SyncClient` calls in from its own event loop thread.
+        self._conn = sqlite3.connect(str(path), timeout=5.0, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(leases)")}
+        if columns and "owner" not in columns:
+            # Leases from before owner tokens; they only live for seconds.
+            self._conn.execute("DROP TABLE leases")
+        self._conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "SharedResponseCache":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, stored_at FROM responses"
+                " WHERE key = ? AND expires_at > ?",
+                (key, time.time()),
+            ).fetchone()
+        return CachedResponse(row[0], row[1]) if row else None
+
+    def set(self, key: str, body: bytes, ttl: Optional[float] = None) -> None:
+        now = time.time()
+        expires_at = now + (self.ttl if ttl is None else ttl)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (key, body, len(body), now, expires_at),
+            )
+            self._evict(now)
+
+    def _evict(self, now: float) -> None:
+        conn = self._conn
+        (total,) = conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        if total <= self.max_bytes:
+            return
+        conn.execute("DELETE FROM responses WHERE expires_at <= ?", (now,))
+        # Keep the newest entries that fit together in `max_bytes`.
+        conn.execute(
+            "DELETE FROM responses WHERE key IN ("
+            " SELECT key FROM ("
+            "  SELECT key, SUM(size) OVER (ORDER BY stored_at DESC, key) AS kept"
+            "  FROM responses"
+            " ) WHERE kept > ?"
+            ")",
+            (self.max_bytes,),
+        )
+
+    def delete(self, key: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.execute("DELETE FROM leases")
+
+    def claim(self, key: str, seconds: float) -> Optional[str]:
+        """Take the lease on loading `key` for `seconds`.
+
+        Returns the owner token to pass to `release`, or None if another
+        holder has the lease.
+        """
+        now = time.time()
+        token = secrets.token_hex(16)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM leases WHERE key = ? AND expires_at <= ?", (key, now)
+            )
+            cursor = self._conn.execute(
+                "INSERT OR IGNORE INTO leases VALUES (?, ?, ?)",
+                (key, token, now + seconds),
+            )
+        return token if cursor.rowcount == 1 else None
+
+    def release(self, key: str, token: str) -> None:
+        """Give up the lease on `key` if `token` still holds it."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM leases WHERE key = ? AND owner = ?", (key, token)
+            )
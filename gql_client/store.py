@@ -0,0 +1,305 @@
+import json
+import sqlite3
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from .client import Client
+from .filters import compile_filter
+from .input_types import IntFilter, TransactionFilterInput, TransactionQueryInput
+from .keyset import scan_transactions
+from .normalize import (
+    UnsatisfiableFilter,
+    canonical_filter,
+    filter_key,
+    normalize_filter,
+)
+from .query_transactions import QueryTransactionsTransactionsItems
+
+DEFAULT_CONFIRMATIONS = 12
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS transactions (
+    hash TEXT PRIMARY KEY,
+    block_number INTEGER NOT NULL,
+    tx_index INTEGER NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS transactions_position
+    ON transactions (block_number, tx_index);
+CREATE TABLE IF NOT EXISTS logs (
+    tx_hash TEXT NOT NULL,
+    log_index INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (tx_hash, log_index)
+);
+CREATE TABLE IF NOT EXISTS internal_transactions (
+    tx_hash TEXT NOT NULL,
+    trace_index INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (tx_hash, trace_index)
+);
+CREATE TABLE IF NOT EXISTS scopes (
+    scope TEXT PRIMARY KEY,
+    filters TEXT NOT NULL,
+    synced_block INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS scope_transactions (
+    scope TEXT NOT NULL,
+    block_number INTEGER NOT NULL,
+    tx_index INTEGER NOT NULL,
+    hash TEXT NOT NULL,
+    PRIMARY KEY (scope, hash)
+);
+CREATE INDEX IF NOT EXISTS scope_transactions_position
+    ON scope_transactions (scope, block_number, tx_index);
+CREATE INDEX IF NOT EXISTS scope_transactions_hash ON scope_transactions (hash);
+"""
+
+
+def _children_json(items: list[Any]) -> list[str]:
+    return [item.model_dump_json(by_alias=True) for item in items]
+
+
+@dataclass
+class _Staged:
+    """Rows of one sync, serialized while paging and written at the end."""
+
+    transactions: list[tuple[Any, ...]] = field(default_factory=list)
+    logs: list[tuple[Any, ...]] = field(default_factory=list)
+    internal: list[tuple[Any, ...]] = field(default_factory=list)
+    members: list[tuple[Any, ...]] = field(default_factory=list)
+
+
+class TransactionStore:
+    """Local SQLite copy of `query_transactions` results.
+
+    Transactions, their logs and internal transactions are stored once, keyed
+    by hash. Every distinct filter ("scope") keeps a watermark: the highest
+    block synced for it. `sync` only asks the server for blocks from the
+    watermark on, re-fetching the last `confirmations` blocks because they may
+    still be reorganised. In that window, transactions the server no longer
+    returns, or that come back with `removed` logs, are dropped from the store.
+    Reads are served from SQLite alone.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path] = ":memory:",
+        confirmations: int = DEFAULT_CONFIRMATIONS,
+    ) -> None:
+        self.path = path
+        self.confirmations = confirmations
+        self._conn = sqlite3.connect(str(path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "TransactionStore":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def watermark(
+        self, filters: Optional[TransactionFilterInput] = None
+    ) -> Optional[int]:
+        row = self._conn.execute(
+            "SELECT synced_block FROM scopes WHERE scope = ?", (filter_key(filters),)
+        ).fetchone()
+        return row[0] if row else None
+
+    async def sync(
+        self,
+        client: Client,
+        filters: Optional[TransactionFilterInput] = None,
+        *,
+        page_size: Optional[int] = None,
+        **kwargs: Any,
+    ) -> int:
+        """Bring the scope of `filters` up to date; return rows written.
+
+        Rows are staged in memory while the server is paged and written in one
+        SQLite transaction once the scan has finished. The write lock is held
+        only for that final write, never across requests, and an interrupted
+        sync leaves the previous state and watermark untouched. Staging costs
+        memory in proportion to the rows fetched, so split first syncs of
+        long histories into block ranges. Equivalent filters share one scope;
+        unsatisfiable ones never reach the server.
+        """
+        try:
+            filters = normalize_filter(filters)
+        except UnsatisfiableFilter:
+            return 0
+        scope = filter_key(filters)
+        synced = self.watermark(filters)
+        start = None if synced is None else max(synced - self.confirmations + 1, 0)
+        query_filters = filters
+        if start is not None:
+            bound = TransactionFilterInput(block_number=IntFilter(gte=start))
+            query_filters = (
+                TransactionFilterInput(and_=[filters, bound]) if filters else bound
+            )
+
+        seen: set[str] = set()
+        staged = _Staged()
+        highest = synced
+        async for item in scan_transactions(
+            client,
+            TransactionQueryInput(filters=query_filters),
+            page_size=page_size,
+            **kwargs,
+        ):
+            if any(log.removed for log in item.logs):
+                continue
+            seen.add(item.hash or "")
+            self._stage(scope, item, staged)
+            block = int(item.block_number or 0)
+            highest = block if highest is None else max(highest, block)
+
+        with self._conn:
+            self._write(staged)
+            if start is not None:
+                self._drop_missing(scope, start, seen)
+            if highest is not None:
+                self._conn.execute(
+                    "INSERT INTO scopes (scope, filters, synced_block)"
+                    " VALUES (?, ?, ?) ON CONFLICT (scope)"
+                    " DO UPDATE SET synced_block = excluded.synced_block",
+                    (scope, canonical_filter(filters), highest),
+                )
+        return len(staged.transactions)
+
+    @staticmethod
+    def _stage(
+        scope: str, item: QueryTransactionsTransactionsItems, staged: _Staged
+    ) -> None:
+        block, index = int(item.block_number or 0), int(item.tx_index or 0)
+        data = item.model_dump_json(
+            by_alias=True, exclude={"logs", "internal_transactions"}
+        )
+        staged.transactions.append((item.hash, block, index, data))
+        staged.members.append((scope, block, index, item.hash))
+        staged.logs.extend(
+            (item.hash, int(log.log_index or 0), data)
+            for log, data in zip(item.logs, _children_json(item.logs), strict=True)
+        )
+        staged.internal.extend(
+            (item.hash, int(trace.trace_index or 0), data)
+            for trace, data in zip(
+                item.internal_transactions,
+                _children_json(item.internal_transactions),
+                strict=True,
+            )
+        )
+
+    def _write(self, staged: _Staged) -> None:
+        hashes = [(row[0],) for row in staged.transactions]
+        conn = self._conn
+        conn.executemany("DELETE FROM logs WHERE tx_hash = ?", hashes)
+        conn.executemany("DELETE FROM internal_transactions WHERE tx_hash = ?", hashes)
+        conn.executemany(
+            "INSERT OR REPLACE INTO transactions VALUES (?, ?, ?, ?)",
+            staged.transactions,
+        )
+        conn.executemany("INSERT INTO logs VALUES (?, ?, ?)", staged.logs)
+        conn.executemany(
+            "INSERT INTO internal_transactions VALUES (?, ?, ?)", staged.internal
+        )
+        conn.executemany(
+            "INSERT OR REPLACE INTO scope_transactions VALUES (?, ?, ?, ?)",
+            staged.members,
+        )
+
+    def _drop_missing(self, scope: str, start: int, seen: set[str]) -> None:
+        stale = [
+            (hash_,)
+            for (hash_,) in self._conn.execute(
+                "SELECT hash FROM scope_transactions"
+                " WHERE scope = ? AND block_number >= ?",
+                (scope, start),
+            )
+            if hash_ not in seen
+        ]
+        if not stale:
+            return
+        conn = self._conn
+        conn.executemany(
+            "DELETE FROM scope_transactions WHERE scope = ? AND hash = ?",
+            [(scope, hash_) for (hash_,) in stale],
+        )
+        # Rows still referenced by another scope are left to that scope's sync.
+        orphaned = [
+            (hash_,)
+            for (hash_,) in stale
+            if conn.execute(
+                "SELECT 1 FROM scope_transactions WHERE hash = ? LIMIT 1", (hash_,)
+            ).fetchone()
+            is None
+        ]
+        conn.executemany("DELETE FROM transactions WHERE hash = ?", orphaned)
+        conn.executemany("DELETE FROM logs WHERE tx_hash = ?", orphaned)
+        conn.executemany(
+            "DELETE FROM internal_transactions WHERE tx_hash = ?", orphaned
+        )
+
+    def transactions(
+        self,
+        filters: Optional[TransactionFilterInput] = None,
+        *,
+        from_block: Optional[int] = None,
+        to_block: Optional[int] = None,
+        limit: Optional[int] = None,
+        where: Optional[TransactionFilterInput] = None,
+    ) -> list[QueryTransactionsTransactionsItems]:
+        """Stored transactions of the scope of `filters`, oldest first.
+
+        `where` is evaluated locally on top of the scope, so narrower filters
+        can be answered from an already synced broader scope.
+        """
+        clause = "s.scope = ? AND s.block_number BETWEEN ? AND ?"
+        params: list[Any] = [
+            filter_key(filters),
+            from_block if from_block is not None else 0,
+            to_block if to_block is not None else 2**63 - 1,
+        ]
+        scoped = f"SELECT s.hash FROM scope_transactions s WHERE {clause}"
+        sql = (
+            "SELECT t.hash, t.data FROM scope_transactions s"
+            " JOIN transactions t ON t.hash = s.hash"
+            f" WHERE {clause} ORDER BY s.block_number, s.tx_index"
+        )
+        if limit is not None and where is None:
+            sql += " LIMIT ?"
+            scoped += " ORDER BY s.block_number, s.tx_index LIMIT ?"
+            params.append(limit)
+
+        conn = self._conn
+        rows = conn.execute(sql, params).fetchall()
+        logs: dict[str, list[Any]] = {}
+        for tx_hash, data in conn.execute(
+            f"SELECT tx_hash, data FROM logs WHERE tx_hash IN ({scoped})"
+            " ORDER BY tx_hash, log_index",
+            params,
+        ):
+            logs.setdefault(tx_hash, []).append(json.loads(data))
+        internal: dict[str, list[Any]] = {}
+        for tx_hash, data in conn.execute(
+            "SELECT tx_hash, data FROM internal_transactions"
+            f" WHERE tx_hash IN ({scoped}) ORDER BY tx_hash, trace_index",
+            params,
+        ):
+            internal.setdefault(tx_hash, []).append(json.loads(data))
+
+        result = []
+        for tx_hash, data in rows:
+            value = json.loads(data)
+            value["logs"] = logs.get(tx_hash, [])
+            value["internalTransactions"] = internal.get(tx_hash, [])
+            result.append(QueryTransactionsTransactionsItems.model_validate(value))
+        if where is not None:
+            result = list(filter(compile_filter(where), result))[:limit]
+        return result
@@ -0,0 +1,80 @@
+import json
+from functools import lru_cache
+from typing import Any, Generic, Optional, TypeVar
+
+import httpx
+import msgspec
+
+from .async_base_client import AsyncBaseClient, VariablesSerializer
+from .base_model import UNSET
+from .exceptions import (
+    GraphQLClientGraphQLMultiError,
+    GraphQLClientHttpError,
+    GraphQLClientInvalidResponseError,
+)
+
+T = TypeVar("T")
+
+
+class GraphQLResponse(msgspec.Struct, Generic[T], kw_only=True, gc=False):
+    data: Optional[T] = None
+    errors: Optional[list[dict[str, Any]]] = None
+
+
+@lru_cache(maxsize=None)
+def _decoder(type_: type[T]) -> msgspec.json.Decoder[GraphQLResponse[T]]:
+    return msgspec.json.Decoder(GraphQLResponse[type_])  # type: ignore[valid-type]
+
+
+class StructVariablesSerializer(VariablesSerializer):
+    """`VariablesSerializer` for struct inputs, encoded with msgspec in one call."""
+
+    _encoder = msgspec.json.Encoder()
+
+    def dumps(self, variables: dict[str, Any]) -> Optional[bytes]:
+        try:
+            return self._encoder.encode(
+                {name: value for name, value in variables.items() if value is not UNSET}
+            )
+        except TypeError:
+            # Values msgspec cannot encode (uploads, pydantic models) take the
+            # generic path.
+            return None
+
+
+class AsyncStructBaseClient(AsyncBaseClient):
+    """Base for clients whose results are `msgspec.Struct` types.
+
+    Response bodies are decoded and validated straight from bytes into the
+    result struct in a single pass, without an intermediate dict.
+    """
+
+    def get_struct(self, response: httpx.Response, type_: type[T]) -> T:
+        if not response.is_success:
+            raise GraphQLClientHttpError(
+                status_code=response.status_code, response=response
+            )
+
+        try:
+            envelope = _decoder(type_).decode(response.content)
+        except msgspec.ValidationError:
+            # Partial data next to errors may not match the result type; fall
+            # back to the untyped body so the GraphQL errors are still raised.
+            self.get_data(response)
+            raise GraphQLClientInvalidResponseError(response=response) from None
+        except msgspec.DecodeError as exc:
+            raise GraphQLClientInvalidResponseError(response=response) from exc
+
+        if envelope.errors:
+            raise GraphQLClientGraphQLMultiError.from_errors_dicts(
+                errors_dicts=envelope.errors,
+                data=json.loads(response.content).get("data"),
+            )
+        if envelope.data is None:
+            raise GraphQLClientInvalidResponseError(response=response)
+        return envelope.data
+
+    def _convert_value(self, value: Any) -> Any:
+        if isinstance(value, msgspec.Struct):
+            return msgspec.to_builtins(value)
+        return super()._convert_value(value)
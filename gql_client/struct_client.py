@@ -0,0 +1,207 @@
+# Generated by gen_struct_client.py
+# Source: gql_client/client.py
+
+from collections.abc import AsyncIterator
+from typing import Any, Optional, Union
+
+from .async_base_client import PreparedOperation
+from .base_model import UNSET, UnsetType
+from .pagination import current_page, iter_items, paginates, with_page
+from .struct_base_client import AsyncStructBaseClient, StructVariablesSerializer
+from .structs import (
+    MutationSendRawTransaction,
+    PaginationInput,
+    QueryEthSyncing,
+    QueryMetadata,
+    QueryTransactions,
+    QueryTransactionsTransactionsItems,
+    QueryUsageStat,
+    QueryWeb3Sha3,
+    TransactionQueryInput,
+)
+
+
+def gql(q: str) -> str:
+    return q
+
+
+_QUERY_METADATA = PreparedOperation(
+    "query query_metadata{metadata{clientVersion chainId netVersion netListening netPeerCount}}",
+    "query_metadata",
+    StructVariablesSerializer({}),
+)
+_QUERY_ETH_SYNCING = PreparedOperation(
+    "query query_ethSyncing{ethSyncing}", "query_ethSyncing", StructVariablesSerializer({})
+)
+_QUERY_WEB_3_SHA_3 = PreparedOperation(
+    "query query_web3Sha3($message:String!){web3Sha3(message:$message)}",
+    "query_web3Sha3",
+    StructVariablesSerializer({"message": str}),
+)
+_QUERY_TRANSACTIONS = PreparedOperation(
+    "query query_transactions($input:TransactionQueryInput){transactions(input:$input){items{blockNumber txIndex hash fromAddress toAddress valueWei gas gasPrice gasUsed nonce txType maxFeePerGas maxPriorityFeePerGas input success logsCount createdAt logs{blockNumber txIndex logIndex txHash blockHash address topics data removed createdAt}internalTransactions{blockNumber txHash traceIndex traceAddress fromAddress toAddress valueWei callType gas gasUsed input output error success createdAt}}pageInfo{hasNextPage hasPreviousPage totalCount currentPage totalPages}}}",
+    "query_transactions",
+    StructVariablesSerializer({"input": Union[Optional[TransactionQueryInput], UnsetType]}),
+)
+_QUERY_USAGE_STAT = PreparedOperation(
+    "query query_usageStat{usageStat{effectiveness jsonrpcRatio}}",
+    "query_usageStat",
+    StructVariablesSerializer({}),
+)
+_MUTATION_SEND_RAW_TRANSACTION = PreparedOperation(
+    "mutation mutation_sendRawTransaction($signedTx:String$from:String$to:String$value:String$gas:String$gasPrice:String$input:String$nonce:Int){sendRawTransaction(signedTx:$signedTx from:$from to:$to value:$value gas:$gas gasPrice:$gasPrice input:$input nonce:$nonce)}",
+    "mutation_sendRawTransaction",
+    StructVariablesSerializer(
+        {
+            "signedTx": Union[Optional[str], UnsetType],
+            "from": Union[Optional[str], UnsetType],
+            "to": Union[Optional[str], UnsetType],
+            "value": Union[Optional[str], UnsetType],
+            "gas": Union[Optional[str], UnsetType],
+            "gasPrice": Union[Optional[str], UnsetType],
+            "input": Union[Optional[str], UnsetType],
+            "nonce": Union[Optional[int], UnsetType],
+        }
+    ),
+)
+
+
+class StructClient(AsyncStructBaseClient):
+    async def query_metadata(self, **kwargs: Any) -> QueryMetadata:
+        variables: dict[str, object] = {}
+        response = await self.execute(
+            query=_QUERY_METADATA.query,
+            operation_name="query_metadata",
+            variables=variables,
+            prepared=_QUERY_METADATA,
+            **kwargs
+        )
+        return self.get_struct(response, QueryMetadata)
+
+    async def query_eth_syncing(self, **kwargs: Any) -> QueryEthSyncing:
+        variables: dict[str, object] = {}
+        response = await self.execute(
+            query=_QUERY_ETH_SYNCING.query,
+            operation_name="query_ethSyncing",
+            variables=variables,
+            prepared=_QUERY_ETH_SYNCING,
+            **kwargs
+        )
+        return self.get_struct(response, QueryEthSyncing)
+
+    async def query_web_3_sha_3(self, message: str, **kwargs: Any) -> QueryWeb3Sha3:
+        variables: dict[str, object] = {"message": message}
+        response = await self.execute(
+            query=_QUERY_WEB_3_SHA_3.query,
+            operation_name="query_web3Sha3",
+            variables=variables,
+            prepared=_QUERY_WEB_3_SHA_3,
+            **kwargs
+        )
+        return self.get_struct(response, QueryWeb3Sha3)
+
+    async def query_transactions(
+        self,
+        input: Union[Optional[TransactionQueryInput], UnsetType] = UNSET,
+        **kwargs: Any
+    ) -> QueryTransactions:
+        variables: dict[str, object] = {"input": input}
+        response = await self.execute(
+            query=_QUERY_TRANSACTIONS.query,
+            operation_name="query_transactions",
+            variables=variables,
+            prepared=_QUERY_TRANSACTIONS,
+            **kwargs
+        )
+        return self.get_struct(response, QueryTransactions)
+
+    async def query_usage_stat(self, **kwargs: Any) -> QueryUsageStat:
+        variables: dict[str, object] = {}
+        response = await self.execute(
+            query=_QUERY_USAGE_STAT.query,
+            operation_name="query_usageStat",
+            variables=variables,
+            prepared=_QUERY_USAGE_STAT,
+            **kwargs
+        )
+        return self.get_struct(response, QueryUsageStat)
+
+    async def mutation_send_raw_transaction(
+        self,
+        signed_tx: Union[Optional[str], UnsetType] = UNSET,
+        from_: Union[Optional[str], UnsetType] = UNSET,
+        to: Union[Optional[str], UnsetType] = UNSET,
+        value: Union[Optional[str], UnsetType] = UNSET,
+        gas: Union[Optional[str], UnsetType] = UNSET,
+        gas_price: Union[Optional[str], UnsetType] = UNSET,
+        input: Union[Optional[str], UnsetType] = UNSET,
+        nonce: Union[Optional[int], UnsetType] = UNSET,
+        **kwargs: Any
+    ) -> MutationSendRawTransaction:
+        variables: dict[str, object] = {
+            "signedTx": signed_tx,
+            "from": from_,
+            "to": to,
+            "value": value,
+            "gas": gas,
+            "gasPrice": gas_price,
+            "input": input,
+            "nonce": nonce,
+        }
+        response = await self.execute(
+            query=_MUTATION_SEND_RAW_TRANSACTION.query,
+            operation_name="mutation_sendRawTransaction",
+            variables=variables,
+            prepared=_MUTATION_SEND_RAW_TRANSACTION,
+            **kwargs
+        )
+        return self.get_struct(response, MutationSendRawTransaction)
+
+    @paginates("query_transactions")
+    def iter_transactions(
+        self,
+        input: Union[Optional[TransactionQueryInput], UnsetType] = UNSET,
+        *,
+        page_size: Optional[int] = None,
+        limit: Optional[int] = None,
+        prefetch: int = 2,
+        max_concurrency: int = 4,
+        **kwargs: Any
+    ) -> AsyncIterator[QueryTransactionsTransactionsItems]:
+        return iter_items(
+            lambda page: self.query_transactions(
+                input=with_page(input, TransactionQueryInput, "pagination", page),
+                **kwargs
+            ),
+            PaginationInput,
+            connection="transactions",
+            items="items",
+            start=current_page(input, "pagination"),
+            page_size=page_size,
+            limit=limit,
+            prefetch=prefetch,
+            max_concurrency=max_concurrency,
+        )
+
+    @paginates("query_transactions")
+    async def fetch_all_transactions(
+        self,
+        input: Union[Optional[TransactionQueryInput], UnsetType] = UNSET,
+        *,
+        page_size: Optional[int] = None,
+        limit: Optional[int] = None,
+        prefetch: int = 2,
+        max_concurrency: int = 4,
+        **kwargs: Any
+    ) -> list[QueryTransactionsTransactionsItems]:
+        return [
+            item
+            async for item in self.iter_transactions(
+                input,
+                page_size=page_size,
+                limit=limit,
+                prefetch=prefetch,
+                max_concurrency=max_concurrency,
+                **kwargs
+            )
+        ]
@@ -0,0 +1,214 @@
+# Generated by gen_struct_client.py
+# Source: gql_client/client.py
+
+from typing import Any, Optional, Union
+
+import msgspec
+from msgspec import UNSET, UnsetType
+
+from .enums import SortDirection, TransactionOrderField
+
+
+class Struct(msgspec.Struct, kw_only=True, gc=False):
+    pass
+
+
+class InputStruct(msgspec.Struct, kw_only=True, omit_defaults=True):
+    pass
+
+
+class QueryMetadata(Struct):
+    metadata: "QueryMetadataMetadata"
+
+
+class QueryEthSyncing(Struct):
+    eth_syncing: Optional[Any] = msgspec.field(name="ethSyncing")
+
+
+class QueryWeb3Sha3(Struct):
+    web_3_sha_3: str = msgspec.field(name="web3Sha3")
+
+
+class QueryTransactions(Struct):
+    transactions: Optional["QueryTransactionsTransactions"]
+
+
+class QueryUsageStat(Struct):
+    usage_stat: "QueryUsageStatUsageStat" = msgspec.field(name="usageStat")
+
+
+class MutationSendRawTransaction(Struct):
+    send_raw_transaction: str = msgspec.field(name="sendRawTransaction")
+
+
+class QueryMetadataMetadata(Struct):
+    client_version: Optional[str] = msgspec.field(name="clientVersion")
+    chain_id: Optional[str] = msgspec.field(name="chainId")
+    net_version: Optional[str] = msgspec.field(name="netVersion")
+    net_listening: Optional[bool] = msgspec.field(name="netListening")
+    net_peer_count: Optional[str] = msgspec.field(name="netPeerCount")
+
+
+class QueryTransactionsTransactions(Struct):
+    items: list["QueryTransactionsTransactionsItems"]
+    page_info: "QueryTransactionsTransactionsPageInfo" = msgspec.field(name="pageInfo")
+
+
+class QueryUsageStatUsageStat(Struct):
+    effectiveness: float
+    jsonrpc_ratio: float = msgspec.field(name="jsonrpcRatio")
+
+
+class QueryTransactionsTransactionsItems(Struct):
+    block_number: Optional[str] = msgspec.field(name="blockNumber")
+    tx_index: Optional[str] = msgspec.field(name="txIndex")
+    hash: Optional[str]
+    from_address: Optional[str] = msgspec.field(name="fromAddress")
+    to_address: Optional[str] = msgspec.field(name="toAddress")
+    value_wei: Optional[str] = msgspec.field(name="valueWei")
+    gas: Optional[str]
+    gas_price: Optional[str] = msgspec.field(name="gasPrice")
+    gas_used: Optional[str] = msgspec.field(name="gasUsed")
+    nonce: Optional[str]
+    tx_type: Optional[str] = msgspec.field(name="txType")
+    max_fee_per_gas: Optional[str] = msgspec.field(name="maxFeePerGas")
+    max_priority_fee_per_gas: Optional[str] = msgspec.field(name="maxPriorityFeePerGas")
+    input: Optional[str]
+    success: Optional[bool]
+    logs_count: Optional[str] = msgspec.field(name="logsCount")
+    created_at: Optional[str] = msgspec.field(name="createdAt")
+    logs: list["QueryTransactionsTransactionsItemsLogs"]
+    internal_transactions: list["QueryTransactionsTransactionsItemsInternalTransactions"] = msgspec.field(name="internalTransactions")
+
+
+class QueryTransactionsTransactionsPageInfo(Struct):
+    has_next_page: bool = msgspec.field(name="hasNextPage")
+    has_previous_page: bool = msgspec.field(name="hasPreviousPage")
+    total_count: int = msgspec.field(name="totalCount")
+    current_page: int = msgspec.field(name="currentPage")
+    total_pages: int = msgspec.field(name="totalPages")
+
+
+class QueryTransactionsTransactionsItemsLogs(Struct):
+    block_number: Optional[str] = msgspec.field(name="blockNumber")
+    tx_index: Optional[str] = msgspec.field(name="txIndex")
+    log_index: Optional[str] = msgspec.field(name="logIndex")
+    tx_hash: Optional[str] = msgspec.field(name="txHash")
+    block_hash: Optional[str] = msgspec.field(name="blockHash")
+    address: Optional[str]
+    topics: Optional[list[str]]
+    data: Optional[str]
+    removed: Optional[bool]
+    created_at: Optional[str] = msgspec.field(name="createdAt")
+
+
+class QueryTransactionsTransactionsItemsInternalTransactions(Struct):
+    block_number: Optional[str] = msgspec.field(name="blockNumber")
+    tx_hash: Optional[str] = msgspec.field(name="txHash")
+    trace_index: Optional[str] = msgspec.field(name="traceIndex")
+    trace_address: Optional[str] = msgspec.field(name="traceAddress")
+    from_address: Optional[str] = msgspec.field(name="fromAddress")
+    to_address: Optional[str] = msgspec.field(name="toAddress")
+    value_wei: Optional[str] = msgspec.field(name="valueWei")
+    call_type: Optional[str] = msgspec.field(name="callType")
+    gas: Optional[str]
+    gas_used: Optional[str] = msgspec.field(name="gasUsed")
+    input: Optional[str]
+    output: Optional[str]
+    error: Optional[str]
+    success: Optional[bool]
+    created_at: Optional[str] = msgspec.field(name="createdAt")
+
+
+class TransactionQueryInput(InputStruct):
+    filters: Union[Optional["TransactionFilterInput"], UnsetType] = msgspec.field(default=UNSET)
+    pagination: Union[Optional["PaginationInput"], UnsetType] = msgspec.field(default=UNSET)
+    order_by: Union[Optional[list["TransactionOrderByInput"]], UnsetType] = msgspec.field(name="orderBy", default=UNSET)
+
+
+class TransactionFilterInput(InputStruct):
+    hash: Union[Optional["StringFilter"], UnsetType] = msgspec.field(default=UNSET)
+    from_address: Union[Optional["StringFilter"], UnsetType] = msgspec.field(name="fromAddress", default=UNSET)
+    to_address: Union[Optional["StringFilter"], UnsetType] = msgspec.field(name="toAddress", default=UNSET)
+    input: Union[Optional["StringFilter"], UnsetType] = msgspec.field(default=UNSET)
+    block_number: Union[Optional["IntFilter"], UnsetType] = msgspec.field(name="blockNumber", default=UNSET)
+    tx_index: Union[Optional["IntFilter"], UnsetType] = msgspec.field(name="txIndex", default=UNSET)
+    nonce: Union[Optional["IntFilter"], UnsetType] = msgspec.field(default=UNSET)
+    tx_type: Union[Optional["IntFilter"], UnsetType] = msgspec.field(name="txType", default=UNSET)
+    logs_count: Union[Optional["IntFilter"], UnsetType] = msgspec.field(name="logsCount", default=UNSET)
+    value_wei: Union[Optional["BigIntFilter"], UnsetType] = msgspec.field(name="valueWei", default=UNSET)
+    gas: Union[Optional["BigIntFilter"], UnsetType] = msgspec.field(default=UNSET)
+    gas_price: Union[Optional["BigIntFilter"], UnsetType] = msgspec.field(name="gasPrice", default=UNSET)
+    gas_used: Union[Optional["BigIntFilter"], UnsetType] = msgspec.field(name="gasUsed", default=UNSET)
+    max_fee_per_gas: Union[Optional["BigIntFilter"], UnsetType] = msgspec.field(name="maxFeePerGas", default=UNSET)
+    max_priority_fee_per_gas: Union[Optional["BigIntFilter"], UnsetType] = msgspec.field(name="maxPriorityFeePerGas", default=UNSET)
+    success: Union[Optional["BoolFilter"], UnsetType] = msgspec.field(default=UNSET)
+    created_at: Union[Optional["DateTimeFilter"], UnsetType] = msgspec.field(name="createdAt", default=UNSET)
+    and_: Union[Optional[list["TransactionFilterInput"]], UnsetType] = msgspec.field(name="and", default=UNSET)
+    or_: Union[Optional[list["TransactionFilterInput"]], UnsetType] = msgspec.field(name="or", default=UNSET)
+    not_: Union[Optional["TransactionFilterInput"], UnsetType] = msgspec.field(name="not", default=UNSET)
+
+
+class PaginationInput(InputStruct):
+    limit: int
+    offset: int
+
+
+class TransactionOrderByInput(InputStruct):
+    field: TransactionOrderField
+    direction: SortDirection
+
+
+class StringFilter(InputStruct):
+    eq: Union[Optional[str], UnsetType] = msgspec.field(default=UNSET)
+    ne: Union[Optional[str], UnsetType] = msgspec.field(default=UNSET)
+    contains: Union[Optional[str], UnsetType] = msgspec.field(default=UNSET)
+    not_contains: Union[Optional[str], UnsetType] = msgspec.field(name="notContains", default=UNSET)
+    starts_with: Union[Optional[str], UnsetType] = msgspec.field(name="startsWith", default=UNSET)
+    ends_with: Union[Optional[str], UnsetType] = msgspec.field(name="endsWith", default=UNSET)
+    regex: Union[Optional[str], UnsetType] = msgspec.field(default=UNSET)
+    not_regex: Union[Optional[str], UnsetType] = msgspec.field(name="notRegex", default=UNSET)
+    in_: Union[Optional[list[str]], UnsetType] = msgspec.field(name="in", default=UNSET)
+    not_in: Union[Optional[list[str]], UnsetType] = msgspec.field(name="notIn", default=UNSET)
+    is_null: Union[Optional[bool], UnsetType] = msgspec.field(name="isNull", default=UNSET)
+
+
+class IntFilter(InputStruct):
+    eq: Union[Optional[int], UnsetType] = msgspec.field(default=UNSET)
+    ne: Union[Optional[int], UnsetType] = msgspec.field(default=UNSET)
+    gt: Union[Optional[int], UnsetType] = msgspec.field(default=UNSET)
+    gte: Union[Optional[int], UnsetType] = msgspec.field(default=UNSET)
+    lt: Union[Optional[int], UnsetType] = msgspec.field(default=UNSET)
+    lte: Union[Optional[int], UnsetType] = msgspec.field(default=UNSET)
+    in_: Union[Optional[list[int]], UnsetType] = msgspec.field(name="in", default=UNSET)
+    not_in: Union[Optional[list[int]], UnsetType] = msgspec.field(name="notIn", default=UNSET)
+    between: Union[Optional[list[int]], UnsetType] = msgspec.field(default=UNSET)
+    is_null: Union[Optional[bool], UnsetType] = msgspec.field(name="isNull", default=UNSET)
+
+
+class BigIntFilter(InputStruct):
+    eq: Union[Optional[str], UnsetType] = msgspec.field(default=UNSET)
+    ne: Union[Optional[str], UnsetType] = msgspec.field(default=UNSET)
+    gt: Union[Optional[str], UnsetType] = msgspec.field(default=UNSET)
+    gte: Union[Optional[str], UnsetType] = msgspec.field(default=UNSET)
+    lt: Union[Optional[str], UnsetType] = msgspec.field(default=UNSET)
+    lte: Union[Optional[str], UnsetType] = msgspec.field(default=UNSET)
+    in_: Union[Optional[list[str]], UnsetType] = msgspec.field(name="in", default=UNSET)
+    not_in: Union[Optional[list[str]], UnsetType] = msgspec.field(name="notIn", default=UNSET)
+    is_null: Union[Optional[bool], UnsetType] = msgspec.field(name="isNull", default=UNSET)
+
+
+class BoolFilter(InputStruct):
+    eq: Union[Optional[bool], UnsetType] = msgspec.field(default=UNSET)
+    is_null: Union[Optional[bool], UnsetType] = msgspec.field(name="isNull", default=UNSET)
+
+
+class DateTimeFilter(InputStruct):
+    eq: Union[Optional[Any], UnsetType] = msgspec.field(default=UNSET)
+    ne: Union[Optional[Any], UnsetType] = msgspec.field(default=UNSET)
+    gt: Union[Optional[Any], UnsetType] = msgspec.field(default=UNSET)
+    gte: Union[Optional[Any], UnsetType] = msgspec.field(default=UNSET)
+    lt: Union[Optional[Any], UnsetType] = msgspec.field(default=UNSET)
+    lte: Union[Optional[Any], UnsetType] = msgspec.field(default=UNSET)
+    between: Union[Optional[list[Any]], UnsetType] = msgspec.field(default=UNSET)
+    is_null: Union[Optional[bool], UnsetType] = msgspec.field(name="isNull", default=UNSET)
@@ -0,0 +1,164 @@
+import asyncio
+import functools
+import inspect
+import threading
+from collections.abc import AsyncIterator, Coroutine, Iterator
+from typing import Any, Optional, TypeVar
+
+import httpx
+
+from .client import Client
+
+T = TypeVar("T")
+
+
+class SyncClient:
+    """Blocking facade over `Client`.
+
+    A single event loop runs in a daemon thread for the lifetime of the facade,
+    so the pooled `httpx.AsyncClient` stays warm between calls. Every coroutine
+    method of `Client` (generated operations and `execute`) is exposed as a
+    blocking method, and any number of threads may call them concurrently.
+    """
+
+    def __init__(
+        self,
+        url: str = "",
+        headers: Optional[dict[str, str]] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> None:
+        self.client = Client(
+            url=url, headers=headers, http_client=http_client, **kwargs
+        )
+        self.timeout = timeout
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def __enter__(self) -> "SyncClient":
+        return self
+
+    def __exit__(self, exc_type: object, exc_val: object, exc_tb: object) -> None:
+        self.close()
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        attr = getattr(self.client, name)
+        if inspect.iscoroutinefunction(attr):
+
+            @functools.wraps(attr)
+            def blocking(*args: Any, **kwargs: Any) -> Any:
+                return self.run(attr(*args, **kwargs))
+
+        elif getattr(attr, "__paginates__", None):
+
+            @functools.wraps(attr)
+            def blocking(*args: Any, **kwargs: Any) -> Any:
+                return self.iterate(attr(*args, **kwargs))
+
+        else:
+            return attr
+
+        # Cache the wrapper so later lookups skip __getattr__.
+        self.__dict__[name] = blocking
+        return blocking
+
+    def run(self, coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+        try:
+            loop = self._ensure_loop()
+        except RuntimeError:
+            coro.close()
+            raise
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("SyncClient cannot be called from its own loop.")
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+        try:
+            return future.result(timeout if timeout is not None else self.timeout)
+        except TimeoutError:
+            future.cancel()
+            raise
+
+    def iterate(self, iterator: AsyncIterator[T]) -> Iterator[T]:
+        async def step() -> T:
+            return await iterator.__anext__()
+
+        async def close() -> None:
+            await iterator.aclose()  # type: ignore[attr-defined]
+
+        try:
+            while True:
+                try:
+                    yield self.run(step())
+                except StopAsyncIteration:
+                    return
+        finally:
+            if hasattr(iterator, "aclose"):
+                self.run(close())
+
+    def close(self) -> None:
+        """Close the pool and stop the loop.
+
+        Calls still in flight from other threads are cancelled first, so they
+        raise `CancelledError` instead of waiting on a loop that has stopped.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            loop, thread = self._loop, self._thread
+        if loop is None or thread is None:
+            # The loop never started. Close the pool on a short-lived loop in
+            # its own thread, which also works when called from async code.
+            closer = threading.Thread(
+                target=asyncio.run, args=(self.client.http_client.aclose(),)
+            )
+            closer.start()
+            closer.join()
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), loop).result()
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+
+    async def _shutdown(self) -> None:
+        current = asyncio.current_task()
+        pending = [task for task in asyncio.all_tasks() if task is not current]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        await self.client.http_client.aclose()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        loop = self._loop
+        if loop is not None and not self._closed:
+            return loop
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("SyncClient is closed.")
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+                thread = threading.Thread(
+                    target=self._run_loop,
+                    args=(loop, ready),
+                    name="gql-client-loop",
+                    daemon=True,
+                )
+                thread.start()
+                ready.wait()
+                self._thread = thread
+                self._loop = loop
+            return self._loop
+
+    @staticmethod
+    def _run_loop(loop: asyncio.AbstractEventLoop, ready: threading.Event) -> None:
+        asyncio.set_event_loop(loop)
+        loop.call_soon(ready.set)
+        loop.run_forever()
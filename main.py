@@ -1,9 +1,8 @@
-import asyncio
 import os
 from pathlib import Path
 from urllib.parse import urlparse
 
-from gql_client import Client
+from gql_client import SyncClient
 
 
 def load_env(path: str = ".env") -> None:
@@ -54,10 +53,10 @@ def get_graphql_url() -> str:
         base = f"{base_scheme}://{base_host}"
     return f"{base}/{path.lstrip('/')}"
 
-async def main():
+def main():
     load_env()
-    client = Client(url=get_graphql_url())
-    data = await client.query_metadata()
-    print(data)
+    with SyncClient(url=get_graphql_url()) as client:
+        print(client.query_metadata())
 
-asyncio.run(main())
+if __name__ == "__main__":
+    main()
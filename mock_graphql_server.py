@@ -0,0 +1,619 @@
+"""Schema-driven mock GraphQL server for offline load testing.
+
+Builds an ASGI app from the same introspection schema `gen_graphql_ops.py`
+caches and answers every operation with deterministic synthetic data: the same
+request always returns the same values, and paginated connections return
+stable rows for each offset. List sizes, latency, jitter and error rates are
+configurable. The server accepts batched requests, Automatic Persisted Queries
+(APQ), and `graphql-transport-ws` subscriptions. It listens on every path, so
+`http://127.0.0.1:8000/anvil/graphql` works unchanged.
+
+    python mock_graphql_server.py --offline --port 8000 \\
+        --list-size 'TransactionConnection.items=100000' \\
+        --list-size 'Transaction.logs=8' --latency 20 --jitter 5
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import random
+import tomllib
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qs
+
+from gen_graphql_ops import DEFAULT_CACHE_DIR, load_schema, parse_list_weight
+from graphql import (
+    DocumentNode,
+    ExecutionResult,
+    GraphQLError,
+    GraphQLResolveInfo,
+    GraphQLSchema,
+    OperationType,
+    build_client_schema,
+    build_schema,
+    execute,
+    get_named_type,
+    get_nullable_type,
+    get_operation_ast,
+    is_abstract_type,
+    is_enum_type,
+    is_list_type,
+    parse,
+    subscribe,
+    validate,
+)
+
+BASE_BLOCK = 18_000_000
+BASE_TIME = datetime(2024, 1, 1, tzinfo=UTC)
+BLOCK_SECONDS = 12
+PAGE_INFO_FIELDS = {
+    "totalCount",
+    "hasNextPage",
+    "hasPreviousPage",
+    "currentPage",
+    "totalPages",
+}
+NUMERIC_SUFFIXES = (
+    "number",
+    "index",
+    "count",
+    "wei",
+    "gas",
+    "used",
+    "price",
+    "nonce",
+    "fee",
+    "type",
+    "id",
+)
+WS_PROTOCOL = "graphql-transport-ws"
+DOCUMENT_CACHE_SIZE = 512
+
+
+@dataclass
+class MockConfig:
+    default_list_size: int = 3
+    # (pattern, size) pairs matched against "ParentType.field"; first match wins.
+    # For paginated lists the size is the total row count across all pages.
+    list_sizes: list[tuple[str, int]] = field(default_factory=list)
+    txs_per_block: int = 20
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    http_error_rate: float = 0.0
+    subscription_interval: float = 1.0
+    subscription_events: int = 0
+    seed: str = "mock"
+
+    def list_size(self, parent_type: str, field_name: str) -> int:
+        path = f"{parent_type}.{field_name}"
+        for pattern, size in self.list_sizes:
+            if fnmatch(path, pattern):
+                return size
+        return self.default_list_size
+
+
+@dataclass(slots=True)
+class Node:
+    """A synthetic object value; scalars are derived from its `key`.
+
+    `row` is the position of the outermost list item this node belongs to, so a
+    transaction and its logs agree on block number, tx index and hash.
+    """
+
+    key: str
+    index: int = 0
+    row: int = 0
+    row_key: str = ""
+    page: tuple[int, int, int] | None = None  # (offset, limit, total)
+    values: dict[str, Any] = field(default_factory=dict)
+
+
+def _find_page(args: Any) -> tuple[int, int] | None:
+    if isinstance(args, dict):
+        if isinstance(args.get("limit"), int) and isinstance(args.get("offset"), int):
+            return args["offset"], args["limit"]
+        for value in args.values():
+            found = _find_page(value)
+            if found:
+                return found
+    return None
+
+
+class DataFactory:
+    """Field resolver that fabricates values from the schema types."""
+
+    def __init__(self, schema: GraphQLSchema, config: MockConfig) -> None:
+        self.schema = schema
+        self.config = config
+        self.salt = config.seed.encode()[:16]
+
+    def digest(self, key: str) -> bytes:
+        return hashlib.blake2b(key.encode(), digest_size=32, salt=self.salt).digest()
+
+    def resolve(self, parent: Any, info: GraphQLResolveInfo, **args: Any) -> Any:
+        node = (
+            parent
+            if isinstance(parent, Node)
+            else Node(key=info.operation.operation.value)
+        )
+        name = info.field_name
+        return_type = get_nullable_type(info.return_type)
+
+        if is_list_type(return_type):
+            item_type = get_nullable_type(return_type.of_type)
+            start, count = self._window(node, info)
+            if is_list_type(item_type):
+                return [[] for _ in range(count)]
+            named = get_named_type(item_type)
+            if hasattr(named, "fields") or is_abstract_type(named):
+                return [
+                    self._child(node, f"{name}[{i}]", i)
+                    for i in range(start, start + count)
+                ]
+            return [
+                self._scalar(node, named, f"{name}[{i}]")
+                for i in range(start, start + count)
+            ]
+
+        if hasattr(return_type, "fields") or is_abstract_type(return_type):
+            child = self._child(node, name)
+            page = _find_page(args)
+            if page:
+                total = self._connection_total(return_type)
+                child.page = (page[0], page[1], total)
+            return child
+
+        return self._scalar(node, return_type, name)
+
+    def resolve_type(self, value: Any, info: GraphQLResolveInfo, abstract: Any) -> str:
+        return self.schema.get_possible_types(abstract)[0].name
+
+    def _child(self, node: Node, name: str, index: int | None = None) -> Node:
+        key = f"{node.key}.{name}"
+        if index is None:
+            return Node(key, node.index, node.row, node.row_key, node.page)
+        if not node.row_key:
+            return Node(key, index, index, key)
+        return Node(key, index, node.row, node.row_key)
+
+    def _window(self, node: Node, info: GraphQLResolveInfo) -> tuple[int, int]:
+        if node.page is not None:
+            offset, limit, total = node.page
+            return offset, max(0, min(limit, total - offset))
+        return 0, self.config.list_size(info.parent_type.name, info.field_name)
+
+    def _connection_total(self, type_: Any) -> int:
+        for name, field_ in getattr(type_, "fields", {}).items():
+            if is_list_type(get_nullable_type(field_.type)):
+                return self.config.list_size(type_.name, name)
+        return self.config.default_list_size
+
+    def _scalar(self, node: Node, type_: Any, name: str) -> Any:
+        if name in node.values:
+            return node.values[name]
+        value = self._make_scalar(node, type_, name)
+        node.values[name] = value
+        return value
+
+    def _make_scalar(self, node: Node, type_: Any, name: str) -> Any:
+        if node.page is not None and name in PAGE_INFO_FIELDS:
+            offset, limit, total = node.page
+            size = max(limit, 1)
+            return {
+                "totalCount": total,
+                "hasNextPage": offset + limit < total,
+                "hasPreviousPage": offset > 0,
+                "currentPage": offset // size + 1,
+                "totalPages": -(-total // size),
+            }[name]
+
+        block = BASE_BLOCK + node.row // self.config.txs_per_block
+        lower = name.split("[", 1)[0].lower()
+        digest = self.digest(f"{node.key}.{name}")
+        number = int.from_bytes(digest[:6], "big")
+
+        if is_enum_type(type_):
+            values = list(type_.values.values())
+            return values[number % len(values)].value
+        type_name = type_.name
+        if type_name == "Boolean":
+            return lower != "removed" and number % 10 != 0
+        if type_name == "Int":
+            return number % 1000
+        if type_name == "Float":
+            return round(number / float(1 << 48), 6)
+        if type_name == "JSON":
+            return {}
+        if type_name == "DateTime" or lower.endswith("at"):
+            seconds = (block - BASE_BLOCK) * BLOCK_SECONDS
+            return (
+                (BASE_TIME + timedelta(seconds=seconds))
+                .isoformat()
+                .replace("+00:00", "Z")
+            )
+
+        if lower == "blocknumber":
+            return str(block)
+        if lower == "txindex":
+            return str(node.row % self.config.txs_per_block)
+        if lower.endswith("index"):
+            return str(node.index)
+        if lower == "blockhash":
+            return "0x" + self.digest(f"block:{block}").hex()
+        if lower in ("hash", "txhash") and node.row_key:
+            return "0x" + self.digest(node.row_key).hex()
+        if "hash" in lower or "topic" in lower or lower in ("data", "input", "output"):
+            return "0x" + digest.hex()
+        if "address" in lower or lower in ("from", "to"):
+            return "0x" + digest[:20].hex()
+        if lower == "error":
+            return None
+        if lower.endswith(NUMERIC_SUFFIXES):
+            return str(number % 1_000_000_000)
+        return f"{name}-{digest[:4].hex()}"
+
+    async def events(self, parent: Any, info: GraphQLResolveInfo, **args: Any) -> Any:
+        count = 0
+        while (
+            not self.config.subscription_events
+            or count < self.config.subscription_events
+        ):
+            yield Node(f"{info.field_name}#{count}", count, count)
+            count += 1
+            await asyncio.sleep(self.config.subscription_interval)
+
+
+def _graphql_error(message: str, code: str | None = None) -> dict[str, Any]:
+    error: dict[str, Any] = {"message": message}
+    if code:
+        error["extensions"] = {"code": code}
+    return {"errors": [error]}
+
+
+class MockGraphQLServer:
+    """ASGI app serving mock responses for `schema`."""
+
+    def __init__(self, schema: GraphQLSchema, config: MockConfig | None = None) -> None:
+        self.schema = schema
+        self.config = config or MockConfig()
+        self.factory = DataFactory(schema, self.config)
+        self.persisted: dict[str, str] = {}
+        self.documents: dict[str, tuple[DocumentNode | None, list[GraphQLError]]] = {}
+        self.random = random.Random(self.config.seed)  # noqa: S311
+
+    async def __call__(self, scope: dict, receive: Any, send: Any) -> None:
+        if scope["type"] == "http":
+            await self._http(scope, receive, send)
+        elif scope["type"] == "websocket":
+            await self._websocket(scope, receive, send)
+        elif scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+
+    def document(self, query: str) -> tuple[DocumentNode | None, list[GraphQLError]]:
+        cached = self.documents.get(query)
+        if cached is None:
+            try:
+                document = parse(query)
+            except GraphQLError as exc:
+                cached = (None, [exc])
+            else:
+                cached = (document, validate(self.schema, document))
+            if len(self.documents) >= DOCUMENT_CACHE_SIZE:
+                self.documents.pop(next(iter(self.documents)))
+            self.documents[query] = cached
+        return cached
+
+    def resolve_query(self, payload: dict[str, Any]) -> tuple[str | None, dict | None]:
+        """Return the query text for `payload`, applying the APQ protocol."""
+        query = payload.get("query")
+        persisted = (payload.get("extensions") or {}).get("persistedQuery")
+        if not persisted:
+            return query, None
+        sha = persisted.get("sha256Hash", "")
+        if query is None:
+            query = self.persisted.get(sha)
+            if query is None:
+                return None, _graphql_error(
+                    "PersistedQueryNotFound", "PERSISTED_QUERY_NOT_FOUND"
+                )
+            return query, None
+        if hashlib.sha256(query.encode("utf-8")).hexdigest() != sha:
+            return None, _graphql_error(
+                "provided sha does not match query", "BAD_USER_INPUT"
+            )
+        self.persisted[sha] = query
+        return query, None
+
+    async def execute_payload(self, payload: Any) -> dict[str, Any]:
+        if not isinstance(payload, dict):
+            return _graphql_error("Request body must be a JSON object")
+        query, error = self.resolve_query(payload)
+        if error is not None:
+            return error
+        if not query:
+            return _graphql_error("Must provide query string")
+        if self.config.error_rate and self.random.random() < self.config.error_rate:
+            return {"data": None, **_graphql_error("Injected mock error", "MOCK_ERROR")}
+        document, errors = self.document(query)
+        if errors:
+            return {"errors": [e.formatted for e in errors]}
+        result = execute(
+            self.schema,
+            document,
+            variable_values=payload.get("variables"),
+            operation_name=payload.get("operationName"),
+            field_resolver=self.factory.resolve,
+            type_resolver=self.factory.resolve_type,
+        )
+        if asyncio.iscoroutine(result):
+            result = await result
+        return result.formatted
+
+    async def _delay(self) -> None:
+        delay = self.config.latency
+        if self.config.jitter:
+            delay += self.random.uniform(-self.config.jitter, self.config.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def _http(self, scope: dict, receive: Any, send: Any) -> None:
+        body = b""
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body"):
+                break
+
+        await self._delay()
+        if (
+            self.config.http_error_rate
+            and self.random.random() < self.config.http_error_rate
+        ):
+            await _send_json(send, 503, {"message": "Injected mock HTTP error"})
+            return
+
+        try:
+            if scope["method"] == "GET":
+                params = {
+                    k: v[0] for k, v in parse_qs(scope["query_string"].decode()).items()
+                }
+                for key in ("variables", "extensions"):
+                    if key in params:
+                        params[key] = json.loads(params[key])
+                payload: Any = params
+            else:
+                payload = json.loads(body)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            await _send_json(send, 400, _graphql_error("Malformed JSON body"))
+            return
+
+        if isinstance(payload, list):
+            result: Any = list(
+                await asyncio.gather(*map(self.execute_payload, payload))
+            )
+        else:
+            result = await self.execute_payload(payload)
+        await _send_json(send, 200, result)
+
+    async def _websocket(self, scope: dict, receive: Any, send: Any) -> None:
+        tasks: dict[str, asyncio.Task] = {}
+        try:
+            while True:
+                message = await receive()
+                if message["type"] == "websocket.connect":
+                    subprotocol = (
+                        WS_PROTOCOL
+                        if WS_PROTOCOL in scope.get("subprotocols", [])
+                        else None
+                    )
+                    await send({"type": "websocket.accept", "subprotocol": subprotocol})
+                    continue
+                if message["type"] == "websocket.disconnect":
+                    return
+                data = json.loads(message.get("text") or message.get("bytes") or "{}")
+                kind = data.get("type")
+                if kind == "connection_init":
+                    await _send_ws(send, {"type": "connection_ack"})
+                elif kind == "ping":
+                    await _send_ws(send, {"type": "pong"})
+                elif kind == "subscribe":
+                    op_id = data["id"]
+                    tasks[op_id] = asyncio.create_task(
+                        self._operation(send, op_id, data.get("payload") or {})
+                    )
+                    tasks[op_id].add_done_callback(
+                        lambda _, op_id=op_id: tasks.pop(op_id, None)
+                    )
+                elif kind == "complete":
+                    task = tasks.pop(data.get("id"), None)
+                    if task:
+                        task.cancel()
+        finally:
+            for task in tasks.values():
+                task.cancel()
+
+    async def _operation(self, send: Any, op_id: str, payload: dict[str, Any]) -> None:
+        query, error = self.resolve_query(payload)
+        document, errors = self.document(query or "")
+        if error is not None or errors or document is None:
+            payload_errors = error["errors"] if error else [e.formatted for e in errors]
+            await _send_ws(
+                send, {"id": op_id, "type": "error", "payload": payload_errors}
+            )
+            return
+        operation = get_operation_ast(document, payload.get("operationName"))
+        if operation is None or operation.operation != OperationType.SUBSCRIPTION:
+            await self._delay()
+            result = await self.execute_payload(payload)
+            await _send_ws(send, {"id": op_id, "type": "next", "payload": result})
+        else:
+            stream = await subscribe(
+                self.schema,
+                document,
+                variable_values=payload.get("variables"),
+                operation_name=payload.get("operationName"),
+                field_resolver=self.factory.resolve,
+                subscribe_field_resolver=self.factory.events,
+            )
+            if isinstance(stream, ExecutionResult):
+                await _send_ws(
+                    send,
+                    {
+                        "id": op_id,
+                        "type": "error",
+                        "payload": stream.formatted["errors"],
+                    },
+                )
+                return
+            async for result in stream:
+                await _send_ws(
+                    send, {"id": op_id, "type": "next", "payload": result.formatted}
+                )
+        await _send_ws(send, {"id": op_id, "type": "complete"})
+
+
+async def _send_json(send: Any, status: int, payload: Any) -> None:
+    body = json.dumps(payload, separators=(",", ":")).encode()
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+async def _send_ws(send: Any, message: dict[str, Any]) -> None:
+    await send(
+        {"type": "websocket.send", "text": json.dumps(message, separators=(",", ":"))}
+    )
+
+
+def read_schema(path: Path) -> GraphQLSchema:
+    text = path.read_text(encoding="utf-8")
+    if path.suffix == ".json":
+        data = json.loads(text)
+        return build_client_schema(data.get("data", data))
+    return build_schema(text)
+
+
+def default_url() -> str | None:
+    pyproject = Path("pyproject.toml")
+    if not pyproject.exists():
+        return None
+    config = tomllib.loads(pyproject.read_text(encoding="utf-8"))
+    return config.get("tool", {}).get("ariadne-codegen", {}).get("remote_schema_url")
+
+
+def parse_list_size(value: str) -> tuple[str, int]:
+    pattern, size = parse_list_weight(value)
+    return pattern, int(size)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    source = ap.add_mutually_exclusive_group()
+    source.add_argument(
+        "--schema", type=Path, help="SDL (.graphql) or introspection (.json) file"
+    )
+    source.add_argument(
+        "--url", default=default_url(), help="endpoint whose cached schema to serve"
+    )
+    ap.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR)
+    ap.add_argument(
+        "--offline", action="store_true", help="use the cached schema for --url"
+    )
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8000)
+    ap.add_argument(
+        "--list-size",
+        dest="list_sizes",
+        action="append",
+        default=[],
+        type=parse_list_size,
+        metavar="PATTERN=N",
+        help="list length for matching 'Type.field' (total rows for paginated lists)",
+    )
+    ap.add_argument("--default-list-size", type=int, default=3)
+    ap.add_argument("--txs-per-block", type=int, default=20)
+    ap.add_argument(
+        "--latency", type=float, default=0.0, help="added latency per request in ms"
+    )
+    ap.add_argument(
+        "--jitter", type=float, default=0.0, help="uniform +/- jitter in ms"
+    )
+    ap.add_argument(
+        "--error-rate",
+        type=float,
+        default=0.0,
+        help="fraction of operations answered with a GraphQL error",
+    )
+    ap.add_argument(
+        "--http-error-rate",
+        type=float,
+        default=0.0,
+        help="fraction of requests answered with HTTP 503",
+    )
+    ap.add_argument(
+        "--subscription-interval",
+        type=float,
+        default=1000.0,
+        help="ms between subscription events",
+    )
+    ap.add_argument(
+        "--subscription-events",
+        type=int,
+        default=0,
+        help="events per subscription (0 = unbounded)",
+    )
+    ap.add_argument("--seed", default="mock")
+    args = ap.parse_args()
+
+    if args.schema:
+        schema = read_schema(args.schema)
+    elif args.url:
+        schema, _ = load_schema(args.url, Path(args.cache_dir), offline=args.offline)
+    else:
+        ap.error("pass --schema or --url")
+
+    config = MockConfig(
+        default_list_size=args.default_list_size,
+        list_sizes=args.list_sizes,
+        txs_per_block=args.txs_per_block,
+        latency=args.latency / 1000,
+        jitter=args.jitter / 1000,
+        error_rate=args.error_rate,
+        http_error_rate=args.http_error_rate,
+        subscription_interval=args.subscription_interval / 1000,
+        subscription_events=args.subscription_events,
+        seed=args.seed,
+    )
+
+    import uvicorn
+
+    uvicorn.run(
+        MockGraphQLServer(schema, config),
+        host=args.host,
+        port=args.port,
+        log_level="warning",
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+import json
+from collections.abc import AsyncIterator
+from typing import Any
+
+from fastapi import APIRouter, FastAPI, Request, Response
+from fastapi.responses import StreamingResponse
+from gql_client import GraphQLClientDeadlineError
+from pydantic import BaseModel
+
+from .disconnect import (
+    CLIENT_CLOSED_REQUEST,
+    ClientDisconnectedError,
+    cancel_on_disconnect,
+)
+from .services.operations import OperationRunner, OperationsCatalog
+
+NDJSON = "application/x-ndjson"
+
+
+def _json_response(value: Any, status_code: int = 200) -> Response:
+    if isinstance(value, BaseModel):
+        body = value.model_dump_json(by_alias=True)
+    else:
+        body = json.dumps(value, separators=(",", ":"), default=str)
+    return Response(body, status_code=status_code, media_type="application/json")
+
+
+def _error(status_code: int, message: str) -> Response:
+    return _json_response({"error": message}, status_code)
+
+
+async def _ndjson(items: AsyncIterator[Any]) -> AsyncIterator[bytes]:
+    try:
+        async for item in items:
+            yield item.model_dump_json(by_alias=True).encode() + b"\n"
+    except Exception as exc:
+        # Headers are already sent; report the failure as the last line.
+        yield json.dumps({"error": str(exc)}).encode() + b"\n"
+
+
+def register_api_routes(
+    app: FastAPI, catalog: OperationsCatalog, runner: OperationRunner
+) -> None:
+    router = APIRouter(prefix="/api")
+
+    @router.post("/run/{name}")
+    async def run_operation(
+        request: Request,
+        name: str,
+        format: str | None = None,
+        page_size: int | None = None,
+        limit: int | None = None,
+    ) -> Response:
+        """Run `name` with the JSON object body as its arguments.
+
+        Paginated operations stream every item as NDJSON when asked with
+        `?format=ndjson` or `Accept: application/x-ndjson`.
+        """
+        try:
+            operation = catalog.get(name)
+        except KeyError as exc:
+            return _error(404, str(exc.args[0]))
+        try:
+            body = await request.body()
+            arguments = json.loads(body) if body.strip() else {}
+            if not isinstance(arguments, dict):
+                raise ValueError("Body must be a JSON object of arguments")
+            kwargs = runner.parse_arguments(name, arguments)
+        except ValueError as exc:
+            return _error(400, str(exc))
+
+        accept = request.headers.get("accept", "")
+        if format == "ndjson" or NDJSON in accept:
+            if operation.iterator is None:
+                return _error(400, f"{name} is not paginated")
+            items = runner.iter_items(name, kwargs, page_size=page_size, limit=limit)
+            return StreamingResponse(_ndjson(items), media_type=NDJSON)
+
+        call = runner.call(name, kwargs)
+        try:
+            if operation.kind == "query":
+                result = await cancel_on_disconnect(request, call)
+            else:
+                result = await call
+        except ClientDisconnectedError:
+            return Response(status_code=CLIENT_CLOSED_REQUEST)
+        except GraphQLClientDeadlineError as exc:
+            return _error(504, str(exc))
+        except Exception as exc:
+            return _error(502, str(exc))
+        return _json_response(result)
+
+    app.include_router(router)
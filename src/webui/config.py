@@ -1,5 +1,5 @@
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from urllib.parse import urlparse
 
@@ -19,6 +19,16 @@ def load_env(path: str = ".env") -> None:
             os.environ.setdefault(key, value)
 
 
+def parse_timeouts(value: str) -> dict[str, float]:
+    """`name=seconds` pairs separated by commas, e.g. `query_transactions=60`."""
+    timeouts: dict[str, float] = {}
+    for item in value.split(","):
+        name, _, seconds = item.partition("=")
+        if name.strip():
+            timeouts[name.strip()] = float(seconds)
+    return timeouts
+
+
 def build_graphql_url(
     scheme: str,
     host: str,
@@ -62,6 +72,23 @@ class Settings:
     graphql_chain: str | None
     graphql_path: str | None
     graphql_url: str
+    result_cache_ttl: float = 5.0
+    result_cache_stale: float = 60.0
+    batch_concurrency: int = 4
+    batch_timeout: float = 10.0
+    shared_cache_path: str | None = None
+    shared_cache_max_mb: int = 64
+    warmup_connections: int = 4
+    ready_probe_ttl: float = 5.0
+    operation_timeout: float = 30.0
+    operation_timeouts: dict[str, float] = field(default_factory=dict)
+    decode_offload_kb: int = 0
+    decode_workers: int = 2
+    decode_pool: str = "process"
+
+    def timeout_for(self, name: str) -> float:
+        """Seconds operation `name` may take end to end."""
+        return self.operation_timeouts.get(name, self.operation_timeout)
 
 
 def get_settings() -> Settings:
@@ -71,9 +98,7 @@ def get_settings() -> Settings:
     port = os.getenv("GRAPHQL_PORT")
     chain = os.getenv("GRAPHQL_CHAIN")
     path = os.getenv("GRAPHQL_PATH")
-    url = build_graphql_url(
-        scheme=scheme, host=host, port=port, chain=chain, path=path
-    )
+    url = build_graphql_url(scheme=scheme, host=host, port=port, chain=chain, path=path)
     return Settings(
         graphql_scheme=scheme,
         graphql_host=host,
@@ -81,4 +106,17 @@ def get_settings() -> Settings:
         graphql_chain=chain,
         graphql_path=path,
         graphql_url=url,
+        result_cache_ttl=float(os.getenv("RESULT_CACHE_TTL", "5")),
+        result_cache_stale=float(os.getenv("RESULT_CACHE_STALE", "60")),
+        batch_concurrency=int(os.getenv("BATCH_CONCURRENCY", "4")),
+        batch_timeout=float(os.getenv("BATCH_TIMEOUT", "10")),
+        shared_cache_path=os.getenv("SHARED_CACHE_PATH") or None,
+        shared_cache_max_mb=int(os.getenv("SHARED_CACHE_MAX_MB", "64")),
+        warmup_connections=int(os.getenv("WARMUP_CONNECTIONS", "4")),
+        ready_probe_ttl=float(os.getenv("READY_PROBE_TTL", "5")),
+        operation_timeout=float(os.getenv("OPERATION_TIMEOUT", "30")),
+        operation_timeouts=parse_timeouts(os.getenv("OPERATION_TIMEOUTS", "")),
+        decode_offload_kb=int(os.getenv("DECODE_OFFLOAD_KB", "0")),
+        decode_workers=int(os.getenv("DECODE_WORKERS", "2")),
+        decode_pool=os.getenv("DECODE_POOL", "process"),
     )
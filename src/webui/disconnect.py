@@ -0,0 +1,32 @@
+import asyncio
+from collections.abc import Awaitable
+from typing import Any
+
+from fastapi import Request
+
+# How often a pending request checks whether its client is still there.
+DISCONNECT_POLL = 0.1
+# Non-standard status (from nginx) logged for requests abandoned by the client.
+CLIENT_CLOSED_REQUEST = 499
+
+
+class ClientDisconnectedError(Exception):
+    """The client went away before its result was ready."""
+
+
+async def cancel_on_disconnect(request: Request, awaitable: Awaitable[Any]) -> Any:
+    """Await `awaitable`, cancelling it as soon as the client disconnects.
+
+    Read the request body before calling this; the disconnect check consumes
+    incoming messages.
+    """
+    task = asyncio.ensure_future(awaitable)
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=DISCONNECT_POLL)
+            if done:
+                return task.result()
+            if await request.is_disconnected():
+                raise ClientDisconnectedError()
+    finally:
+        task.cancel()
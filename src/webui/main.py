@@ -1,12 +1,22 @@
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
+from gql_client import SharedResponseCache
 
+from .api import register_api_routes
 from .config import get_settings
 from .routes import register_routes
-from .services.operations import OperationRunner, OperationsCatalog
+from .services.operations import PROBE_OPERATION, OperationRunner, OperationsCatalog
+from .services.readiness import Readiness
+from .services.result_cache import ResultCache
+
+logger = logging.getLogger(__name__)
 
 
 def create_app() -> FastAPI:
@@ -14,16 +24,55 @@ def create_app() -> FastAPI:
     settings = get_settings()
     catalog = OperationsCatalog()
     runner = OperationRunner(settings=settings, catalog=catalog)
+    shared = None
+    if settings.shared_cache_path:
+        # One file for all worker processes, so added workers start warm and
+        # do not multiply upstream queries.
+        shared = SharedResponseCache(
+            settings.shared_cache_path,
+            max_bytes=settings.shared_cache_max_mb * 1024 * 1024,
+        )
+    cache = ResultCache(
+        ttl=settings.result_cache_ttl,
+        stale_ttl=settings.result_cache_stale,
+        shared=shared,
+    )
+    readiness = Readiness(
+        lambda: runner.call(PROBE_OPERATION, {}), ttl=settings.ready_probe_ttl
+    )
     templates = Jinja2Templates(directory=str(base_dir / "templates"))
 
-    app = FastAPI()
+    async def warm_up() -> None:
+        try:
+            await runner.warm_up(settings.warmup_connections)
+        except Exception:
+            logger.exception("Warm-up failed")
+            return
+        readiness.warmed_up = True
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        # Warm-up runs behind the started server; `/ready` reports it.
+        task = asyncio.create_task(warm_up())
+        try:
+            yield
+        finally:
+            task.cancel()
+            await runner.aclose()
+            if shared is not None:
+                shared.close()
+
+    app = FastAPI(lifespan=lifespan)
     app.state.settings = settings
     app.state.catalog = catalog
     app.state.runner = runner
+    app.state.cache = cache
+    app.state.readiness = readiness
     app.state.templates = templates
     app.mount("/static", StaticFiles(directory=str(base_dir / "static")), name="static")
 
-    register_routes(app, templates, catalog, runner)
+    register_routes(app, templates, catalog, runner, cache, readiness)
+    register_api_routes(app, catalog, runner)
     return app
 
 
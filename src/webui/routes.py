@@ -1,15 +1,82 @@
 import json
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+from functools import partial
 from typing import Any
+from urllib.parse import urlencode
 
-from fastapi import APIRouter, FastAPI, Request
-from fastapi.responses import HTMLResponse
+from fastapi import APIRouter, FastAPI, Request, Response
+from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
 from fastapi.templating import Jinja2Templates
+from pydantic import BaseModel
+from starlette.datastructures import ImmutableMultiDict
 
+from .disconnect import (
+    CLIENT_CLOSED_REQUEST,
+    ClientDisconnectedError,
+    cancel_on_disconnect,
+)
+from .services.batch import BatchResult, run_batch
 from .services.operations import OperationRunner, OperationsCatalog
+from .services.readiness import Readiness
+from .services.result_cache import CacheEntry, ResultCache, etag_matches
+from .services.result_view import buffered, items_page, iter_json, split_payload
 
 
-def _format_payload(payload: Any) -> str:
-    return json.dumps(payload, indent=2, ensure_ascii=True, default=str)
+def _form_query(form_data: Mapping[str, Any]) -> str:
+    # Internal `_path`/`_offset` parameters are not operation inputs.
+    items = (
+        form_data.multi_items()
+        if isinstance(form_data, ImmutableMultiDict)
+        else form_data.items()
+    )
+    return urlencode(
+        [
+            (key, value)
+            for key, value in items
+            if isinstance(value, str) and not key.startswith("_")
+        ]
+    )
+
+
+def _form_batch(form_data: Any) -> list[tuple[str, dict[str, str]]]:
+    # Inputs of every listed operation, taken from `<operation>.<field>` keys.
+    requests = []
+    for name in form_data.getlist("operations"):
+        prefix = f"{name}."
+        inputs = {
+            key.removeprefix(prefix): value
+            for key, value in form_data.multi_items()
+            if key.startswith(prefix) and isinstance(value, str)
+        }
+        requests.append((name, inputs))
+    return requests
+
+
+def _json_batch(
+    body: bytes, runner: OperationRunner
+) -> list[tuple[str, dict[str, Any]]]:
+    document = json.loads(body) if body.strip() else {}
+    operations = document.get("operations") if isinstance(document, dict) else None
+    if not isinstance(operations, list):
+        raise ValueError('Body must be {"operations": [{"name": ..., ...}]}')
+    requests = []
+    for item in operations:
+        if not isinstance(item, dict) or not isinstance(item.get("name"), str):
+            raise ValueError("Every operation needs a name")
+        arguments = item.get("arguments") or {}
+        if not isinstance(arguments, dict):
+            raise ValueError(f"Arguments of {item['name']} must be a JSON object")
+        requests.append((item["name"], runner.parse_arguments(item["name"], arguments)))
+    return requests
+
+
+def _batch_json(result: BatchResult) -> dict[str, Any]:
+    if not result.ok:
+        return {"name": result.name, "ok": False, **result.payload}
+    data = result.payload
+    if isinstance(data, BaseModel):
+        data = data.model_dump(mode="json", by_alias=True)
+    return {"name": result.name, "ok": True, "data": data}
 
 
 def register_routes(
@@ -17,22 +84,89 @@ def register_routes(
     templates: Jinja2Templates,
     catalog: OperationsCatalog,
     runner: OperationRunner,
+    cache: ResultCache,
+    readiness: Readiness,
 ) -> None:
     router = APIRouter()
 
+    def render(template_name: str, context: dict[str, Any]) -> StreamingResponse:
+        # Rendering runs chunk by chunk in the threadpool, off the event loop.
+        template = templates.get_template(template_name)
+        return StreamingResponse(
+            buffered(template.generate(context)), media_type="text/html"
+        )
+
+    def result_context(
+        title: str,
+        payload: Any,
+        ok: bool,
+        form_data: Mapping[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        summary, pages = split_payload(payload)
+        query = _form_query(form_data) if form_data is not None else None
+        return {
+            "title": title,
+            "payload": summary,
+            "pages": pages,
+            "ok": ok,
+            "more_url": None if query is None else f"/run/{title}/items?{query}",
+            "download_url": (
+                None if query is None else f"/run/{title}/download?{query}"
+            ),
+        }
+
     def render_result(
-        request: Request, title: str, payload: Any, ok: bool
-    ) -> HTMLResponse:
-        return templates.TemplateResponse(
+        request: Request,
+        title: str,
+        payload: Any,
+        ok: bool,
+        form_data: Mapping[str, Any] | None = None,
+    ) -> StreamingResponse:
+        return render(
             "partials/result.html",
-            {
-                "request": request,
-                "title": title,
-                "payload": _format_payload(payload),
-                "ok": ok,
-            },
+            {"request": request, **result_context(title, payload, ok, form_data)},
         )
 
+    async def cached_result(name: str, form_data: Mapping[str, Any]) -> CacheEntry:
+        kwargs = runner.decode_form(name, form_data)
+        return await cache.get(
+            runner.cache_key(name, kwargs), lambda: runner.run(name, kwargs)
+        )
+
+    async def run_query(
+        request: Request, name: str, form_data: Mapping[str, Any]
+    ) -> Response:
+        try:
+            entry = await cancel_on_disconnect(request, cached_result(name, form_data))
+        except ClientDisconnectedError:
+            return Response(status_code=CLIENT_CLOSED_REQUEST)
+        except Exception as exc:
+            return render_result(request, name, {"error": str(exc)}, False)
+        # no-cache makes browsers revalidate every time, so unchanged panels
+        # cost a 304 instead of a render.
+        headers = {"ETag": entry.etag, "Cache-Control": "no-cache"}
+        if etag_matches(request.headers.get("if-none-match"), entry.etag):
+            return Response(status_code=304, headers=headers)
+        response = render_result(request, name, entry.payload, True, form_data)
+        response.headers.update(headers)
+        return response
+
+    def is_query(name: str) -> bool:
+        try:
+            return catalog.get(name).kind == "query"
+        except KeyError:
+            return False
+
+    async def run_batch_for(
+        request: Request, calls: Sequence[tuple[str, Callable[[], Awaitable[Any]]]]
+    ) -> list[BatchResult]:
+        settings = runner.settings
+        batch = run_batch(calls, settings.batch_concurrency, settings.batch_timeout)
+        # Mutations run to completion even when nobody waits for their result.
+        if all(is_query(name) for name, _ in calls):
+            return await cancel_on_disconnect(request, batch)
+        return await batch
+
     @router.get("/", response_class=HTMLResponse)
     async def index(request: Request) -> HTMLResponse:
         operations = catalog.list_operations()
@@ -49,11 +183,131 @@ def register_routes(
     async def health() -> dict[str, str]:
         return {"status": "ok"}
 
+    @router.get("/ready")
+    async def ready() -> JSONResponse:
+        """200 once warmed up and upstream answers the (cached) probe."""
+        ok, status = await readiness.check()
+        return JSONResponse(status, status_code=200 if ok else 503)
+
+    @router.get("/metrics")
+    async def metrics() -> dict[str, Any]:
+        offload = runner.offload
+        return {"decode": None if offload is None else offload.stats.as_dict()}
+
+    @router.get("/run/{name}", response_class=HTMLResponse)
+    async def run_cached_query(request: Request, name: str) -> Response:
+        if not is_query(name):
+            return render_result(
+                request, name, {"error": f"{name} is not a query; use POST"}, False
+            )
+        return await run_query(request, name, request.query_params)
+
+    @router.get("/run/{name}/items", response_class=HTMLResponse)
+    async def more_items(request: Request, name: str) -> Response:
+        params = request.query_params
+        try:
+            if not is_query(name):
+                raise KeyError(f"Unknown query: {name}")
+            entry = await cached_result(name, params)
+            page = items_page(
+                entry.payload, params.get("_path", ""), int(params.get("_offset", 0))
+            )
+        except Exception as exc:
+            return render_result(request, name, {"error": str(exc)}, False)
+        return render(
+            "partials/items.html",
+            {
+                "request": request,
+                "page": page,
+                "more_url": f"/run/{name}/items?{_form_query(params)}",
+            },
+        )
+
+    @router.get("/run/{name}/download")
+    async def download(request: Request, name: str) -> Response:
+        if not is_query(name):
+            return Response(status_code=404)
+        try:
+            entry = await cached_result(name, request.query_params)
+        except Exception as exc:
+            return Response(str(exc), status_code=502, media_type="text/plain")
+        return StreamingResponse(
+            iter_json(entry.payload),
+            media_type="application/json",
+            headers={
+                "Content-Disposition": f'attachment; filename="{name}.json"',
+                "ETag": entry.etag,
+            },
+        )
+
+    @router.post("/run-batch", response_class=HTMLResponse)
+    async def run_batch_operations(request: Request) -> Response:
+        """Run several operations in one round trip.
+
+        A form body names the operations in repeated `operations` fields and
+        prefixes their inputs with the operation name (`query_block.number`);
+        the results come back as one HTML fragment. A JSON body of the form
+        `{"operations": [{"name": ..., "arguments": {...}}]}` gets a JSON
+        document of results instead.
+        """
+        if request.headers.get("content-type", "").startswith("application/json"):
+            try:
+                calls = [
+                    (name, partial(runner.call, name, kwargs))
+                    for name, kwargs in _json_batch(await request.body(), runner)
+                ]
+            except KeyError as exc:
+                return JSONResponse({"error": exc.args[0]}, status_code=400)
+            except ValueError as exc:
+                return JSONResponse({"error": str(exc)}, status_code=400)
+            try:
+                results = await run_batch_for(request, calls)
+            except ClientDisconnectedError:
+                return Response(status_code=CLIENT_CLOSED_REQUEST)
+            return JSONResponse({"results": [_batch_json(r) for r in results]})
+
+        form_data = await request.form()
+        requests = _form_batch(form_data)
+
+        def call(name: str, inputs: Mapping[str, Any]) -> Awaitable[Any]:
+            if not is_query(name):
+                return runner.run(name, runner.decode_form(name, inputs))
+
+            async def cached() -> Any:
+                return (await cached_result(name, inputs)).payload
+
+            return cached()
+
+        try:
+            results = await run_batch_for(
+                request,
+                [(name, partial(call, name, inputs)) for name, inputs in requests],
+            )
+        except ClientDisconnectedError:
+            return Response(status_code=CLIENT_CLOSED_REQUEST)
+        return render(
+            "partials/batch.html",
+            {
+                "request": request,
+                "results": [
+                    result_context(
+                        result.name,
+                        result.payload,
+                        result.ok,
+                        inputs if result.ok and is_query(result.name) else None,
+                    )
+                    for result, (_, inputs) in zip(results, requests, strict=True)
+                ],
+            },
+        )
+
     @router.post("/run/{name}", response_class=HTMLResponse)
-    async def run_operation(request: Request, name: str) -> HTMLResponse:
+    async def run_operation(request: Request, name: str) -> Response:
         try:
             form_data = await request.form()
-            data = await runner.run(name, form_data)
+            if is_query(name):
+                return await run_query(request, name, form_data)
+            data = await runner.run(name, runner.decode_form(name, form_data))
         except Exception as exc:
             return render_result(request, name, {"error": str(exc)}, False)
         return render_result(request, name, data, True)
@@ -0,0 +1,39 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    name: str
+    ok: bool
+    payload: Any
+
+
+async def run_batch(
+    calls: Sequence[tuple[str, Callable[[], Awaitable[Any]]]],
+    concurrency: int,
+    timeout: float,
+) -> list[BatchResult]:
+    """Run `calls` concurrently and return their results in order.
+
+    At most `concurrency` calls run at once. Each gets `timeout` seconds from
+    the moment it starts; failures and timeouts become error results instead
+    of failing the whole batch.
+    """
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+    async def run_one(name: str, call: Callable[[], Awaitable[Any]]) -> BatchResult:
+        async with semaphore:
+            try:
+                payload = await asyncio.wait_for(call(), timeout)
+            except TimeoutError:
+                return BatchResult(
+                    name, False, {"error": f"Timed out after {timeout:g}s"}
+                )
+            except Exception as exc:
+                return BatchResult(name, False, {"error": str(exc)})
+        return BatchResult(name, True, payload)
+
+    return list(await asyncio.gather(*(run_one(name, call) for name, call in calls)))
@@ -1,3 +1,4 @@
+import functools
 import inspect
 from dataclasses import dataclass
 from typing import Any
@@ -15,14 +16,20 @@ def _serialize(obj: Any) -> Any:
     return obj
 
 
+@functools.cache
+def _keyword_names(func: Any) -> frozenset[str]:
+    signature = inspect.signature(func)
+    return frozenset(
+        name
+        for name, param in signature.parameters.items()
+        if name != "self"
+        and param.kind in (param.POSITIONAL_OR_KEYWORD, param.KEYWORD_ONLY)
+    )
+
+
 def _filter_kwargs(callable_, kwargs: dict[str, Any]) -> dict[str, Any]:
-    signature = inspect.signature(callable_)
-    allowed: set[str] = set()
-    for name, param in signature.parameters.items():
-        if name == "self":
-            continue
-        if param.kind in (param.POSITIONAL_OR_KEYWORD, param.KEYWORD_ONLY):
-            allowed.add(name)
+    # Signatures are read once per client function, not once per call.
+    allowed = _keyword_names(getattr(callable_, "__func__", callable_))
     return {key: value for key, value in kwargs.items() if key in allowed}
 
 
@@ -1,14 +1,34 @@
+import asyncio
 import inspect
 import json
-from collections.abc import Mapping
+import logging
+from collections.abc import AsyncIterator, Iterator, Mapping
 from dataclasses import dataclass
 from types import UnionType
-from typing import Any, Optional, get_args, get_origin
-
-from gql_client import Client
+from typing import (
+    Any,
+    NotRequired,
+    Optional,
+    Required,
+    TypedDict,
+    Union,
+    get_args,
+    get_origin,
+)
+
+import httpx
+from gql_client import Client, OffloadDecoder, deadline
+from gql_client.base_model import UnsetType
+from pydantic import BaseModel, ConfigDict, TypeAdapter, ValidationError
+from starlette.datastructures import ImmutableMultiDict
 
 from ..config import Settings
 
+logger = logging.getLogger(__name__)
+
+# Cheap query without arguments, used to open connections and check upstream.
+PROBE_OPERATION = "query_eth_syncing"
+
 
 @dataclass(frozen=True)
 class OperationParam:
@@ -26,6 +46,14 @@ class Operation:
     kind_label: str
     theme: str
     params: list[OperationParam]
+    iterator: str | None = None
+
+
+def _without_unset(annotation: Any) -> Any:
+    if get_origin(annotation) is Union:
+        args = tuple(arg for arg in get_args(annotation) if arg is not UnsetType)
+        return Union[args]  # noqa: UP007
+    return annotation
 
 
 def _normalize_annotation(annotation: Any) -> tuple[type | None, str]:
@@ -47,6 +75,107 @@ def _normalize_annotation(annotation: Any) -> tuple[type | None, str]:
     return None, str(annotation)
 
 
+def _is_structured(annotation: Any) -> bool:
+    """Whether form values for `annotation` are JSON documents."""
+    if isinstance(annotation, type):
+        return issubclass(annotation, BaseModel | list | dict)
+    origin = get_origin(annotation)
+    if origin in (list, dict):
+        return True
+    if origin in (Optional, UnionType) or str(origin).endswith("Union"):
+        return any(_is_structured(arg) for arg in get_args(annotation))
+    return False
+
+
+def _validation_message(exc: ValidationError) -> str:
+    messages = []
+    for error in exc.errors():
+        location = ".".join(str(part) for part in error["loc"])
+        if error["type"] == "missing":
+            messages.append(f"{location} is required")
+        elif error["type"] == "extra_forbidden":
+            messages.append(f"Unknown argument: {location}")
+        else:
+            messages.append(f"{location}: {error['msg']}")
+    return "; ".join(messages)
+
+
+class ArgumentDecoder:
+    """Typed keyword arguments of one client method, validated in one pass.
+
+    Compiled once per operation at discovery. Form fields and JSON arguments
+    are both validated against a `TypedDict` of the method parameters, so
+    nested inputs such as `TransactionQueryInput` go straight into their
+    generated models.
+    """
+
+    def __init__(self, name: str, params: dict[str, inspect.Parameter]) -> None:
+        fields: dict[str, Any] = {}
+        self._names = frozenset(params)
+        self._structured: set[str] = set()
+        for param_name, param in params.items():
+            annotation = _without_unset(param.annotation)
+            if param.default is inspect._empty:
+                fields[param_name] = Required[annotation]
+            else:
+                fields[param_name] = NotRequired[annotation]
+            if _is_structured(annotation):
+                self._structured.add(param_name)
+        arguments = TypedDict(f"{name}_arguments", fields)  # type: ignore[misc]
+        arguments.__pydantic_config__ = ConfigDict(extra="forbid")  # type: ignore[attr-defined]
+        self._adapter: TypeAdapter[Any] = TypeAdapter(arguments)
+
+    def decode(self, arguments: Mapping[str, Any]) -> dict[str, Any]:
+        try:
+            return self._adapter.validate_python(arguments)
+        except ValidationError as exc:
+            raise ValueError(_validation_message(exc)) from None
+
+    def decode_form(self, form_data: Mapping[str, Any]) -> dict[str, Any]:
+        """Arguments from form fields.
+
+        Empty fields count as missing. Structured inputs take JSON text, or
+        dotted fields for single members such as `input.pagination.limit`.
+        Fields that are not parameters are ignored.
+        """
+        items = (
+            form_data.multi_items()
+            if isinstance(form_data, ImmutableMultiDict)
+            else form_data.items()
+        )
+        arguments: dict[str, Any] = {}
+        for key, raw in items:
+            name, _, path = key.partition(".")
+            if name not in self._names or not isinstance(raw, str):
+                continue
+            value: Any = raw.strip()
+            if not value:
+                continue
+            if path:
+                target = arguments.setdefault(name, {})
+                if not isinstance(target, dict):
+                    raise ValueError(f"{name} is given both as a value and by field")
+                *parents, last = path.split(".")
+                for part in parents:
+                    target = target.setdefault(part, {})
+                target[last] = value
+                continue
+            if name in self._structured and value[:1] in ("{", "["):
+                try:
+                    value = json.loads(value)
+                except json.JSONDecodeError as exc:
+                    raise ValueError(f"{name}: invalid JSON ({exc.msg})") from None
+            arguments[name] = value
+        return self.decode(arguments)
+
+    def key(self, kwargs: Mapping[str, Any]) -> str:
+        """Canonical JSON of validated `kwargs`."""
+        plain = self._adapter.dump_python(
+            dict(kwargs), mode="json", by_alias=True, exclude_unset=True
+        )
+        return json.dumps(plain, sort_keys=True, separators=(",", ":"))
+
+
 def _build_param(name: str, annotation: Any, required: bool) -> OperationParam:
     base_type, type_name = _normalize_annotation(annotation)
     lower_name = name.lower()
@@ -57,6 +186,9 @@ def _build_param(name: str, annotation: Any, required: bool) -> OperationParam:
     elif base_type in (int, float):
         input_type = "number"
         placeholder = type_name
+    elif _is_structured(annotation):
+        input_type = "textarea"
+        placeholder = "json"
     elif any(token in lower_name for token in ("tx", "raw", "payload", "data")):
         input_type = "textarea"
         placeholder = "json or string"
@@ -73,6 +205,13 @@ def _build_param(name: str, annotation: Any, required: bool) -> OperationParam:
     )
 
 
+def _models_in(annotation: Any) -> Iterator[type[BaseModel]]:
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        yield annotation
+    for arg in get_args(annotation):
+        yield from _models_in(arg)
+
+
 def _kind_from_name(name: str) -> tuple[str, str, str]:
     if name.startswith("query_"):
         return "query", "Query", "blue"
@@ -83,6 +222,8 @@ def _kind_from_name(name: str) -> tuple[str, str, str]:
 
 class OperationsCatalog:
     def __init__(self) -> None:
+        self._decoders: dict[str, ArgumentDecoder] = {}
+        self._models: set[type[BaseModel]] = set()
         self._operations = self._discover_operations()
 
     def list_operations(self) -> list[Operation]:
@@ -93,22 +234,58 @@ class OperationsCatalog:
             raise KeyError(f"Unknown operation: {name}")
         return self._operations[name]
 
+    def decoder(self, name: str) -> ArgumentDecoder:
+        self.get(name)
+        return self._decoders[name]
+
+    def build_models(self) -> int:
+        """Build the deferred pydantic schemas of every operation's models.
+
+        Generated models build on first use, which would otherwise land on
+        the first request of each operation. Returns how many were built.
+        """
+        built = 0
+        for model in self._models:
+            if not model.__pydantic_complete__ and model.model_rebuild():
+                built += 1
+        return built
+
     def _discover_operations(self) -> dict[str, Operation]:
         operations: dict[str, Operation] = {}
+        iterators = {
+            func.__paginates__: name
+            for name, func in Client.__dict__.items()
+            if getattr(func, "__paginates__", None)
+            and not inspect.iscoroutinefunction(func)
+        }
         for name, func in Client.__dict__.items():
             if name.startswith("_"):
                 continue
             if not inspect.iscoroutinefunction(func):
                 continue
+            if getattr(func, "__paginates__", None):
+                continue
             sig = inspect.signature(func)
-            params: list[OperationParam] = []
-            for param in sig.parameters.values():
-                if param.name == "self":
-                    continue
-                if param.kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD):
-                    continue
-                required = param.default is inspect._empty
-                params.append(_build_param(param.name, param.annotation, required))
+            arguments = {
+                param.name: param
+                for param in sig.parameters.values()
+                if param.name != "self"
+                and param.kind not in (param.VAR_POSITIONAL, param.VAR_KEYWORD)
+            }
+            params = [
+                _build_param(
+                    param.name,
+                    _without_unset(param.annotation),
+                    param.default is inspect._empty,
+                )
+                for param in arguments.values()
+            ]
+            self._decoders[name] = ArgumentDecoder(name, arguments)
+            for annotation in (
+                sig.return_annotation,
+                *(param.annotation for param in arguments.values()),
+            ):
+                self._models.update(_models_in(annotation))
             kind, kind_label, theme = _kind_from_name(name)
             operations[name] = Operation(
                 name=name,
@@ -116,69 +293,129 @@ class OperationsCatalog:
                 kind_label=kind_label,
                 theme=theme,
                 params=params,
+                iterator=iterators.get(name),
             )
         return dict(sorted(operations.items()))
 
 
 class OperationRunner:
-    def __init__(self, settings: Settings, catalog: OperationsCatalog) -> None:
+    def __init__(
+        self,
+        settings: Settings,
+        catalog: OperationsCatalog,
+        http_client: httpx.AsyncClient | None = None,
+    ) -> None:
         self._settings = settings
         self._catalog = catalog
+        # One pool for every call, so connections outlive single requests.
+        self._http = http_client or httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=max(settings.warmup_connections, 20),
+            )
+        )
+        # Large responses are decoded in a pool so the loop keeps serving
+        # small requests meanwhile.
+        self.offload = (
+            OffloadDecoder(
+                threshold=settings.decode_offload_kb * 1024,
+                workers=settings.decode_workers,
+                processes=settings.decode_pool == "process",
+            )
+            if settings.decode_offload_kb > 0
+            else None
+        )
 
     @property
     def settings(self) -> Settings:
         return self._settings
 
-    async def run(self, name: str, form_data: Mapping[str, Any]) -> Any:
-        operation = self._catalog.get(name)
-        kwargs = self._build_kwargs(operation, form_data)
-        async with Client(url=self._settings.graphql_url) as client:
-            method = getattr(client, name)
-            result = await method(**kwargs)
-        return self._serialize(result)
-
-    def _build_kwargs(
-        self, operation: Operation, form_data: Mapping[str, Any]
+    async def aclose(self) -> None:
+        await self._http.aclose()
+        if self.offload is not None:
+            self.offload.close()
+
+    async def warm_up(self, connections: int) -> None:
+        """Build models, start the decode pool and open `connections` connections.
+
+        Connections are opened by concurrent probe queries and stay in the
+        pool. An unreachable upstream is logged, not raised; readiness checks
+        report it.
+        """
+        built = await asyncio.to_thread(self._catalog.build_models)
+        if self.offload is not None:
+            await self.offload.start()
+        results = await asyncio.gather(
+            *(self.call(PROBE_OPERATION, {}) for _ in range(connections)),
+            return_exceptions=True,
+        )
+        failures = [result for result in results if isinstance(result, Exception)]
+        if failures:
+            logger.warning(
+                "Warm-up could not reach upstream (%d of %d probes failed): %s",
+                len(failures),
+                connections,
+                failures[0],
+            )
+        logger.info(
+            "Warm-up done: %d models built, %d connections opened",
+            built,
+            connections - len(failures),
+        )
+
+    def _client(self) -> Client:
+        return Client(
+            url=self._settings.graphql_url,
+            http_client=self._http,
+            offload=self.offload,
+        )
+
+    def decode_form(self, name: str, form_data: Mapping[str, Any]) -> dict[str, Any]:
+        """Typed inputs of `name` from submitted form fields."""
+        return self._catalog.decoder(name).decode_form(form_data)
+
+    def parse_arguments(
+        self, name: str, arguments: Mapping[str, Any]
     ) -> dict[str, Any]:
-        kwargs: dict[str, Any] = {}
-        for param in operation.params:
-            if param.input_type == "checkbox":
-                value = form_data.get(param.name)
-                if value is None:
-                    if param.required:
-                        raise ValueError(f"{param.name} is required")
-                    continue
-                kwargs[param.name] = str(value).lower() in ("true", "1", "on", "yes")
-                continue
-
-            raw = form_data.get(param.name)
-            if raw is None or str(raw).strip() == "":
-                if param.required:
-                    raise ValueError(f"{param.name} is required")
-                continue
-
-            text = str(raw).strip()
-            kwargs[param.name] = self._coerce_value(text, param.type_name)
-        return kwargs
-
-    def _coerce_value(self, value: str, type_name: str) -> Any:
-        if value.startswith("{") or value.startswith("["):
-            try:
-                return json.loads(value)
-            except json.JSONDecodeError:
-                return value
-
-        if type_name.startswith("int"):
-            try:
-                return int(value)
-            except ValueError:
-                return value
-        if type_name.startswith("float"):
-            try:
-                return float(value)
-            except ValueError:
-                return value
-        return value
+        """Validate JSON `arguments` into the typed inputs `name` expects."""
+        return self._catalog.decoder(name).decode(arguments)
+
+    def cache_key(self, name: str, kwargs: Mapping[str, Any]) -> str:
+        """Key of `name` called with typed `kwargs`.
+
+        Inputs that differ only in JSON formatting, key order or checkbox
+        spelling map to the same key.
+        """
+        return f"{name}:{self._catalog.decoder(name).key(kwargs)}"
+
+    async def run(self, name: str, kwargs: Mapping[str, Any]) -> Any:
+        """Plain-data result of `name` called with typed `kwargs`."""
+        return self._serialize(await self.call(name, kwargs))
+
+    async def call(self, name: str, kwargs: Mapping[str, Any]) -> Any:
+        """Result model of `name` called with already typed `kwargs`.
+
+        The call gets the operation's deadline from `Settings`, shared by
+        every request it makes.
+        """
+        method = getattr(self._client(), name)
+        async with deadline(self._settings.timeout_for(name)):
+            return await method(**kwargs)
+
+    async def iter_items(
+        self,
+        name: str,
+        kwargs: Mapping[str, Any],
+        page_size: int | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[Any]:
+        """Items of every page of paginated operation `name`, as they arrive."""
+        operation = self._catalog.get(name)
+        if operation.iterator is None:
+            raise ValueError(f"{name} is not paginated")
+        method = getattr(self._client(), operation.iterator)
+        async for item in method(**kwargs, page_size=page_size, limit=limit):
+            yield item
 
     def _serialize(self, result: Any) -> Any:
         if hasattr(result, "model_dump"):
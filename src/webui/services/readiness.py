@@ -0,0 +1,47 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+
+class Readiness:
+    """Whether the app should receive traffic: warmed up, upstream answering.
+
+    The result of `probe` is cached for `ttl` seconds, and concurrent checks
+    share one probe, so frequent load balancer polls cost at most one
+    upstream query per `ttl`.
+    """
+
+    def __init__(
+        self,
+        probe: Callable[[], Awaitable[Any]],
+        ttl: float,
+        timeout: float = 2.0,
+    ) -> None:
+        self.ttl = ttl
+        self.timeout = timeout
+        self.warmed_up = False
+        self._probe = probe
+        self._lock = asyncio.Lock()
+        self._checked_at = float("-inf")
+        self._error: str | None = None
+
+    async def check(self) -> tuple[bool, dict[str, Any]]:
+        if not self.warmed_up:
+            return False, {"status": "warming up"}
+        async with self._lock:
+            if time.monotonic() - self._checked_at >= self.ttl:
+                self._error = await self._run_probe()
+                self._checked_at = time.monotonic()
+        if self._error is not None:
+            return False, {"status": "upstream unavailable", "error": self._error}
+        return True, {"status": "ready"}
+
+    async def _run_probe(self) -> str | None:
+        try:
+            await asyncio.wait_for(self._probe(), self.timeout)
+        except TimeoutError:
+            return f"Probe timed out after {self.timeout:g}s"
+        except Exception as exc:
+            return str(exc) or type(exc).__name__
+        return None
@@ -0,0 +1,177 @@
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from gql_client import SharedResponseCache
+
+logger = logging.getLogger(__name__)
+
+# How long one worker may hold the shared load of a key, and how often the
+# others look for its result meanwhile.
+SHARED_LEASE = 10.0
+SHARED_POLL = 0.05
+
+
+def compute_etag(payload: Any) -> str:
+    body = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return f'"{hashlib.sha256(body.encode()).hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison, as required for If-None-Match.
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag in candidates
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    payload: Any
+    etag: str
+    stored_at: float
+
+
+class ResultCache:
+    """Stale-while-revalidate cache of operation results.
+
+    Entries younger than `ttl` seconds are served as they are. Older ones are
+    still served for up to `stale_ttl` more seconds while a single background
+    task refreshes them. Concurrent misses for one key share one load. Failed
+    loads are not cached; a failed refresh keeps serving the stale entry.
+
+    With a `shared` cache, results are also kept there for every worker
+    process. A miss first looks in it, and only one worker at a time loads a
+    key from upstream while the others wait for its result.
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        stale_ttl: float,
+        max_entries: int = 256,
+        shared: SharedResponseCache | None = None,
+    ) -> None:
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self.shared = shared
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._loads: dict[str, asyncio.Task[CacheEntry]] = {}
+        # Wall-clock store time of entries taken from `shared`.
+        self._shared_stamps: dict[str, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._shared_stamps.clear()
+        if self.shared is not None:
+            self.shared.clear()
+
+    async def get(self, key: str, load: Callable[[], Awaitable[Any]]) -> CacheEntry:
+        entry = self._entries.get(key)
+        if entry is None and self.shared is not None:
+            entry = self._from_shared(key, self.shared)
+        if entry is not None:
+            age = time.monotonic() - entry.stored_at
+            if age < self.ttl:
+                self._entries.move_to_end(key)
+                return entry
+            if age < self.ttl + self.stale_ttl:
+                self._entries.move_to_end(key)
+                self._start_load(key, load)
+                return entry
+            del self._entries[key]
+            self._shared_stamps.pop(key, None)
+        # Shielded so that one cancelled request does not abort the shared load.
+        return await asyncio.shield(self._start_load(key, load))
+
+    def _start_load(
+        self, key: str, load: Callable[[], Awaitable[Any]]
+    ) -> asyncio.Task[CacheEntry]:
+        task = self._loads.get(key)
+        if task is None:
+            task = asyncio.create_task(self._load(key, load))
+            self._loads[key] = task
+            task.add_done_callback(lambda done: self._finish_load(key, done))
+        return task
+
+    async def _load(self, key: str, load: Callable[[], Awaitable[Any]]) -> CacheEntry:
+        if self.shared is not None:
+            return await self._load_shared(key, load, self.shared)
+        return self._store(key, await load(), time.monotonic())
+
+    async def _load_shared(
+        self,
+        key: str,
+        load: Callable[[], Awaitable[Any]],
+        shared: SharedResponseCache,
+    ) -> CacheEntry:
+        deadline = time.monotonic() + SHARED_LEASE
+        token = shared.claim(key, SHARED_LEASE)
+        while token is None:
+            # Another worker is loading the key; take its result when it lands.
+            entry = self._from_shared(key, shared)
+            if entry is not None and time.monotonic() - entry.stored_at < self.ttl:
+                return entry
+            if time.monotonic() >= deadline:
+                # Load without the lease; it still belongs to the other worker.
+                break
+            await asyncio.sleep(SHARED_POLL)
+            token = shared.claim(key, SHARED_LEASE)
+        try:
+            entry = self._from_shared(key, shared)
+            if entry is not None and time.monotonic() - entry.stored_at < self.ttl:
+                return entry
+            payload = await load()
+            body = json.dumps(payload, separators=(",", ":"), default=str)
+            shared.set(key, body.encode(), ttl=self.ttl + self.stale_ttl)
+            return self._store(key, payload, time.monotonic())
+        finally:
+            if token is not None:
+                shared.release(key, token)
+
+    def _from_shared(self, key: str, shared: SharedResponseCache) -> CacheEntry | None:
+        cached = shared.get(key)
+        if cached is None:
+            return None
+        current = self._entries.get(key)
+        if current is not None and self._shared_stamps.get(key) == cached.stored_at:
+            return current
+        age = max(time.time() - cached.stored_at, 0.0)
+        entry = self._store(key, json.loads(cached.body), time.monotonic() - age)
+        self._shared_stamps[key] = cached.stored_at
+        return entry
+
+    def _store(self, key: str, payload: Any, stored_at: float) -> CacheEntry:
+        entry = CacheEntry(
+            payload=payload, etag=compute_etag(payload), stored_at=stored_at
+        )
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        self._shared_stamps.pop(key, None)
+        while len(self._entries) > self.max_entries:
+            evicted, _ = self._entries.popitem(last=False)
+            self._shared_stamps.pop(evicted, None)
+        return entry
+
+    def _finish_load(self, key: str, task: asyncio.Task[CacheEntry]) -> None:
+        if self._loads.get(key) is task:
+            del self._loads[key]
+        if not task.cancelled() and task.exception() is not None:
+            # Misses re-raise in the waiting request; only refreshes behind a
+            # stale entry fail silently.
+            if key in self._entries:
+                logger.warning(
+                    "Background refresh of %s failed", key, exc_info=task.exception()
+                )
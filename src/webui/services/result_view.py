@@ -0,0 +1,127 @@
+import json
+import re
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from typing import Any
+
+ITEMS_PAGE_SIZE = 25
+HEX_PREVIEW_CHARS = 74
+CHUNK_SIZE = 64 * 1024
+
+_HEX = re.compile(r"0x[0-9a-fA-F]*")
+
+
+def truncate_hex(value: Any, limit: int = HEX_PREVIEW_CHARS) -> Any:
+    """`value` with hex strings longer than `limit` shortened for display."""
+    if isinstance(value, str):
+        if len(value) > limit and _HEX.fullmatch(value):
+            keep = (limit - 10) // 2
+            hidden = (len(value) - 2 * keep - 2) // 2
+            return f"{value[: keep + 2]}...[{hidden} bytes]...{value[-keep:]}"
+        return value
+    if isinstance(value, dict):
+        return {key: truncate_hex(item, limit) for key, item in value.items()}
+    if isinstance(value, list):
+        return [truncate_hex(item, limit) for item in value]
+    return value
+
+
+def format_payload(payload: Any) -> str:
+    return json.dumps(truncate_hex(payload), indent=2, ensure_ascii=True, default=str)
+
+
+@dataclass(frozen=True)
+class ItemsPage:
+    path: str
+    total: int
+    offset: int
+    items: list[str]
+
+    @property
+    def next_offset(self) -> int | None:
+        end = self.offset + len(self.items)
+        return end if end < self.total else None
+
+
+def _find_lists(value: Any, prefix: str, size: int) -> Iterator[str]:
+    if not isinstance(value, dict):
+        return
+    for key, item in value.items():
+        path = f"{prefix}.{key}" if prefix else str(key)
+        if isinstance(item, list) and len(item) > size:
+            yield path
+        else:
+            yield from _find_lists(item, path, size)
+
+
+def resolve(payload: Any, path: str) -> Any:
+    value = payload
+    for key in path.split("."):
+        if not isinstance(value, dict) or key not in value:
+            raise KeyError(f"No list at {path}")
+        value = value[key]
+    return value
+
+
+def items_page(
+    payload: Any, path: str, offset: int = 0, size: int = ITEMS_PAGE_SIZE
+) -> ItemsPage:
+    items = resolve(payload, path)
+    if not isinstance(items, list):
+        raise KeyError(f"No list at {path}")
+    offset = max(offset, 0)
+    return ItemsPage(
+        path=path,
+        total=len(items),
+        offset=offset,
+        items=[format_payload(item) for item in items[offset : offset + size]],
+    )
+
+
+def split_payload(
+    payload: Any, size: int = ITEMS_PAGE_SIZE
+) -> tuple[str, list[ItemsPage]]:
+    """Formatted `payload` without its long lists, plus their first pages.
+
+    Lists with more than `size` elements are replaced by a placeholder in the
+    summary and rendered page by page instead.
+    """
+    paths = list(_find_lists(payload, "", size))
+    if not paths:
+        return format_payload(payload), []
+
+    def without_lists(value: Any, prefix: str) -> Any:
+        if not isinstance(value, dict):
+            return value
+        result = {}
+        for key, item in value.items():
+            path = f"{prefix}.{key}" if prefix else str(key)
+            if path in paths:
+                result[key] = f"[{len(item)} items, listed below]"
+            else:
+                result[key] = without_lists(item, path)
+        return result
+
+    pages = [items_page(payload, path, 0, size) for path in paths]
+    return format_payload(without_lists(payload, "")), pages
+
+
+def buffered(chunks: Iterable[str], size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """Join small text chunks into blocks of about `size` bytes."""
+    buffer: list[str] = []
+    length = 0
+    for chunk in chunks:
+        buffer.append(chunk)
+        length += len(chunk)
+        if length >= size:
+            yield "".join(buffer).encode()
+            buffer.clear()
+            length = 0
+    if buffer:
+        yield "".join(buffer).encode()
+
+
+def iter_json(payload: Any) -> Iterator[bytes]:
+    """Compact JSON of `payload`, encoded incrementally."""
+    encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), default=str)
+    return buffered(encoder.iterencode(payload))
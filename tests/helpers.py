@@ -0,0 +1,214 @@
+import json
+import random
+import tomllib
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+
+def transaction(index: int, **fields: Any) -> dict[str, Any]:
+    """One `query_transactions` item as the server returns it."""
+    row = {
+        "blockNumber": str(100 + index // 2),
+        "txIndex": str(index % 2),
+        "hash": f"0x{index:064x}",
+        "fromAddress": f"0x{index % 3:040x}",
+        "toAddress": f"0x{index % 5 + 1:040x}",
+        "valueWei": str(index * 1000),
+        "gas": "21000",
+        "gasPrice": "1000000000",
+        "gasUsed": "21000",
+        "nonce": str(index),
+        "txType": "2",
+        "maxFeePerGas": None,
+        "maxPriorityFeePerGas": None,
+        "input": "0x",
+        "success": True,
+        "logsCount": "0",
+        "createdAt": f"2024-01-01T00:00:{index % 60:02d}Z",
+        "logs": [],
+        "internalTransactions": [],
+    }
+    row.update(fields)
+    return row
+
+
+def transactions_page(
+    items: list[dict[str, Any]], has_next: bool, total: int
+) -> dict[str, Any]:
+    return {
+        "data": {
+            "transactions": {
+                "items": items,
+                "pageInfo": {
+                    "hasNextPage": has_next,
+                    "hasPreviousPage": False,
+                    "totalCount": total,
+                    "currentPage": 1,
+                    "totalPages": 1,
+                },
+            }
+        }
+    }
+
+
+def graphql_client(
+    respond: Callable[[dict[str, Any]], dict[str, Any]],
+) -> httpx.AsyncClient:
+    """HTTP client answering each GraphQL request body with `respond(body)`."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=respond(json.loads(request.content)))
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+ADDRESSES = [f"0x{i:040x}" for i in range(1, 6)]
+
+# Operations per scalar filter field, each with a generator of its argument.
+FILTER_FIELDS: dict[str, dict[str, Callable[[random.Random], Any]]] = {
+    "toAddress": {
+        "eq": lambda rng: rng.choice(ADDRESSES),
+        "ne": lambda rng: rng.choice(ADDRESSES),
+        "in": lambda rng: rng.sample(ADDRESSES, rng.randint(1, 3)),
+        "notIn": lambda rng: rng.sample(ADDRESSES, rng.randint(0, 3)),
+        "startsWith": lambda rng: rng.choice(["0x", "0x000", "0x1"]),
+        "contains": lambda rng: rng.choice(["1", "2", "00"]),
+        "isNull": lambda rng: rng.random() < 0.5,
+    },
+    "blockNumber": {
+        "eq": lambda rng: rng.randint(99, 112),
+        "ne": lambda rng: rng.randint(99, 112),
+        "gt": lambda rng: rng.randint(99, 112),
+        "gte": lambda rng: rng.randint(99, 112),
+        "lt": lambda rng: rng.randint(99, 112),
+        "lte": lambda rng: rng.randint(99, 112),
+        "in": lambda rng: rng.sample(range(99, 113), rng.randint(1, 4)),
+        "between": lambda rng: sorted(rng.sample(range(99, 113), 2)),
+        "isNull": lambda rng: rng.random() < 0.5,
+    },
+    "maxFeePerGas": {
+        "eq": lambda rng: str(rng.randint(0, 8) * 10**9),
+        "gt": lambda rng: str(rng.randint(0, 8) * 10**9),
+        "lte": lambda rng: str(rng.randint(0, 8) * 10**9),
+        "notIn": lambda rng: [str(rng.randint(0, 8) * 10**9)] * rng.randint(0, 2),
+        "isNull": lambda rng: rng.random() < 0.5,
+    },
+}
+
+
+def nullable_transactions(count: int) -> list[dict[str, Any]]:
+    """Rows where `toAddress`, `blockNumber` and `maxFeePerGas` are sometimes null."""
+    return [
+        transaction(
+            i,
+            toAddress=None if i % 4 == 0 else ADDRESSES[i % 5],
+            blockNumber=None if i % 7 == 3 else str(100 + i // 2),
+            maxFeePerGas=None if i % 3 == 0 else str(i % 9 * 10**9),
+        )
+        for i in range(count)
+    ]
+
+
+def random_filter(rng: random.Random, depth: int = 2) -> dict[str, Any]:
+    """`TransactionFilterInput` JSON mixing `isNull` with other operations."""
+    filter_: dict[str, Any] = {}
+    for name in rng.sample(sorted(FILTER_FIELDS), rng.randint(1, 2)):
+        ops = FILTER_FIELDS[name]
+        # No operation at all still rejects nulls.
+        chosen = rng.sample(sorted(ops), rng.choice([0, 1, 1, 2, 2]))
+        filter_[name] = {op: ops[op](rng) for op in chosen}
+    if depth > 0:
+        combinator = rng.choice(["and", "or", "not", None])
+        if combinator == "not":
+            filter_["not"] = random_filter(rng, depth - 1)
+        elif combinator is not None:
+            filter_[combinator] = [
+                random_filter(rng, depth - 1) for _ in range(rng.randint(1, 3))
+            ]
+    return filter_
+
+
+# Answers of the web UI's upstream, by GraphQL operation name.
+UPSTREAM: dict[str, dict[str, Any]] = {
+    "query_ethSyncing": {"ethSyncing": False},
+    "query_metadata": {
+        "metadata": {
+            "clientVersion": "anvil/v1",
+            "chainId": "0x7a69",
+            "netVersion": "31337",
+            "netListening": True,
+            "netPeerCount": "0x0",
+        }
+    },
+    "query_web3Sha3": {"web3Sha3": "0x" + "ab" * 32},
+    "query_usageStat": {"usageStat": {"effectiveness": 0.9, "jsonrpcRatio": 0.1}},
+    "mutation_sendRawTransaction": {"sendRawTransaction": "0x" + "cd" * 32},
+}
+UPSTREAM_ROWS = [transaction(i) for i in range(60)]
+
+
+def upstream(body: dict[str, Any]) -> dict[str, Any]:
+    """Answer of a test server to any operation of the generated client."""
+    name = body["operationName"]
+    if name != "query_transactions":
+        return {"data": UPSTREAM[name]}
+    pagination = (body["variables"].get("input") or {}).get("pagination") or {}
+    offset = pagination.get("offset", 0)
+    end = offset + pagination.get("limit", len(UPSTREAM_ROWS))
+    return transactions_page(
+        UPSTREAM_ROWS[offset:end], end < len(UPSTREAM_ROWS), len(UPSTREAM_ROWS)
+    )
+
+
+def webui_app(
+    monkeypatch: pytest.MonkeyPatch,
+    respond: Callable[[dict[str, Any]], dict[str, Any]] = upstream,
+    **env: str,
+) -> FastAPI:
+    """The web UI app, configured by `env`, with upstream answered by `respond`."""
+    monkeypatch.setenv("GRAPHQL_HOST", "graphql.test")
+    monkeypatch.setenv("GRAPHQL_CHAIN", "test")
+    for key, value in env.items():
+        monkeypatch.setenv(key, value)
+    from src.webui.main import create_app
+
+    app = create_app()
+    app.state.runner._http = graphql_client(respond)
+    return app
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def generate_client(
+    directory: Path, package: str, schema: str, operations: str
+) -> Path:
+    """Run ariadne-codegen as configured in pyproject.toml on a small schema.
+
+    The package is written to `directory`, which callers put on `sys.path`
+    to import it.
+    """
+    from ariadne_codegen.main import client
+
+    pyproject = tomllib.loads((ROOT / "pyproject.toml").read_text(encoding="utf-8"))
+    section = dict(pyproject["tool"]["ariadne-codegen"])
+    section.pop("remote_schema_url", None)
+    (directory / "schema.graphql").write_text(schema, encoding="utf-8")
+    (directory / "ops.graphql").write_text(operations, encoding="utf-8")
+    section.update(
+        schema_path=(directory / "schema.graphql").as_posix(),
+        queries_path=(directory / "ops.graphql").as_posix(),
+        target_package_name=package,
+        target_package_path=directory.as_posix(),
+        base_client_file_path=(ROOT / section["base_client_file_path"]).as_posix(),
+        files_to_include=[
+            (ROOT / path).as_posix() for path in section["files_to_include"]
+        ],
+    )
+    client({"tool": {"ariadne-codegen": section}})
+    return directory / package
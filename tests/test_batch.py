@@ -0,0 +1,121 @@
+import asyncio
+from collections import Counter
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.webui.services.batch import BatchResult, run_batch
+from tests.helpers import UPSTREAM, upstream, webui_app
+
+
+def test_results_keep_order_and_failures_stay_local() -> None:
+    running = 0
+    peak = 0
+
+    async def work(value: int) -> int:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01 * (5 - value))
+        running -= 1
+        if value == 3:
+            raise RuntimeError("three")
+        return value
+
+    async def hang() -> None:
+        await asyncio.sleep(10)
+
+    calls: list[tuple[str, Any]] = [
+        (f"op{i}", lambda i=i: work(i)) for i in range(5)
+    ] + [("slow", hang)]
+    results = asyncio.run(run_batch(calls, concurrency=2, timeout=0.2))
+
+    assert results[:3] == [BatchResult(f"op{i}", True, i) for i in range(3)]
+    assert results[3] == BatchResult("op3", False, {"error": "three"})
+    assert results[4] == BatchResult("op4", True, 4)
+    assert results[5] == BatchResult("slow", False, {"error": "Timed out after 0.2s"})
+    assert peak == 2
+
+
+def test_json_batch_runs_every_operation(monkeypatch: pytest.MonkeyPatch) -> None:
+    def respond(body: dict[str, Any]) -> dict[str, Any]:
+        if body["operationName"] == "query_usageStat":
+            return {"errors": [{"message": "no stats"}]}
+        return upstream(body)
+
+    client = TestClient(webui_app(monkeypatch, respond))
+
+    result = client.post(
+        "/run-batch",
+        json={
+            "operations": [
+                {"name": "query_metadata"},
+                {"name": "query_web_3_sha_3", "arguments": {"message": "hi"}},
+                {"name": "query_usage_stat"},
+            ]
+        },
+    )
+
+    first, second, third = result.json()["results"]
+    assert first == {
+        "name": "query_metadata",
+        "ok": True,
+        "data": UPSTREAM["query_metadata"],
+    }
+    assert second["data"] == UPSTREAM["query_web3Sha3"]
+    assert third["ok"] is False
+    assert "no stats" in third["error"]
+
+
+@pytest.mark.parametrize(
+    ("body", "error"),
+    [
+        ({}, 'Body must be {"operations"'),
+        ({"operations": [{"arguments": {}}]}, "Every operation needs a name"),
+        (
+            {"operations": [{"name": "query_metadata", "arguments": [1]}]},
+            "Arguments of query_metadata must be a JSON object",
+        ),
+        ({"operations": [{"name": "query_nothing"}]}, "Unknown operation"),
+    ],
+)
+def test_invalid_json_batches_are_rejected(
+    monkeypatch: pytest.MonkeyPatch, body: dict[str, Any], error: str
+) -> None:
+    client = TestClient(webui_app(monkeypatch))
+
+    result = client.post("/run-batch", json=body)
+
+    assert result.status_code == 400
+    assert error in result.json()["error"]
+
+
+def test_form_batch_renders_every_result(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: Counter[str] = Counter()
+
+    def respond(body: dict[str, Any]) -> dict[str, Any]:
+        calls[body["operationName"]] += 1
+        return upstream(body)
+
+    client = TestClient(webui_app(monkeypatch, respond))
+    form = {
+        "operations": [
+            "query_web_3_sha_3",
+            "mutation_send_raw_transaction",
+            "query_web_3_sha_3",
+        ],
+        "query_web_3_sha_3.message": "hi",
+        "mutation_send_raw_transaction.signed_tx": "0x01",
+    }
+
+    result = client.post("/run-batch", data=form)
+
+    assert result.status_code == 200
+    assert result.text.count(UPSTREAM["query_web3Sha3"]["web3Sha3"]) == 2
+    assert UPSTREAM["mutation_sendRawTransaction"]["sendRawTransaction"] in (
+        result.text
+    )
+    assert "/run/query_web_3_sha_3/download?message=hi" in result.text
+    # Both panels of the query share one cached upstream call.
+    assert calls == {"query_web3Sha3": 1, "mutation_sendRawTransaction": 1}
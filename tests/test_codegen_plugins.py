@@ -0,0 +1,166 @@
+import asyncio
+import importlib
+import json
+import sys
+from pathlib import Path
+from types import ModuleType
+
+import httpx
+import pytest
+from codegen_plugins import GENERATED_COMMENT, LazyPackagePlugin
+
+from tests.helpers import generate_client
+
+SCHEMA = """
+type Query {
+  greeting(name: String!, shout: Boolean): String!
+  account(id: ID!, filter: AccountFilter): Account
+}
+
+type Mutation {
+  rename(id: ID!, input: RenameInput!): Account!
+}
+
+input AccountFilter {
+  minBalance: Int
+  tags: [String!]
+}
+
+input RenameInput {
+  newName: String!
+  reason: String
+}
+
+type Account {
+  id: ID!
+  displayName: String!
+  balance: Int!
+}
+"""
+
+OPERATIONS = """
+query greeting($name: String!, $shout: Boolean) {
+  greeting(name: $name, shout: $shout)
+}
+
+query account($id: ID!, $filter: AccountFilter) {
+  account(id: $id, filter: $filter) {
+    id
+    displayName
+    balance
+  }
+}
+
+mutation rename($id: ID!, $input: RenameInput!) {
+  rename(id: $id, input: $input) {
+    id
+    displayName
+  }
+}
+"""
+
+
+@pytest.fixture(scope="module")
+def generated(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    return generate_client(
+        tmp_path_factory.mktemp("codegen"), "small_client", SCHEMA, OPERATIONS
+    )
+
+
+def import_fresh(package: Path, monkeypatch: pytest.MonkeyPatch) -> ModuleType:
+    monkeypatch.syspath_prepend(str(package.parent))
+    for name in [m for m in sys.modules if m.split(".")[0] == package.name]:
+        monkeypatch.delitem(sys.modules, name)
+    return importlib.import_module(package.name)
+
+
+def test_package_exports_resolve_on_first_access(
+    generated: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    package = import_fresh(generated, monkeypatch)
+
+    assert "small_client.client" not in sys.modules
+    client_class = package.Client
+    assert "small_client.client" in sys.modules
+    assert vars(package)["Client"] is client_class
+    assert {"Client", "RenameInput", "deadline"} <= set(package.__all__)
+    assert "AccountFilter" in dir(package)
+    with pytest.raises(AttributeError, match="has no attribute 'Nothing'"):
+        package.Nothing  # noqa: B018
+
+
+def test_model_schemas_are_built_on_first_use(
+    generated: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    package = import_fresh(generated, monkeypatch)
+    sources = [
+        (generated / name).read_text(encoding="utf-8")
+        for name in ("input_types.py", "account.py", "rename.py")
+    ]
+
+    assert "defer_build=True" in (generated / "base_model.py").read_text()
+    assert not any("model_rebuild" in source for source in sources)
+    rename_input = package.RenameInput
+    assert not rename_input.__pydantic_complete__
+    value = rename_input.model_validate({"newName": "alice"})
+    assert value.new_name == "alice"
+    assert rename_input.__pydantic_complete__
+
+
+def test_copied_files_keep_one_header_and_one_defer_build() -> None:
+    plugin = LazyPackagePlugin(schema=None, config_dict={})
+    base_model = (
+        "class BaseModel(PydanticBaseModel):\n"
+        "    model_config = ConfigDict(\n"
+        "        protected_namespaces=(),\n"
+        "    )\n"
+    )
+
+    once = plugin.copy_code(base_model)
+
+    assert once.count("defer_build=True") == 1
+    assert plugin.copy_code(once) == once
+    copied = f"{GENERATED_COMMENT}\nx = 1\n"
+    assert plugin.get_file_comment(GENERATED_COMMENT, copied) == ""
+    assert plugin.get_file_comment(GENERATED_COMMENT, "x = 1\n") == GENERATED_COMMENT
+
+
+def test_prepared_bodies_match_json_dumps(
+    generated: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    package = import_fresh(generated, monkeypatch)
+    client_module = importlib.import_module("small_client.client")
+    sent: list[bytes] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request.content)
+        account = {"id": "1", "displayName": "Ann", "balance": 5}
+        return httpx.Response(200, json={"data": {"account": account}})
+
+    async def main() -> None:
+        http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        client = package.Client(url="http://test/graphql", http_client=http)
+        account = await client.account(
+            "1", filter_=package.AccountFilter(min_balance=5)
+        )
+        assert account.account.display_name == "Ann"
+        await client.account("2")
+
+    asyncio.run(main())
+
+    prepared = client_module._ACCOUNT
+    assert prepared.query == (
+        "query account($id:ID!$filter:AccountFilter)"
+        "{account(id:$id filter:$filter){id displayName balance}}"
+    )
+    assert sent == [
+        json.dumps(
+            {
+                "query": prepared.query,
+                "operationName": "account",
+                "variables": variables,
+            },
+            separators=(",", ":"),
+        ).encode()
+        for variables in ({"id": "1", "filter": {"minBalance": 5}}, {"id": "2"})
+    ]
@@ -0,0 +1,112 @@
+from typing import Any
+
+import pytest
+from gql_client import (
+    CompactTransaction,
+    QueryTransactionsTransactionsItems,
+    compact_transactions,
+)
+from gql_client.compact import INT, CompactLog
+
+from tests.helpers import transaction
+
+
+def fresh(text: str) -> str:
+    """An equal string that is not the same object, as json.loads returns."""
+    return "".join(list(text))
+
+
+def log(index: int, address: str, topics: list[str], data: str) -> dict[str, Any]:
+    return {
+        "blockNumber": "100",
+        "txIndex": "0",
+        "logIndex": str(index),
+        "txHash": fresh(f"0x{1:064x}"),
+        "blockHash": fresh(f"0x{2:064x}"),
+        "address": address,
+        "topics": topics,
+        "data": data,
+        "removed": False,
+        "createdAt": "2024-01-01T00:00:00Z",
+    }
+
+
+@pytest.mark.parametrize(
+    ("text", "stored"),
+    [
+        ("0x", b""),
+        ("0xdeadbeef", b"\xde\xad\xbe\xef"),
+        ("0x0a0b", b"\n\x0b"),
+        # Odd-length, mixed-case or unprefixed hex cannot round-trip as bytes.
+        ("0x123", "0x123"),
+        ("0xDEADbeef", "0xDEADbeef"),
+        ("deadbeef", "deadbeef"),
+        ("", ""),
+        (None, None),
+    ],
+)
+def test_hex_fields_round_trip(text: str | None, stored: bytes | str | None) -> None:
+    record = CompactTransaction.from_dict(transaction(0, input=text))
+
+    assert record._input == stored
+    assert record.input == text
+    assert record.to_dict()["input"] == text
+
+
+def test_addresses_and_topics_are_interned() -> None:
+    topic = f"0x{7:064x}"
+    rows = [
+        transaction(
+            index,
+            fromAddress=fresh(f"0x{9:040x}"),
+            logs=[log(0, fresh(f"0x{5:040x}"), [fresh(topic), fresh(topic)], "0x")],
+        )
+        for index in range(2)
+    ]
+
+    first, second = compact_transactions(rows)
+
+    assert rows[0]["fromAddress"] is not rows[1]["fromAddress"]
+    assert first.from_address is second.from_address
+    assert first.logs[0].address is second.logs[0].address
+    assert first.logs[0].tx_hash is second.logs[0].tx_hash
+    assert first.logs[0].topics[0] is second.logs[0].topics[1]
+    assert first.logs[0].topics == (topic, topic)
+
+
+def test_numbers_are_stored_as_int() -> None:
+    record = CompactTransaction.from_dict(
+        transaction(3, valueWei="0x10", maxFeePerGas="7", maxPriorityFeePerGas="0x2")
+    )
+    unpriced = CompactTransaction.from_dict(transaction(3, maxFeePerGas=None))
+
+    assert all(
+        type(getattr(record, name)) is int
+        for name, _, kind in CompactTransaction.FIELDS
+        if kind == INT
+    )
+    assert (record.value_wei, record.block_number, record.nonce) == (16, 101, 3)
+    assert (record.max_fee_per_gas, record.max_priority_fee_per_gas) == (7, 2)
+    assert unpriced.max_fee_per_gas is None
+    assert record.to_dict()["valueWei"] == "16"
+    assert unpriced.to_dict()["maxFeePerGas"] is None
+
+
+def test_models_and_dicts_compact_to_equal_records() -> None:
+    row = transaction(
+        4,
+        input="0xa9059cbb",
+        logsCount="1",
+        logs=[log(0, f"0x{5:040x}", [f"0x{7:064x}"], "0x00ff")],
+    )
+    model = QueryTransactionsTransactionsItems.model_validate(row)
+
+    from_dict, from_model = compact_transactions([row, model])
+
+    assert from_dict == from_model
+    assert isinstance(from_dict.logs[0], CompactLog)
+    assert from_dict.logs[0]._data == b"\x00\xff"
+    assert from_dict.to_dict() == row
+    assert QueryTransactionsTransactionsItems.model_validate(from_dict.to_dict()) == (
+        model
+    )
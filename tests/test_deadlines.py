@@ -0,0 +1,119 @@
+import asyncio
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from src.webui import disconnect
+from src.webui.config import build_graphql_url, get_settings, parse_timeouts
+from src.webui.disconnect import ClientDisconnectedError, cancel_on_disconnect
+from tests.helpers import upstream, webui_app
+
+
+def test_timeouts_are_read_per_operation(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    (tmp_path / ".env").write_text(
+        "# local\nGRAPHQL_HOST=https://node.test:8443\nGRAPHQL_PATH='/rpc/graphql'\n"
+        "OPERATION_TIMEOUT=12\nnot a setting\n",
+        encoding="utf-8",
+    )
+    monkeypatch.chdir(tmp_path)
+    # A copy, so what `load_env` sets does not outlive the test.
+    environ = {k: v for k, v in os.environ.items() if not k.startswith("GRAPHQL_")}
+    monkeypatch.setattr(os, "environ", environ)
+    monkeypatch.setenv("OPERATION_TIMEOUT", "30")
+    monkeypatch.setenv("OPERATION_TIMEOUTS", "query_transactions=60, query_metadata=2")
+
+    settings = get_settings()
+
+    assert settings.graphql_url == "https://node.test:8443/rpc/graphql"
+    assert settings.timeout_for("query_transactions") == 60
+    assert settings.timeout_for("query_metadata") == 2
+    # Variables already set win over the .env file.
+    assert settings.timeout_for("query_usage_stat") == 30
+
+
+def test_timeout_lists() -> None:
+    assert parse_timeouts("") == {}
+    assert parse_timeouts("a=1.5,,b=2") == {"a": 1.5, "b": 2.0}
+    with pytest.raises(ValueError):
+        parse_timeouts("a=soon")
+
+
+@pytest.mark.parametrize(
+    ("host", "port", "chain", "path", "url"),
+    [
+        ("node", "8000", "anvil", None, "http://node:8000/anvil/graphql"),
+        ("node", None, "/anvil/", None, "http://node/anvil/graphql"),
+        ("https://node", "9000", None, "gql", "https://node:9000/gql"),
+    ],
+)
+def test_graphql_url(
+    host: str, port: str | None, chain: str | None, path: str | None, url: str
+) -> None:
+    assert build_graphql_url("http", host, port, chain, path) == url
+
+
+@pytest.mark.parametrize(
+    ("host", "chain", "error"),
+    [
+        ("", "anvil", "Set GRAPHQL_HOST"),
+        ("node", None, "Set GRAPHQL_PATH or GRAPHQL_CHAIN"),
+    ],
+)
+def test_graphql_url_errors(host: str, chain: str | None, error: str) -> None:
+    with pytest.raises(RuntimeError, match=error):
+        build_graphql_url("http", host, None, chain, None)
+
+
+def test_slow_operations_time_out(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        if body["operationName"] == "query_metadata":
+            await asyncio.sleep(1)
+        return httpx.Response(200, json=upstream(body))
+
+    app = webui_app(monkeypatch, OPERATION_TIMEOUTS="query_metadata=0.05")
+    app.state.runner._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client = TestClient(app)
+
+    slow = client.post("/api/run/query_metadata")
+    fast = client.post("/api/run/query_usage_stat")
+
+    assert slow.status_code == 504
+    assert "0.05" in slow.json()["error"]
+    assert fast.status_code == 200
+
+
+class Request:
+    def __init__(self, polls_before_disconnect: int) -> None:
+        self.polls = polls_before_disconnect
+
+    async def is_disconnected(self) -> bool:
+        self.polls -= 1
+        return self.polls < 0
+
+
+def test_disconnect_cancels_the_pending_call(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(disconnect, "DISCONNECT_POLL", 0.01)
+    cancelled = asyncio.Event()
+
+    async def work() -> None:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    async def main() -> Any:
+        with pytest.raises(ClientDisconnectedError):
+            await cancel_on_disconnect(Request(2), work())
+        await asyncio.wait_for(cancelled.wait(), 1)
+        return await cancel_on_disconnect(Request(0), asyncio.sleep(0, "done"))
+
+    assert asyncio.run(main()) == "done"
@@ -0,0 +1,72 @@
+import random
+
+import pytest
+from gql_client import TransactionIndex, compile_filter
+from gql_client.filters import value_test
+from gql_client.input_types import (
+    IntFilter,
+    StringFilter,
+    TransactionFilterInput,
+)
+from gql_client.normalize import UnsatisfiableFilter, normalize_filter
+from gql_client.query_transactions import QueryTransactionsTransactionsItems
+
+from tests.helpers import nullable_transactions, random_filter
+
+ITEMS = [
+    QueryTransactionsTransactionsItems.model_validate(row)
+    for row in nullable_transactions(40)
+]
+
+
+def hashes(items: list[QueryTransactionsTransactionsItems]) -> list[str]:
+    return [item.hash for item in items]
+
+
+def normalized_matches(filter_: TransactionFilterInput) -> list[str]:
+    try:
+        normalized = normalize_filter(filter_)
+    except UnsatisfiableFilter:
+        return []
+    if normalized is None:
+        return hashes(ITEMS)
+    return hashes(list(filter(compile_filter(normalized), ITEMS)))
+
+
+def test_null_fails_is_null_combined_with_other_operations() -> None:
+    test = value_test(StringFilter(is_null=True, eq="0x1"))
+
+    assert not test(None)
+    assert not test("0x1")
+    assert value_test(StringFilter(is_null=True))(None)
+    assert not value_test(IntFilter(is_null=False, gt=1))(None)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"toAddress": {"isNull": True}},
+        {"toAddress": {"isNull": True, "eq": "0x" + "0" * 39 + "1"}},
+        {"toAddress": {"isNull": True, "in": ["0x" + "0" * 39 + "1"]}},
+        {"toAddress": {"isNull": False, "ne": "0x" + "0" * 39 + "1"}},
+        {"blockNumber": {"isNull": True, "gte": 101}},
+        {"blockNumber": {"isNull": False, "between": [101, 104]}},
+        {"maxFeePerGas": {"isNull": True, "notIn": ["0"]}},
+        {"not": {"toAddress": {"isNull": True, "startsWith": "0x"}}},
+    ],
+)
+def test_is_null_with_comparisons(data: dict) -> None:
+    filter_ = TransactionFilterInput.model_validate(data)
+    expected = hashes(list(filter(compile_filter(filter_), ITEMS)))
+
+    assert hashes(TransactionIndex(ITEMS).filter(filter_)) == expected
+    assert normalized_matches(filter_) == expected
+
+
+@pytest.mark.parametrize("seed", range(300))
+def test_compile_index_and_normalize_agree(seed: int) -> None:
+    filter_ = TransactionFilterInput.model_validate(random_filter(random.Random(seed)))
+    expected = hashes(list(filter(compile_filter(filter_), ITEMS)))
+
+    assert hashes(TransactionIndex(ITEMS).filter(filter_)) == expected
+    assert normalized_matches(filter_) == expected
@@ -0,0 +1,126 @@
+from pathlib import Path
+
+import gen_graphql_ops
+import pytest
+from gen_graphql_ops import CostModel, build_ops, selection
+from graphql import GraphQLSchema, build_schema, introspection_from_schema
+
+SCHEMA = """
+type Query {
+  account(id: ID!): Account
+}
+
+type Account {
+  id: ID!
+  balance: Int!
+}
+"""
+
+PAGED_SCHEMA = """
+type Query {
+  transactions(first: Int): TransactionPage!
+}
+
+type TransactionPage {
+  items: [Transaction!]!
+  total: Int!
+}
+
+type Transaction {
+  hash: String!
+  value: Int!
+  logs: [Log!]!
+}
+
+type Log {
+  address: String!
+  data: String!
+  topics: [String!]!
+}
+"""
+
+
+def run(monkeypatch: pytest.MonkeyPatch, *args: str) -> None:
+    monkeypatch.setattr(
+        "sys.argv", ["gen_graphql_ops.py", "--url", "http://test/graphql", *args]
+    )
+    gen_graphql_ops.main()
+
+
+@pytest.fixture
+def codegen_runs(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> list[tuple[Path, str, Path]]:
+    runs: list[tuple[Path, str, Path]] = []
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(
+        gen_graphql_ops,
+        "fetch_introspection",
+        lambda url: introspection_from_schema(build_schema(SCHEMA)),
+    )
+    monkeypatch.setattr(gen_graphql_ops, "run_codegen", lambda *args: runs.append(args))
+    return runs
+
+
+def test_codegen_runs_after_a_plain_run(
+    monkeypatch: pytest.MonkeyPatch, codegen_runs: list[tuple[Path, str, Path]]
+) -> None:
+    run(monkeypatch)
+    run(monkeypatch, "--codegen")
+    run(monkeypatch, "--codegen")
+
+    assert len(codegen_runs) == 1
+    assert "query query_account($id: ID!)" in Path("graphql/auto.graphql").read_text()
+
+
+def test_codegen_reruns_when_options_change(
+    monkeypatch: pytest.MonkeyPatch, codegen_runs: list[tuple[Path, str, Path]]
+) -> None:
+    run(monkeypatch, "--codegen")
+    run(monkeypatch, "--codegen", "--exclude", "account.balance")
+    run(monkeypatch, "--codegen", "--force")
+
+    assert len(codegen_runs) == 3
+
+
+def plan(schema: GraphQLSchema, **options: object) -> gen_graphql_ops.Plan:
+    field = schema.query_type.fields["transactions"]
+    model = CostModel(**{"budget": 1e9, "list_weight": 10, **options})
+    return selection("transactions", field.type, 3, model)
+
+
+def test_selection_is_trimmed_to_the_budget() -> None:
+    schema = build_schema(PAGED_SCHEMA)
+
+    # total costs 1, hash and value 10 each, the logs 100 per scalar and
+    # 1000 for the topics.
+    trimmed = plan(schema, budget=25)
+    full = plan(schema, budget=1221)
+
+    assert trimmed.selection == "items { hash value } total"
+    assert (trimmed.values, trimmed.dropped) == (21, ["transactions.items.logs"])
+    assert full.selection == "items { hash value logs { address data topics } } total"
+    assert full.values == 1221
+
+
+def test_list_weights_include_and_exclude() -> None:
+    schema = build_schema(PAGED_SCHEMA)
+
+    short_pages = plan(schema, budget=250, list_weights=[("transactions.items", 2)])
+    included = plan(schema, budget=25, include=["transactions.items.logs.address"])
+    excluded = plan(schema, exclude=["transactions.items.logs"])
+
+    assert short_pages.values == 245
+    assert "logs { address data topics }" in short_pages.selection
+    assert included.selection == "items { logs { address } }"
+    assert excluded.selection == "items { hash value } total"
+
+
+def test_operations_use_the_planned_selection() -> None:
+    ops, plans = build_ops(build_schema(PAGED_SCHEMA), 3, CostModel(25, 10))
+
+    assert ops == [
+        "query query_transactions($first: Int)"
+        " { transactions(first: $first) { items { hash value } total } }"
+    ]
+    assert [name for name, _ in plans] == ["query_transactions"]
@@ -0,0 +1,106 @@
+import asyncio
+from typing import Any
+
+import pytest
+from gql_client import Client, TransactionCursor, scan_transactions
+from gql_client.filters import compile_filter
+from gql_client.input_types import (
+    PaginationInput,
+    StringFilter,
+    TransactionFilterInput,
+    TransactionQueryInput,
+)
+from gql_client.query_transactions import QueryTransactionsTransactionsItems
+
+from tests.helpers import graphql_client, transaction, transactions_page
+
+ROWS = [transaction(i) for i in range(9)]
+
+
+def keyset_server(requests: list[dict[str, Any]], cap: int | None = None) -> Client:
+    """Serves ROWS, honouring filters and limit but not ordering or offset.
+
+    With `cap`, pages hold at most `cap` rows whatever the requested limit.
+    """
+    items = [QueryTransactionsTransactionsItems.model_validate(row) for row in ROWS]
+
+    def respond(body: dict[str, Any]) -> dict[str, Any]:
+        query = body["variables"]["input"]
+        requests.append(query)
+        filters = query.get("filters")
+        match = (
+            compile_filter(TransactionFilterInput.model_validate(filters))
+            if filters
+            else lambda item: True
+        )
+        rows = [row for row, item in zip(ROWS, items, strict=True) if match(item)]
+        limit = min(query["pagination"]["limit"], cap or len(ROWS))
+        return transactions_page(rows[:limit], len(rows) > limit, len(rows))
+
+    return Client(url="http://test/graphql", http_client=graphql_client(respond))
+
+
+def scan(client: Client, *args: Any, **kwargs: Any) -> list[str]:
+    async def main() -> list[str]:
+        return [item.hash async for item in scan_transactions(client, *args, **kwargs)]
+
+    return asyncio.run(main())
+
+
+def test_scan_pages_with_cursor_filters() -> None:
+    requests: list[dict[str, Any]] = []
+
+    hashes = scan(keyset_server(requests), page_size=4)
+
+    assert hashes == [row["hash"] for row in ROWS]
+    assert [query["pagination"] for query in requests] == [
+        {"limit": 4, "offset": 0}
+    ] * 3
+    assert "filters" not in requests[0]
+    assert requests[1]["filters"]["and"][0] == {"blockNumber": {"gte": 101}}
+
+
+def test_scan_continues_past_pages_capped_by_the_server() -> None:
+    requests: list[dict[str, Any]] = []
+
+    hashes = scan(keyset_server(requests, cap=3), page_size=5)
+
+    assert hashes == [row["hash"] for row in ROWS]
+    assert len(requests) == 3
+    assert all(query["pagination"]["limit"] == 5 for query in requests)
+
+
+def test_scan_resumes_after_cursor_and_keeps_filters() -> None:
+    requests: list[dict[str, Any]] = []
+    input = TransactionQueryInput(
+        filters=TransactionFilterInput(
+            from_address=StringFilter(eq=ROWS[0]["fromAddress"])
+        ),
+        pagination=PaginationInput(limit=2, offset=0),
+    )
+
+    hashes = scan(keyset_server(requests), input, after=TransactionCursor(101, 1))
+
+    expected = [
+        row["hash"] for row in ROWS[4:] if row["fromAddress"] == ROWS[0]["fromAddress"]
+    ]
+    assert hashes == expected
+    assert all(query["pagination"]["limit"] == 2 for query in requests)
+
+
+def test_scan_rejects_pagination_offset() -> None:
+    requests: list[dict[str, Any]] = []
+    input = TransactionQueryInput(pagination=PaginationInput(limit=2, offset=4))
+
+    with pytest.raises(ValueError, match="after="):
+        scan(keyset_server(requests), input)
+    assert requests == []
+
+
+def test_cursor_needs_block_and_index() -> None:
+    item = QueryTransactionsTransactionsItems.model_validate(
+        transaction(0, blockNumber=None)
+    )
+
+    with pytest.raises(ValueError, match="blockNumber"):
+        TransactionCursor.of(item)
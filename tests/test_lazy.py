@@ -0,0 +1,70 @@
+import copy
+import pickle
+
+import pytest
+from gql_client import LazyView, lazy_view
+from gql_client.query_transactions import QueryTransactionsTransactionsItems
+from pydantic import ValidationError
+
+from tests.helpers import transaction
+
+LOG = {
+    "blockNumber": "100",
+    "txIndex": "0",
+    "logIndex": "0",
+    "txHash": "0x01",
+    "blockHash": "0x02",
+    "address": "0x03",
+    "topics": ["0x04"],
+    "data": "0x",
+    "removed": False,
+    "createdAt": "2024-01-01T00:00:00Z",
+}
+
+
+def view() -> LazyView[QueryTransactionsTransactionsItems]:
+    return LazyView(QueryTransactionsTransactionsItems, transaction(1, logs=[LOG]))
+
+
+def test_fields_validate_on_access() -> None:
+    item = view()
+
+    assert item.hash == transaction(1)["hash"]
+    assert isinstance(item.logs[0], LazyView)
+    assert item.logs[0].topics == ["0x04"]
+    assert item.to_model() == QueryTransactionsTransactionsItems.model_validate(
+        transaction(1, logs=[LOG])
+    )
+
+
+def test_invalid_field_is_reported_at_its_alias() -> None:
+    item = lazy_view(QueryTransactionsTransactionsItems, transaction(1, success="x"))
+
+    assert item.hash == transaction(1)["hash"]
+    with pytest.raises(ValidationError) as raised:
+        _ = item.success
+    assert raised.value.errors()[0]["loc"] == ("success",)
+
+
+@pytest.mark.parametrize(
+    "clone",
+    [copy.copy, copy.deepcopy, lambda item: pickle.loads(pickle.dumps(item))],  # noqa: S301
+)
+def test_copy_and_pickle(clone) -> None:
+    item = view()
+    _ = item.logs
+
+    cloned = clone(item)
+
+    assert cloned == item
+    assert cloned.logs[0].address == "0x03"
+    assert cloned.to_model() == item.to_model()
+
+
+def test_views_are_read_only() -> None:
+    item = view()
+
+    with pytest.raises(AttributeError, match="read-only"):
+        item.hash = "0x"
+    with pytest.raises(AttributeError):
+        _ = item._missing
@@ -0,0 +1,116 @@
+import asyncio
+import io
+import json
+from pathlib import Path
+from typing import Any
+
+import httpx
+from gql_client import Client
+from gql_client.async_base_client import MULTIPART_CHUNK_SIZE
+from gql_client.base_model import Upload
+from starlette.datastructures import UploadFile
+from starlette.requests import Request
+
+UPLOAD = (
+    "mutation upload($file: Upload!, $files: [Upload!]!)"
+    " { upload(file: $file, files: $files) }"
+)
+
+
+class Stream:
+    """Readable stream that cannot tell its size up front."""
+
+    def __init__(self, data: bytes) -> None:
+        self._data = io.BytesIO(data)
+
+    def read(self, size: int = -1) -> bytes:
+        return self._data.read(size)
+
+
+async def parse_form(headers: httpx.Headers, body: bytes) -> dict[str, Any]:
+    """The multipart body as a server parses it, files read into bytes."""
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "headers": [(k.encode(), v.encode()) for k, v in headers.items()],
+    }
+
+    async def receive() -> dict[str, Any]:
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    form = await Request(scope, receive).form()
+    fields: dict[str, Any] = {}
+    for key, value in form.multi_items():
+        if isinstance(value, UploadFile):
+            fields[key] = (value.filename, value.content_type, await value.read())
+        else:
+            fields[key] = json.loads(value)
+    return fields
+
+
+def send(variables: dict[str, Any]) -> tuple[httpx.Headers, bytes, dict[str, Any]]:
+    sent: list[tuple[httpx.Headers, bytes]] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        sent.append((request.headers, await request.aread()))
+        return httpx.Response(200, json={"data": {"upload": True}})
+
+    async def main() -> dict[str, Any]:
+        http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        client = Client(url="http://test/graphql", http_client=http)
+        await client.execute(UPLOAD, "upload", variables)
+        headers, body = sent[0]
+        return await parse_form(headers, body)
+
+    form = asyncio.run(main())
+    headers, body = sent[0]
+    return headers, body, form
+
+
+def test_repeated_and_file_uploads_round_trip(tmp_path: Path) -> None:
+    small = Upload("a.txt", io.BytesIO(b"alpha"), "text/plain")
+    large_data = bytes(range(256)) * (3 * MULTIPART_CHUNK_SIZE // 256 + 7)
+    (tmp_path / "large.bin").write_bytes(large_data)
+    with (tmp_path / "large.bin").open("rb") as large_file:
+        large = Upload("large.bin", large_file, "application/octet-stream")
+        headers, body, form = send({"file": small, "files": [large, small]})
+
+    assert int(headers["content-length"]) == len(body)
+    assert form["operations"]["variables"] == {"file": None, "files": [None, None]}
+    assert form["operations"]["operationName"] == "upload"
+    assert form["map"] == {
+        "0": ["variables.file", "variables.files.1"],
+        "1": ["variables.files.0"],
+    }
+    assert form["0"] == ("a.txt", "text/plain", b"alpha")
+    assert form["1"] == ("large.bin", "application/octet-stream", large_data)
+
+
+def test_uploads_start_at_the_current_position(tmp_path: Path) -> None:
+    (tmp_path / "data.bin").write_bytes(b"header:payload")
+    buffer = io.BytesIO(b"skip:rest")
+    buffer.seek(5)
+    with (tmp_path / "data.bin").open("rb") as file_:
+        file_.seek(7)
+        headers, body, form = send(
+            {
+                "file": Upload("data.bin", file_, "application/octet-stream"),
+                "files": [Upload("rest.txt", buffer, "text/plain")],
+            }
+        )
+
+    assert int(headers["content-length"]) == len(body)
+    assert form["0"][2] == b"payload"
+    assert form["1"][2] == b"rest"
+
+
+def test_streams_of_unknown_size_are_sent_chunked() -> None:
+    data = b"x" * (MULTIPART_CHUNK_SIZE + 10)
+    stream = Upload("s.bin", Stream(data), "application/octet-stream")
+
+    headers, body, form = send({"file": stream, "files": []})
+
+    assert "content-length" not in headers
+    assert headers["transfer-encoding"] == "chunked"
+    assert form["0"][2] == data
+    assert body.endswith(b"--\r\n")
@@ -0,0 +1,114 @@
+import random
+from typing import Any
+
+import pytest
+from gql_client.filters import compile_filter
+from gql_client.input_types import TransactionFilterInput
+from gql_client.normalize import (
+    UnsatisfiableFilter,
+    canonical_filter,
+    filter_key,
+    normalize_filter,
+)
+from gql_client.query_transactions import QueryTransactionsTransactionsItems
+
+from tests.helpers import nullable_transactions, random_filter
+
+ITEMS = [
+    QueryTransactionsTransactionsItems.model_validate(row)
+    for row in nullable_transactions(40)
+]
+
+
+def parse(data: dict[str, Any]) -> TransactionFilterInput:
+    return TransactionFilterInput.model_validate(data)
+
+
+def matches(filter_: TransactionFilterInput | None) -> list[bool]:
+    if filter_ is None:
+        return [True] * len(ITEMS)
+    return list(map(compile_filter(filter_), ITEMS))
+
+
+def normalized_matches(filter_: TransactionFilterInput) -> list[bool]:
+    try:
+        return matches(normalize_filter(filter_))
+    except UnsatisfiableFilter:
+        return [False] * len(ITEMS)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"toAddress": {"notIn": []}},
+        {"toAddress": {}},
+        {"blockNumber": {"gte": 105, "notIn": [99]}},
+        {"toAddress": {"isNull": False}, "and": [{"toAddress": {"notIn": []}}]},
+    ],
+)
+def test_dropped_operations_keep_rejecting_nulls(data: dict[str, Any]) -> None:
+    filter_ = parse(data)
+
+    assert normalize_filter(filter_) is not None
+    assert normalized_matches(filter_) == matches(filter_)
+
+
+def test_empty_operations_reduce_to_is_null_false() -> None:
+    normalized = normalize_filter(parse({"toAddress": {"notIn": []}}))
+
+    assert canonical_filter(normalized) == '{"toAddress":{"isNull":false}}'
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"toAddress": {"isNull": True, "notIn": []}},
+        {"toAddress": {"isNull": True}, "and": [{"toAddress": {}}]},
+        {"blockNumber": {"gt": 105, "lt": 106}},
+    ],
+)
+def test_unsatisfiable(data: dict[str, Any]) -> None:
+    with pytest.raises(UnsatisfiableFilter):
+        normalize_filter(parse(data))
+
+
+def test_split_operations_fold_back_in() -> None:
+    filter_ = parse(
+        {
+            "fromAddress": {"startsWith": "0x"},
+            "and": [{"fromAddress": {"contains": "a", "startsWith": "0xa"}}],
+        }
+    )
+    normalized = normalize_filter(filter_)
+
+    assert filter_key(normalized) == filter_key(filter_)
+    assert filter_key(
+        parse(
+            {
+                "toAddress": {"eq": "0x" + "0" * 39 + "3", "startsWith": "0x"},
+                "and": [{"toAddress": {"startsWith": "0x000"}}],
+            }
+        )
+    ) == filter_key(parse({"toAddress": {"eq": "0x" + "0" * 39 + "3"}}))
+
+
+def test_equivalent_filters_share_a_key() -> None:
+    first = parse(
+        {"and": [{"blockNumber": {"gt": 100}}, {"blockNumber": {"lte": 110}}]}
+    )
+    second = parse({"blockNumber": {"between": [101, 110]}})
+
+    assert filter_key(first) == filter_key(second)
+
+
+@pytest.mark.parametrize("seed", range(300))
+def test_normalize_is_idempotent_and_agrees_on_null_rows(seed: int) -> None:
+    filter_ = parse(random_filter(random.Random(seed), depth=3))
+    try:
+        normalized = normalize_filter(filter_)
+    except UnsatisfiableFilter:
+        assert not any(matches(filter_))
+        return
+
+    assert filter_key(normalize_filter(normalized)) == filter_key(normalized)
+    assert matches(normalized) == matches(filter_)
@@ -0,0 +1,49 @@
+import asyncio
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+from gql_client import OffloadDecoder
+from gql_client.query_transactions import QueryTransactions
+
+from tests.helpers import UPSTREAM_ROWS, transactions_page, webui_app
+
+
+def test_large_bodies_are_decoded_in_the_pool() -> None:
+    page = transactions_page(UPSTREAM_ROWS, False, len(UPSTREAM_ROWS))
+    body = json.dumps(page).encode()
+
+    async def main() -> list[QueryTransactions | None]:
+        with OffloadDecoder(threshold=1024, workers=1) as offload:
+            return [
+                await offload.decode(body, QueryTransactions),
+                await offload.decode(b"{}", QueryTransactions),
+                await offload.decode(
+                    b'{"errors": [{}]}' + b" " * 1024, QueryTransactions
+                ),
+            ]
+
+    large, small, failed = asyncio.run(main())
+
+    assert large == QueryTransactions.model_validate(page["data"])
+    assert small is None
+    assert failed is None
+
+
+def test_metrics_report_decode_counters(monkeypatch: pytest.MonkeyPatch) -> None:
+    app = webui_app(monkeypatch, DECODE_OFFLOAD_KB="1", DECODE_POOL="thread")
+    with TestClient(app) as client:
+        client.post("/api/run/query_transactions")
+        client.post("/api/run/query_metadata")
+        stats = client.get("/metrics").json()["decode"]
+
+    assert stats["offloaded"] == 1
+    assert stats["fallbacks"] == 0
+    assert stats["offloaded_bytes"] > 1024
+    assert stats["inline"] >= 1
+
+
+def test_metrics_without_offload(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = TestClient(webui_app(monkeypatch))
+
+    assert client.get("/metrics").json() == {"decode": None}
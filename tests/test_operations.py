@@ -0,0 +1,95 @@
+import pytest
+from gql_client.input_types import TransactionQueryInput
+
+from src.webui.services.operations import OperationsCatalog
+
+CATALOG = OperationsCatalog()
+
+
+def test_catalog_describes_client_methods() -> None:
+    operations = {operation.name: operation for operation in CATALOG.list_operations()}
+    send = {
+        param.name: param
+        for param in operations["mutation_send_raw_transaction"].params
+    }
+
+    assert operations["query_transactions"].iterator == "iter_transactions"
+    assert operations["query_metadata"].iterator is None
+    assert operations["mutation_send_raw_transaction"].kind == "mutation"
+    assert operations["query_transactions"].params[0].input_type == "textarea"
+    assert send["nonce"].input_type == "number"
+    assert send["signed_tx"].input_type == "textarea"
+    assert not send["signed_tx"].required
+    assert operations["query_web_3_sha_3"].params[0].required
+    with pytest.raises(KeyError, match="Unknown operation: query_nothing"):
+        CATALOG.decoder("query_nothing")
+
+
+def test_dotted_form_fields_build_nested_inputs() -> None:
+    decoder = CATALOG.decoder("query_transactions")
+
+    kwargs = decoder.decode_form(
+        {
+            "input.pagination.limit": "5",
+            "input.pagination.offset": " 10 ",
+            "input.filters": "",
+            "other": "ignored",
+        }
+    )
+
+    assert isinstance(kwargs["input"], TransactionQueryInput)
+    assert kwargs["input"].pagination.limit == 5
+    assert kwargs["input"].pagination.offset == 10
+    assert kwargs["input"].filters is None
+
+
+def test_json_form_fields_and_json_arguments_agree() -> None:
+    decoder = CATALOG.decoder("query_transactions")
+
+    from_form = decoder.decode_form(
+        {"input": '{"pagination": {"offset": 0, "limit": 5}}'}
+    )
+    from_json = decoder.decode({"input": {"pagination": {"limit": 5, "offset": 0}}})
+
+    assert decoder.key(from_form) == decoder.key(from_json)
+    assert decoder.key(from_form) != decoder.key(decoder.decode({}))
+
+
+@pytest.mark.parametrize(
+    ("name", "fields", "error"),
+    [
+        ("query_transactions", {"input": "{oops"}, "input: invalid JSON"),
+        (
+            "query_transactions",
+            {"input": "[]", "input.pagination.limit": "1"},
+            "input is given both as a value and by field",
+        ),
+        ("query_transactions", {"input.pagination.limit": "x"}, "input.pagination"),
+        ("query_web_3_sha_3", {"message": "  "}, "message is required"),
+        ("mutation_send_raw_transaction", {"nonce": "one"}, "nonce"),
+    ],
+)
+def test_invalid_forms_name_the_field(
+    name: str, fields: dict[str, str], error: str
+) -> None:
+    with pytest.raises(ValueError, match=error):
+        CATALOG.decoder(name).decode_form(fields)
+
+
+def test_padded_form_values_share_a_cache_key() -> None:
+    decoder = CATALOG.decoder("mutation_send_raw_transaction")
+
+    keys = {
+        decoder.key(decoder.decode_form({"nonce": nonce, "gas": "1"}))
+        for nonce in ("7", " 7", "7 ")
+    }
+
+    assert len(keys) == 1
+
+
+def test_models_are_built_once() -> None:
+    catalog = OperationsCatalog()
+
+    catalog.build_models()
+
+    assert catalog.build_models() == 0
@@ -0,0 +1,47 @@
+import asyncio
+from typing import Any
+
+from gql_client import Client
+
+from tests.helpers import graphql_client, transaction, transactions_page
+
+ROWS = [transaction(i) for i in range(10)]
+
+
+def capped_server(cap: int, requested: list[tuple[int, int]]) -> Client:
+    def respond(body: dict[str, Any]) -> dict[str, Any]:
+        page = body["variables"]["input"]["pagination"]
+        requested.append((page["offset"], page["limit"]))
+        end = page["offset"] + min(page["limit"], cap)
+        return transactions_page(ROWS[page["offset"] : end], end < len(ROWS), len(ROWS))
+
+    return Client(url="http://test/graphql", http_client=graphql_client(respond))
+
+
+def fetch_hashes(client: Client, **kwargs: Any) -> list[str]:
+    async def main() -> list[str]:
+        items = await client.fetch_all_transactions(**kwargs)
+        return [item.hash for item in items]
+
+    return asyncio.run(main())
+
+
+def test_all_rows_when_server_caps_limit() -> None:
+    requested: list[tuple[int, int]] = []
+    client = capped_server(3, requested)
+
+    hashes = fetch_hashes(client, page_size=4, prefetch=3)
+
+    assert hashes == [row["hash"] for row in ROWS]
+    assert requested[0] == (0, 4)
+    assert (3, 3) in requested
+
+
+def test_uncapped_pages_use_requested_size() -> None:
+    requested: list[tuple[int, int]] = []
+    client = capped_server(100, requested)
+
+    hashes = fetch_hashes(client, page_size=4, limit=7)
+
+    assert hashes == [row["hash"] for row in ROWS[:7]]
+    assert sorted(requested) == [(0, 4), (4, 4)]
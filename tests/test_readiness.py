@@ -0,0 +1,106 @@
+import asyncio
+import time
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.webui.services.readiness import Readiness
+from tests.helpers import upstream, webui_app
+
+
+def test_probe_result_is_cached_for_ttl() -> None:
+    probes = 0
+
+    async def probe() -> None:
+        nonlocal probes
+        probes += 1
+        await asyncio.sleep(0.01)
+
+    async def main() -> list[tuple[bool, dict[str, Any]]]:
+        readiness = Readiness(probe, ttl=60)
+        warming = await readiness.check()
+        readiness.warmed_up = True
+        return [warming, *await asyncio.gather(*(readiness.check() for _ in range(5)))]
+
+    warming, *ready = asyncio.run(main())
+
+    assert warming == (False, {"status": "warming up"})
+    assert ready == [(True, {"status": "ready"})] * 5
+    assert probes == 1
+
+
+@pytest.mark.parametrize(
+    ("delay", "error"),
+    [(0.0, "upstream refused"), (1.0, "Probe timed out after 0.05s")],
+)
+def test_failed_probes_report_the_error(delay: float, error: str) -> None:
+    async def probe() -> None:
+        await asyncio.sleep(delay)
+        raise ConnectionError("upstream refused")
+
+    async def main() -> tuple[bool, dict[str, Any]]:
+        readiness = Readiness(probe, ttl=0, timeout=0.05)
+        readiness.warmed_up = True
+        return await readiness.check()
+
+    assert asyncio.run(main()) == (
+        False,
+        {"status": "upstream unavailable", "error": error},
+    )
+
+
+def wait_until_warm(client: TestClient) -> None:
+    deadline = time.monotonic() + 5
+    while not client.app.state.readiness.warmed_up:
+        assert time.monotonic() < deadline, "warm-up did not finish"
+        time.sleep(0.01)
+
+
+def test_ready_after_warm_up(monkeypatch: pytest.MonkeyPatch) -> None:
+    probes = 0
+
+    def respond(body: dict[str, Any]) -> dict[str, Any]:
+        nonlocal probes
+        probes += 1
+        return upstream(body)
+
+    app = webui_app(monkeypatch, respond, WARMUP_CONNECTIONS="3")
+    with TestClient(app) as client:
+        wait_until_warm(client)
+        ready = client.get("/ready")
+
+    assert ready.status_code == 200
+    assert ready.json() == {"status": "ready"}
+    # Three warm-up connections, then one readiness probe.
+    assert probes == 4
+
+
+def test_unreachable_upstream_is_not_ready(monkeypatch: pytest.MonkeyPatch) -> None:
+    def respond(body: dict[str, Any]) -> dict[str, Any]:
+        return {"errors": [{"message": "node is syncing"}]}
+
+    with TestClient(webui_app(monkeypatch, respond)) as client:
+        wait_until_warm(client)
+        ready = client.get("/ready")
+
+    assert ready.status_code == 503
+    assert ready.json()["status"] == "upstream unavailable"
+    assert "node is syncing" in ready.json()["error"]
+
+
+def test_failed_warm_up_keeps_the_app_out_of_rotation(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    app = webui_app(monkeypatch)
+
+    async def broken(connections: int) -> None:
+        raise RuntimeError("no models")
+
+    monkeypatch.setattr(app.state.runner, "warm_up", broken)
+    with TestClient(app) as client:
+        time.sleep(0.05)
+        ready = client.get("/ready")
+
+    assert ready.status_code == 503
+    assert ready.json() == {"status": "warming up"}
@@ -0,0 +1,56 @@
+import sqlite3
+import time
+from pathlib import Path
+
+from gql_client import SharedResponseCache
+
+
+def test_lease_is_exclusive_until_released(tmp_path: Path) -> None:
+    path = tmp_path / "cache.db"
+    with SharedResponseCache(path) as first, SharedResponseCache(path) as second:
+        token = first.claim("key", 10)
+
+        assert token is not None
+        assert second.claim("key", 10) is None
+        first.release("key", token)
+        assert second.claim("key", 10) is not None
+
+
+def test_release_leaves_a_lease_taken_over_after_expiry(tmp_path: Path) -> None:
+    path = tmp_path / "cache.db"
+    with SharedResponseCache(path) as first, SharedResponseCache(path) as second:
+        stale = first.claim("key", 0.01)
+        time.sleep(0.02)
+        current = second.claim("key", 10)
+        assert stale is not None and current is not None
+
+        first.release("key", stale)
+
+        assert first.claim("key", 10) is None
+        second.release("key", current)
+        assert first.claim("key", 10) is not None
+
+
+def test_entries_expire_and_evict_oldest(tmp_path: Path) -> None:
+    with SharedResponseCache(tmp_path / "cache.db", max_bytes=8) as cache:
+        cache.set("old", b"12345")
+        cache.set("new", b"6789")
+        cache.set("gone", b"x", ttl=0)
+
+        assert cache.get("old") is None
+        assert cache.get("gone") is None
+        cached = cache.get("new")
+        assert cached is not None and cached.body == b"6789"
+
+
+def test_leases_table_without_owner_is_replaced(tmp_path: Path) -> None:
+    path = tmp_path / "cache.db"
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE leases (key TEXT PRIMARY KEY, expires_at REAL)")
+        conn.execute("INSERT INTO leases VALUES ('key', 1e12)")
+    conn.close()
+
+    with SharedResponseCache(path) as cache:
+        token = cache.claim("key", 10)
+        assert token is not None
+        cache.release("key", token)
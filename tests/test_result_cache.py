@@ -0,0 +1,102 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+from gql_client import SharedResponseCache
+
+from src.webui.services import result_cache
+from src.webui.services.result_cache import ResultCache, compute_etag, etag_matches
+
+
+def test_concurrent_misses_share_one_load() -> None:
+    calls = 0
+
+    async def load() -> dict[str, int]:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"value": calls}
+
+    async def main() -> list[dict[str, int]]:
+        cache = ResultCache(ttl=60, stale_ttl=60)
+        entries = await asyncio.gather(*(cache.get("key", load) for _ in range(5)))
+        return [entry.payload for entry in entries]
+
+    assert asyncio.run(main()) == [{"value": 1}] * 5
+    assert calls == 1
+
+
+def test_stale_entry_is_served_while_refreshing() -> None:
+    async def main() -> tuple[int, int, int]:
+        values = iter(range(10))
+        cache = ResultCache(ttl=0, stale_ttl=60)
+
+        async def load() -> int:
+            return next(values)
+
+        first = await cache.get("key", load)
+        stale = await cache.get("key", load)
+        await asyncio.sleep(0)
+        refreshed = cache._entries["key"]
+        return first.payload, stale.payload, refreshed.payload
+
+    assert asyncio.run(main()) == (0, 0, 1)
+
+
+def test_workers_share_results_through_the_shared_cache(tmp_path: Path) -> None:
+    path = tmp_path / "shared.db"
+    calls = 0
+
+    async def load() -> list[int]:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return [1, 2, 3]
+
+    async def main() -> list[list[int]]:
+        with SharedResponseCache(path) as one, SharedResponseCache(path) as two:
+            workers = [
+                ResultCache(ttl=60, stale_ttl=0, shared=one),
+                ResultCache(ttl=60, stale_ttl=0, shared=two),
+            ]
+            entries = await asyncio.gather(
+                *(worker.get("key", load) for worker in workers)
+            )
+            assert one.claim("key", 1) is not None
+        return [entry.payload for entry in entries]
+
+    assert asyncio.run(main()) == [[1, 2, 3], [1, 2, 3]]
+    assert calls == 1
+
+
+def test_wait_past_deadline_keeps_the_other_workers_lease(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(result_cache, "SHARED_LEASE", 0.05)
+    monkeypatch.setattr(result_cache, "SHARED_POLL", 0.01)
+    path = tmp_path / "shared.db"
+
+    async def load() -> str:
+        return "loaded"
+
+    async def main() -> str:
+        with SharedResponseCache(path) as other, SharedResponseCache(path) as own:
+            # A long lease held by a stuck worker outlives this worker's wait.
+            token = other.claim("key", 60)
+            entry = await ResultCache(ttl=60, stale_ttl=0, shared=own).get("key", load)
+            assert own.claim("key", 60) is None
+            assert token is not None
+            other.release("key", token)
+            assert own.claim("key", 60) is not None
+        return entry.payload
+
+    assert asyncio.run(main()) == "loaded"
+
+
+def test_etags() -> None:
+    etag = compute_etag({"b": 1, "a": 2})
+
+    assert etag == compute_etag({"a": 2, "b": 1})
+    assert etag_matches(f'W/"other", {etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches(None, etag)
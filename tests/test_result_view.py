@@ -0,0 +1,95 @@
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.webui.services.result_view import (
+    buffered,
+    items_page,
+    iter_json,
+    split_payload,
+    truncate_hex,
+)
+from tests.helpers import UPSTREAM_ROWS, webui_app
+
+
+def test_long_hex_is_shortened_for_display() -> None:
+    payload = {"input": "0x" + "ab" * 100, "hash": "0x12", "text": "x" * 100}
+
+    shown = truncate_hex(payload, limit=30)
+
+    assert shown["input"] == "0xababababab...[90 bytes]...ababababab"
+    assert shown["hash"] == "0x12"
+    assert shown["text"] == "x" * 100
+
+
+def test_long_lists_are_split_into_pages() -> None:
+    payload = {"result": {"items": list(range(30)), "total": 30}, "few": [1, 2]}
+
+    summary, pages = split_payload(payload, size=10)
+
+    assert "[30 items, listed below]" in summary
+    assert '"few": [\n    1,' in summary
+    [page] = pages
+    assert (page.path, page.total, page.offset, page.next_offset) == (
+        "result.items",
+        30,
+        0,
+        10,
+    )
+    assert page.items == [str(i) for i in range(10)]
+
+
+def test_last_page_has_no_next_offset() -> None:
+    page = items_page({"a": {"b": list(range(12))}}, "a.b", offset=10, size=5)
+
+    assert page.items == ["10", "11"]
+    assert page.next_offset is None
+    with pytest.raises(KeyError):
+        items_page({"a": {"b": 1}}, "a.b")
+    with pytest.raises(KeyError):
+        items_page({"a": {}}, "a.c")
+
+
+def test_chunks_are_joined_into_blocks() -> None:
+    blocks = list(buffered(["ab", "cd", "e"], size=4))
+
+    assert blocks == [b"abcd", b"e"]
+    assert json.loads(b"".join(iter_json({"n": list(range(5))}))) == {
+        "n": [0, 1, 2, 3, 4]
+    }
+
+
+def test_large_results_are_paged_and_downloadable(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    client = TestClient(webui_app(monkeypatch))
+
+    first = client.get("/run/query_transactions")
+    more = client.get(
+        "/run/query_transactions/items?_path=transactions.items&_offset=50"
+    )
+    download = client.get("/run/query_transactions/download")
+
+    assert "[60 items, listed below]" in first.text
+    assert UPSTREAM_ROWS[24]["hash"] in first.text
+    assert UPSTREAM_ROWS[25]["hash"] not in first.text
+    assert "_offset=25" in first.text
+    assert UPSTREAM_ROWS[59]["hash"] in more.text
+    assert UPSTREAM_ROWS[49]["hash"] not in more.text
+    assert "Load more" not in more.text
+    assert download.headers["content-disposition"] == (
+        'attachment; filename="query_transactions.json"'
+    )
+    assert len(download.json()["transactions"]["items"]) == 60
+
+
+def test_missing_pages_and_unknown_downloads(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = TestClient(webui_app(monkeypatch))
+
+    missing = client.get("/run/query_transactions/items?_path=transactions.nothing")
+    mutation = client.get("/run/mutation_send_raw_transaction/items?_path=x")
+
+    assert "No list at transactions.nothing" in missing.text
+    assert "Unknown query: mutation_send_raw_transaction" in mutation.text
+    assert client.get("/run/nothing/download").status_code == 404
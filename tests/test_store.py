@@ -0,0 +1,131 @@
+import asyncio
+import sqlite3
+from pathlib import Path
+from typing import Any
+
+from gql_client import Client, TransactionStore
+from gql_client.filters import compile_filter
+from gql_client.input_types import StringFilter, TransactionFilterInput
+from gql_client.query_transactions import QueryTransactionsTransactionsItems
+
+from tests.helpers import graphql_client, transaction, transactions_page
+
+
+class Chain:
+    """Server over a mutable list of rows, filtering like the real one."""
+
+    def __init__(self, rows: list[dict[str, Any]]) -> None:
+        self.rows = rows
+        self.requests: list[dict[str, Any]] = []
+        self.on_request = lambda: None
+
+    def respond(self, body: dict[str, Any]) -> dict[str, Any]:
+        self.on_request()
+        query = body["variables"]["input"]
+        self.requests.append(query)
+        match = compile_filter(
+            TransactionFilterInput.model_validate(query.get("filters") or {})
+        )
+        rows = [
+            row
+            for row in self.rows
+            if match(QueryTransactionsTransactionsItems.model_validate(row))
+        ]
+        limit = query["pagination"]["limit"]
+        return transactions_page(rows[:limit], len(rows) > limit, len(rows))
+
+    def client(self) -> Client:
+        return Client(
+            url="http://test/graphql", http_client=graphql_client(self.respond)
+        )
+
+
+def sync(store: TransactionStore, chain: Chain, **kwargs: Any) -> int:
+    return asyncio.run(store.sync(chain.client(), **kwargs))
+
+
+def test_sync_then_resume_from_watermark() -> None:
+    chain = Chain([transaction(i) for i in range(10)])
+    store = TransactionStore(confirmations=2)
+
+    assert sync(store, chain, page_size=4) == 10
+    assert store.watermark() == 104
+    assert [tx.hash for tx in store.transactions()] == [
+        row["hash"] for row in chain.rows
+    ]
+
+    chain.rows += [transaction(i) for i in range(10, 14)]
+    chain.requests.clear()
+    assert sync(store, chain) == 8
+    assert chain.requests[0]["filters"] == {"blockNumber": {"gte": 103}}
+    assert store.watermark() == 106
+    assert len(store.transactions()) == 14
+
+
+def test_reorganised_rows_are_dropped() -> None:
+    chain = Chain([transaction(i) for i in range(6)])
+    store = TransactionStore(confirmations=3)
+    sync(store, chain)
+
+    # Rows 4 and 5 sit inside the confirmation window: one disappears, the
+    # other comes back with a removed log.
+    dropped = chain.rows.pop(4)["hash"]
+    chain.rows[4] = transaction(5, logs=[log_row(5, removed=True)], logsCount="1")
+    sync(store, chain)
+
+    hashes = {tx.hash for tx in store.transactions()}
+    assert hashes == {row["hash"] for row in chain.rows[:4]}
+    assert dropped not in hashes
+
+
+def test_scopes_share_rows_and_filter_locally() -> None:
+    chain = Chain([transaction(i) for i in range(6)])
+    store = TransactionStore()
+    sender = TransactionFilterInput(
+        from_address=StringFilter(eq=chain.rows[0]["fromAddress"])
+    )
+
+    sync(store, chain)
+    sync(store, chain, filters=sender)
+
+    assert [tx.hash for tx in store.transactions(sender)] == [
+        chain.rows[0]["hash"],
+        chain.rows[3]["hash"],
+    ]
+    assert store.transactions(where=sender) == store.transactions(sender)
+    assert len(store.transactions(limit=2)) == 2
+
+
+def test_sync_holds_no_write_lock_while_paging(tmp_path: Path) -> None:
+    path = tmp_path / "store.db"
+    chain = Chain([transaction(i) for i in range(1200)])
+    store = TransactionStore(path)
+    writes: list[int] = []
+
+    def write_elsewhere() -> None:
+        with sqlite3.connect(path, timeout=0) as other:
+            other.execute(
+                "INSERT OR REPLACE INTO scopes VALUES ('other', '{}', ?)",
+                (len(writes),),
+            )
+        writes.append(len(chain.requests))
+
+    chain.on_request = write_elsewhere
+    assert sync(store, chain, page_size=300) == 1200
+    assert writes == [0, 1, 2, 3]
+    store.close()
+
+
+def log_row(index: int, removed: bool) -> dict[str, Any]:
+    return {
+        "blockNumber": str(100 + index // 2),
+        "txIndex": str(index % 2),
+        "logIndex": "0",
+        "txHash": f"0x{index:064x}",
+        "blockHash": f"0x{index // 2:064x}",
+        "address": f"0x{1:040x}",
+        "topics": [],
+        "data": "0x",
+        "removed": removed,
+        "createdAt": "2024-01-01T00:00:00Z",
+    }
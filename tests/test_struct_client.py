@@ -0,0 +1,21 @@
+from gen_struct_client import build_client_module, build_structs_module
+
+from tests.helpers import ROOT
+
+SOURCE = "gql_client/client.py"
+
+
+def test_structs_regenerate_byte_for_byte() -> None:
+    code, names = build_structs_module("gql_client", SOURCE)
+
+    assert code == (ROOT / "gql_client/structs.py").read_text(encoding="utf-8")
+    assert "TransactionQueryInput" in names
+    assert "QueryTransactionsTransactionsItems" in names
+
+
+def test_struct_client_regenerates_byte_for_byte() -> None:
+    code = build_client_module(ROOT / SOURCE, SOURCE)
+
+    assert code == (ROOT / "gql_client/struct_client.py").read_text(encoding="utf-8")
+    assert "class StructClient(AsyncStructBaseClient):" in code
+    assert "get_model" not in code
@@ -0,0 +1,52 @@
+import asyncio
+import concurrent.futures
+import threading
+
+import httpx
+import pytest
+from gql_client import SyncClient
+
+
+def test_close_cancels_calls_pending_in_other_threads() -> None:
+    started = threading.Event()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        started.set()
+        await asyncio.Event().wait()
+        raise AssertionError("unreachable")
+
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client = SyncClient(url="http://test/graphql", http_client=http_client)
+    errors: list[BaseException] = []
+
+    def call() -> None:
+        try:
+            client.execute("query { ping }")
+        except BaseException as exc:
+            errors.append(exc)
+
+    caller = threading.Thread(target=call)
+    caller.start()
+    assert started.wait(5)
+    client.close()
+    caller.join(5)
+
+    assert not caller.is_alive()
+    assert len(errors) == 1
+    assert isinstance(errors[0], concurrent.futures.CancelledError)
+    assert http_client.is_closed
+
+
+def test_close_without_calls_inside_running_loop() -> None:
+    http_client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200))
+    )
+    client = SyncClient(url="http://test/graphql", http_client=http_client)
+
+    async def main() -> None:
+        client.close()
+
+    asyncio.run(main())
+    assert http_client.is_closed
+    with pytest.raises(RuntimeError, match="closed"):
+        client.execute("query { ping }")
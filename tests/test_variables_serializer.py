@@ -0,0 +1,145 @@
+import asyncio
+import io
+import json
+from typing import Any, Optional, Union
+
+import httpx
+import pytest
+from gql_client import Client
+from gql_client.async_base_client import PreparedOperation, VariablesSerializer
+from gql_client.base_model import UNSET, BaseModel, UnsetType, Upload
+from gql_client.client import _MUTATION_SEND_RAW_TRANSACTION, _QUERY_TRANSACTIONS
+from gql_client.enums import SortDirection, TransactionOrderField
+from gql_client.input_types import (
+    PaginationInput,
+    StringFilter,
+    TransactionFilterInput,
+    TransactionOrderByInput,
+    TransactionQueryInput,
+)
+
+
+class AttachmentInput(BaseModel):
+    name: str
+    file: Upload
+
+
+ATTACH = PreparedOperation(
+    "mutation attach($file:Upload!$files:[Upload!]$input:AttachmentInput)"
+    "{attach(file:$file files:$files input:$input)}",
+    "attach",
+    # Annotated as generated clients spell them.
+    VariablesSerializer(
+        {
+            "file": Upload,
+            "files": Union[Optional[list[Upload]], UnsetType],  # noqa: UP007, UP045
+            "input": Union[Optional[AttachmentInput], UnsetType],  # noqa: UP007, UP045
+        }
+    ),
+)
+
+
+def upload() -> Upload:
+    return Upload("a.txt", io.BytesIO(b"alpha"), "text/plain")
+
+
+@pytest.mark.parametrize(
+    "variables",
+    [
+        {"file": upload(), "files": UNSET, "input": UNSET},
+        {"file": None, "files": [upload()], "input": UNSET},
+        {
+            "file": None,
+            "files": UNSET,
+            "input": AttachmentInput(name="a", file=upload()),
+        },
+    ],
+)
+def test_uploads_are_left_to_the_generic_path(variables: dict[str, Any]) -> None:
+    assert ATTACH.body(variables) is None
+
+
+def test_upload_calls_are_sent_as_multipart() -> None:
+    sent: list[httpx.Request] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await request.aread()
+        sent.append(request)
+        return httpx.Response(200, json={"data": {"attach": True}})
+
+    async def main() -> None:
+        http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        client = Client(url="http://test/graphql", http_client=http)
+        await client.execute(
+            ATTACH.query,
+            "attach",
+            {"file": upload(), "files": UNSET, "input": UNSET},
+            prepared=ATTACH,
+        )
+        await client.execute(
+            ATTACH.query,
+            "attach",
+            {"file": None, "files": UNSET, "input": UNSET},
+            prepared=ATTACH,
+        )
+
+    asyncio.run(main())
+
+    assert sent[0].headers["content-type"].startswith("multipart/form-data")
+    assert b"alpha" in sent[0].content
+    assert sent[1].headers["content-type"] == "application/json"
+    assert json.loads(sent[1].content)["variables"] == {"file": None}
+
+
+@pytest.mark.parametrize(
+    ("prepared", "variables"),
+    [
+        (_QUERY_TRANSACTIONS, {"input": UNSET}),
+        (_QUERY_TRANSACTIONS, {"input": None}),
+        (
+            _QUERY_TRANSACTIONS,
+            {
+                "input": TransactionQueryInput(
+                    filters=TransactionFilterInput(
+                        from_address=StringFilter(eq="0x1"),
+                        or_=[TransactionFilterInput(to_address=StringFilter(in_=[]))],
+                    ),
+                    pagination=PaginationInput(limit=5, offset=0),
+                    order_by=[
+                        TransactionOrderByInput(
+                            field=TransactionOrderField.BLOCK_NUMBER,
+                            direction=SortDirection.DESC,
+                        )
+                    ],
+                )
+            },
+        ),
+        (
+            _MUTATION_SEND_RAW_TRANSACTION,
+            {
+                "signedTx": UNSET,
+                "from": "0x1",
+                "to": None,
+                "value": UNSET,
+                "gas": "21000",
+                "gasPrice": UNSET,
+                "input": UNSET,
+                "nonce": 7,
+            },
+        ),
+    ],
+)
+def test_prepared_variables_match_the_generic_path(
+    prepared: PreparedOperation, variables: dict[str, Any]
+) -> None:
+    client = Client(url="http://test/graphql")
+    generic, _, _ = client._process_variables(variables)
+
+    body = prepared.body(variables)
+
+    assert body is not None
+    assert json.loads(body) == {
+        "query": prepared.query,
+        "operationName": prepared.operation_name,
+        "variables": json.loads(json.dumps(generic)),
+    }
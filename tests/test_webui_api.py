@@ -0,0 +1,91 @@
+import json
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+
+from tests.helpers import UPSTREAM, UPSTREAM_ROWS, upstream, webui_app
+
+
+def test_run_returns_the_result_as_json(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = TestClient(webui_app(monkeypatch))
+
+    result = client.post("/api/run/query_metadata")
+    sha = client.post("/api/run/query_web_3_sha_3", json={"message": "hi"})
+
+    assert result.status_code == 200
+    assert result.json() == UPSTREAM["query_metadata"]
+    assert sha.json() == UPSTREAM["query_web3Sha3"]
+
+
+@pytest.mark.parametrize(
+    ("path", "body", "status", "error"),
+    [
+        ("/api/run/query_nothing", {}, 404, "Unknown operation: query_nothing"),
+        ("/api/run/query_web_3_sha_3", [], 400, "Body must be a JSON object"),
+        ("/api/run/query_web_3_sha_3", {}, 400, "message is required"),
+        ("/api/run/query_metadata", {"x": 1}, 400, "Unknown argument: x"),
+    ],
+)
+def test_bad_requests_are_rejected(
+    monkeypatch: pytest.MonkeyPatch, path: str, body: Any, status: int, error: str
+) -> None:
+    client = TestClient(webui_app(monkeypatch))
+
+    result = client.post(path, json=body)
+
+    assert result.status_code == status
+    assert error in result.json()["error"]
+
+
+def test_upstream_errors_are_bad_gateway(monkeypatch: pytest.MonkeyPatch) -> None:
+    def respond(body: dict[str, Any]) -> dict[str, Any]:
+        return {"errors": [{"message": "upstream is down"}]}
+
+    client = TestClient(webui_app(monkeypatch, respond))
+
+    query = client.post("/api/run/query_usage_stat")
+    mutation = client.post("/api/run/mutation_send_raw_transaction")
+
+    assert (query.status_code, mutation.status_code) == (502, 502)
+    assert "upstream is down" in query.json()["error"]
+
+
+def test_paginated_items_stream_as_ndjson(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = TestClient(webui_app(monkeypatch))
+
+    result = client.post(
+        "/api/run/query_transactions?page_size=20&limit=45",
+        headers={"Accept": "application/x-ndjson"},
+    )
+
+    assert result.headers["content-type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in result.text.splitlines()]
+    assert [line["hash"] for line in lines] == [
+        row["hash"] for row in UPSTREAM_ROWS[:45]
+    ]
+
+
+def test_stream_failure_is_the_last_line(monkeypatch: pytest.MonkeyPatch) -> None:
+    def respond(body: dict[str, Any]) -> dict[str, Any]:
+        if body["variables"]["input"]["pagination"]["offset"] > 0:
+            return {"errors": [{"message": "page lost"}]}
+        return upstream(body)
+
+    client = TestClient(webui_app(monkeypatch, respond))
+
+    result = client.post("/api/run/query_transactions?format=ndjson&page_size=10")
+    lines = [json.loads(line) for line in result.text.splitlines()]
+
+    assert result.status_code == 200
+    assert len(lines) == 11
+    assert "page lost" in lines[-1]["error"]
+
+
+def test_only_paginated_operations_stream(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = TestClient(webui_app(monkeypatch))
+
+    result = client.post("/api/run/query_metadata?format=ndjson")
+
+    assert result.status_code == 400
+    assert result.json() == {"error": "query_metadata is not paginated"}
@@ -0,0 +1,97 @@
+from collections import Counter
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+
+from tests.helpers import upstream, webui_app
+
+
+def counting_client(
+    monkeypatch: pytest.MonkeyPatch, calls: Counter[str], **env: str
+) -> TestClient:
+    def respond(body: dict[str, Any]) -> dict[str, Any]:
+        calls[body["operationName"]] += 1
+        return upstream(body)
+
+    return TestClient(webui_app(monkeypatch, respond, **env))
+
+
+def test_index_lists_operations(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = counting_client(monkeypatch, Counter())
+
+    page = client.get("/")
+
+    assert page.status_code == 200
+    assert "query_metadata" in page.text
+    assert "http://graphql.test/test/graphql" in page.text
+    assert client.get("/health").json() == {"status": "ok"}
+
+
+def test_unchanged_query_result_is_revalidated(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: Counter[str] = Counter()
+    client = counting_client(monkeypatch, calls)
+
+    first = client.get("/run/query_metadata")
+    again = client.get(
+        "/run/query_metadata", headers={"If-None-Match": first.headers["etag"]}
+    )
+
+    assert first.status_code == 200
+    assert "anvil/v1" in first.text
+    assert first.headers["cache-control"] == "no-cache"
+    assert again.status_code == 304
+    assert again.headers["etag"] == first.headers["etag"]
+    assert calls["query_metadata"] == 1
+
+
+def test_equivalent_inputs_share_a_cached_result(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: Counter[str] = Counter()
+    client = counting_client(monkeypatch, calls)
+
+    first = client.post("/run/query_web_3_sha_3", data={"message": "hello"})
+    second = client.get("/run/query_web_3_sha_3?message=+hello+&_offset=3")
+
+    assert first.headers["etag"] == second.headers["etag"]
+    assert calls["query_web3Sha3"] == 1
+    client.post("/run/query_web_3_sha_3", data={"message": "bye"})
+    assert calls["query_web3Sha3"] == 2
+
+
+def test_mutations_are_not_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: Counter[str] = Counter()
+    client = counting_client(monkeypatch, calls)
+
+    for _ in range(2):
+        result = client.post(
+            "/run/mutation_send_raw_transaction", data={"signed_tx": "0x01"}
+        )
+        assert "cdcd" in result.text
+        assert "etag" not in result.headers
+    refused = client.get("/run/mutation_send_raw_transaction")
+
+    assert calls["mutation_sendRawTransaction"] == 2
+    assert "is not a query; use POST" in refused.text
+
+
+def test_upstream_errors_are_rendered_and_not_cached(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: Counter[str] = Counter()
+
+    def respond(body: dict[str, Any]) -> dict[str, Any]:
+        calls[body["operationName"]] += 1
+        return {"errors": [{"message": "upstream is down"}]}
+
+    client = TestClient(webui_app(monkeypatch, respond))
+
+    for _ in range(2):
+        result = client.get("/run/query_usage_stat")
+        assert result.status_code == 200
+        assert "upstream is down" in result.text
+        assert "etag" not in result.headers
+    assert calls["query_usageStat"] == 2